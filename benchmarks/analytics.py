@@ -0,0 +1,96 @@
+"""
+Скорость агрегатов статистики по большому журналу сессий.
+
+Генерирует журнал из N сессий (по умолчанию миллион) в формате
+SessionLog (с несколькими испорченными записями), отображает его через
+numpy.memmap и замеряет:
+- первую загрузку с проверкой всех контрольных сумм и сводкой;
+- повторную сводку через SessionLoader (проверяется только новый хвост,
+  битые записи пропускаются без копии) - так панель статистики
+  обновляется при каждом открытии;
+- одну сводку по уже загруженному массиву.
+Цель - меньше 50 мс на миллион сессий для повторного обновления.
+
+Запуск: python benchmarks/analytics.py [--sessions 1000000] [--repeat 10] [--corrupt 3]
+"""
+import argparse
+import os
+import sys
+import tempfile
+import time
+import zlib
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import numpy as np
+
+from src.core import analytics
+from src.core.history.log import HEADER, MAGIC, VERSION, RECORD_SIZE
+
+
+def write_log(path, count, seed, corrupt=0):
+    """
+    Пишет синтетический журнал сразу массивом, без SessionLog.append;
+    у corrupt случайных записей портится байт данных.
+    """
+    rng = np.random.default_rng(seed)
+    records = np.zeros(count, dtype=analytics.SESSION_DTYPE)
+    records["start"] = 1.0e9 + np.sort(rng.uniform(0, count * 7200, count))
+    records["planned"] = 1500
+    records["actual"] = rng.integers(60, 1501, count)
+    records["end"] = records["start"] + records["actual"]
+    records["pauses"] = rng.poisson(0.7, count)
+    records["mode"] = np.arange(count) % 2 == 0
+    records["flags"] = rng.random(count) < 0.8
+    data = bytearray(records.tobytes())
+    payload = RECORD_SIZE - 4
+    for offset in range(0, len(data), RECORD_SIZE):
+        data[offset + payload:offset + RECORD_SIZE] = zlib.crc32(data[offset:offset + payload]).to_bytes(4, "little")
+    for index in rng.choice(count, size=min(corrupt, count), replace=False):
+        data[index * RECORD_SIZE + 16] ^= 0xFF
+    with open(path, "wb") as f:
+        f.write(HEADER.pack(MAGIC, VERSION, RECORD_SIZE))
+        f.write(data)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--sessions", type=int, default=1000000)
+    parser.add_argument("--repeat", type=int, default=10)
+    parser.add_argument("--seed", type=int, default=1)
+    parser.add_argument("--corrupt", type=int, default=3, help="сколько записей испортить")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "history.log")
+        write_log(path, args.sessions, args.seed, args.corrupt)
+
+        # Первая загрузка: таблицы crc и проверка всего журнала
+        loader = analytics.SessionLoader(path)
+        t0 = time.perf_counter()
+        loader.summary()
+        cold = time.perf_counter() - t0
+        sessions = loader.load()
+        loaded = len(sessions)
+
+        warm = only = float("inf")
+        for _ in range(args.repeat):
+            t0 = time.perf_counter()
+            stats = loader.summary()
+            t1 = time.perf_counter()
+            analytics.summary(sessions)
+            t2 = time.perf_counter()
+            warm = min(warm, t1 - t0)
+            only = min(only, t2 - t1)
+        del sessions
+
+        print(f"sessions:         {args.sessions} ({args.sessions - loaded} dropped by crc)")
+        print(f"first load:       {cold * 1e3:.1f} ms")
+        print(f"refresh (best):   {warm * 1e3:.1f} ms")
+        print(f"summary (best):   {only * 1e3:.1f} ms")
+        print(f"longest streak:   {stats['longest_streak']} days")
+        print(f"completion ratio: {stats['completion_ratio']:.2f}")
+
+
+if __name__ == "__main__":
+    main()
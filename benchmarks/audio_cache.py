@@ -0,0 +1,117 @@
+"""
+Локальная звуковая подсистема: генератор шума, кольцевой кэш и повтор при обрыве.
+
+1. Скорость NoiseGenerator по цветам относительно реального времени.
+2. Запись/чтение RingBuffer и вытеснение LRU в AudioCache.
+3. Обрыв сети: LocalAudioServer проксирует /flaky/ из
+   benchmarks/stream_server.py (поток живет FLAKY_UP секунд, затем
+   FLAKY_DOWN секунд недоступен). Клиент читает поток и меряет самую
+   длинную паузу в данных - без кэша и с кэшем.
+
+Запуск: python benchmarks/audio_cache.py [--seconds 12]
+"""
+import argparse
+import os
+import socket
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from stream_server import FLAKY_DOWN, FLAKY_UP, start_in_thread
+
+from src.core.audio_cache import AudioCache, RingBuffer
+from src.core.audio_server import LocalAudioServer
+from src.core.noise import NOISE_COLORS, SAMPLE_RATE, NoiseGenerator
+
+
+def bench_noise(blocks=500):
+    for color in NOISE_COLORS:
+        generator = NoiseGenerator(color, seed=1)
+        t0 = time.perf_counter()
+        for _ in range(blocks):
+            generator.next_pcm()
+        elapsed = time.perf_counter() - t0
+        audio = blocks * generator.block_size / SAMPLE_RATE
+        print(f"noise {color:5s}: {elapsed / blocks * 1e3:6.3f} ms/block, {audio / elapsed:7.0f}x realtime")
+
+
+def bench_ring(directory):
+    ring = RingBuffer(os.path.join(directory, "bench.ring"), 4 * 1024 * 1024)
+    chunk = os.urandom(16 * 1024)
+    t0 = time.perf_counter()
+    for _ in range(4096):  # 64 МБ через кольцо в 4 МБ
+        ring.write(chunk)
+    write = time.perf_counter() - t0
+    t0 = time.perf_counter()
+    for i in range(4096):
+        ring.read(ring.start + (i * 1000) % (ring.capacity - len(chunk)), len(chunk))
+    read = time.perf_counter() - t0
+    assert ring.tail(len(chunk)) == chunk
+    ring.close()
+    print(f"ring write: {64 / write:7.0f} MB/s, read: {64 / read:7.0f} MB/s")
+
+    cache = AudioCache(os.path.join(directory, "lru"), ring_size=1024 * 1024, max_bytes=4 * 1024 * 1024)
+    for i in range(10):
+        cache.ring(f"station-{i}").write(b"x" * 1000)
+    cache.ring("station-7")  # недавнее использование защищает от вытеснения
+    cache.ring("station-10").write(b"x" * 1000)
+    kept = sorted(int(s.split("-")[1]) for s in (f"station-{i}" for i in range(11)) if cache.has(s))
+    cache.close()
+    print(f"lru: 11 stations into 4 rings, evictions={cache.evictions}, kept={kept}")
+
+
+def longest_gap(url, seconds):
+    parts = url.split("/", 3)
+    host, port = parts[2].split(":")
+    gaps = []
+    received = 0
+    with socket.create_connection((host, int(port))) as sock:
+        sock.sendall(f"GET /{parts[3]} HTTP/1.0\r\n\r\n".encode())
+        sock.settimeout(0.2)
+        deadline = time.perf_counter() + seconds
+        last = time.perf_counter()
+        while time.perf_counter() < deadline:
+            try:
+                chunk = sock.recv(65536)
+            except socket.timeout:
+                continue
+            if not chunk:
+                break
+            now = time.perf_counter()
+            gaps.append(now - last)
+            last = now
+            received += len(chunk)
+        gaps.append(time.perf_counter() - last)
+    return max(gaps), received
+
+
+def bench_outage(directory, seconds):
+    base = start_in_thread()
+    print(f"outage: stream up {FLAKY_UP:.0f} s, down {FLAKY_DOWN:.0f} s, reading {seconds:.0f} s")
+    for label, cache in (("no cache", None), ("ring cache", AudioCache(os.path.join(directory, "audio")))):
+        server = LocalAudioServer(cache, reconnect_delay=0.5)
+        url = server.station_url(f"bench-{label}", f"{base}/flaky/{label.replace(' ', '-')}")
+        gap, received = longest_gap(url, seconds)
+        server.stop()
+        print(f"  {label:10s}: longest gap {gap * 1000:7.0f} ms, received {received / 1024:6.0f} KB, "
+              f"replayed {server.replayed_seconds:4.1f} s from cache")
+        if cache is not None:
+            cache.close()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--seconds", type=float, default=12.0)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as directory:
+        bench_noise()
+        bench_ring(directory)
+        bench_outage(directory, args.seconds)
+
+
+if __name__ == "__main__":
+    main()
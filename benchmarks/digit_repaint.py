@@ -0,0 +1,82 @@
+"""
+Посекундное обновление таймера: QLabel против DigitDisplay.
+
+Считает, сколько пикселей метки перерисовывается на каждом тике и
+сколько длится обработка тика (смена текста и отрисовка окна).
+
+Запуск: python benchmarks/digit_repaint.py [--ticks 300]
+"""
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+from PySide6.QtWidgets import QApplication, QLabel
+from PySide6.QtCore import QObject, QEvent, Qt
+
+from src.ui.main_window import MainWindow
+
+
+class PaintCounter(QObject):
+    """Считает площадь областей перерисовки виджета."""
+
+    def __init__(self):
+        super().__init__()
+        self.pixels = 0
+
+    def eventFilter(self, obj, event):
+        if event.type() == QEvent.Paint:
+            self.pixels += sum(rect.width() * rect.height() for rect in event.region())
+        return False
+
+
+def run(app, use_label, ticks):
+    window = MainWindow()
+    timer_widget = window.timer_widget
+    if use_label:
+        # Возвращаем прежнюю метку на место DigitDisplay
+        old = timer_widget.timer_label
+        label = QLabel(old.text())
+        label.setObjectName("timerLabel")
+        label.setAlignment(Qt.AlignCenter)
+        timer_widget.layout().replaceWidget(old, label)
+        old.deleteLater()
+        timer_widget.timer_label = label
+
+    counter = PaintCounter()
+    timer_widget.timer_label.installEventFilter(counter)
+    window.show()
+    app.processEvents()
+    counter.pixels = 0
+
+    timings = []
+    for i in range(ticks):
+        t0 = time.perf_counter()
+        timer_widget.update_time(window.timer.format_time(1500 - i))
+        app.processEvents()
+        timings.append(time.perf_counter() - t0)
+
+    window.hide()
+    window.deleteLater()
+    app.processEvents()
+    timings.sort()
+    return counter.pixels / ticks, timings[len(timings) // 2], timings[int(len(timings) * 0.95)]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--ticks", type=int, default=300)
+    args = parser.parse_args()
+
+    app = QApplication.instance() or QApplication(sys.argv)
+    print(f"{'widget':>13} {'px/tick':>9} {'p50, ms':>9} {'p95, ms':>9}")
+    for name, use_label in (("QLabel", True), ("DigitDisplay", False)):
+        pixels, p50, p95 = run(app, use_label, args.ticks)
+        print(f"{name:>13} {pixels:>9.0f} {p50 * 1e3:>9.3f} {p95 * 1e3:>9.3f}")
+
+
+if __name__ == "__main__":
+    main()
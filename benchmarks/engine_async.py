@@ -0,0 +1,74 @@
+"""
+Сколько одновременных таймеров тянет один цикл asyncio.
+
+Запускает N движков TimerEngine с короткими сессиями на одном цикле,
+ждет, пока все завершатся, и печатает процессорное время, число тиков
+и опоздание пробуждений относительно границы секунды.
+
+Запуск: python benchmarks/engine_async.py [--timers 100 1000 10000] [--seconds 3]
+"""
+import argparse
+import asyncio
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.core.engine import TimerEngine
+from src.core.drivers import AsyncTimerDriver
+
+
+async def drive(count, seconds):
+    loop = asyncio.get_running_loop()
+    done = loop.create_future()
+    left = [count]
+    ticks = [0]
+    lateness = []
+
+    def on_finished():
+        left[0] -= 1
+        if left[0] == 0 and not done.done():
+            done.set_result(None)
+
+    drivers = []
+    for _ in range(count):
+        engine = TimerEngine(seconds, seconds)
+        engine.timer_finished.connect(on_finished)
+
+        def on_time(value, engine=engine):
+            ticks[0] += 1
+            # Насколько поздно мы заметили смену секунды
+            lateness.append(value - engine.remaining())
+
+        engine.time_updated.connect(on_time)
+        drivers.append(AsyncTimerDriver(engine, loop))
+        engine.start()
+
+    cpu_start = time.process_time()
+    await done
+    cpu = time.process_time() - cpu_start
+
+    for driver in drivers:
+        driver.close()
+
+    lateness.sort()
+    p50 = lateness[len(lateness) // 2] * 1000
+    p99 = lateness[int(len(lateness) * 0.99)] * 1000
+    return cpu, ticks[0], p50, p99
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--timers", type=int, nargs="+", default=[100, 1000, 10000])
+    parser.add_argument("--seconds", type=int, default=3)
+    args = parser.parse_args()
+
+    print(f"{'timers':>8} {'cpu, s':>8} {'ticks':>8} {'late p50, ms':>13} {'late p99, ms':>13}")
+    for count in args.timers:
+        cpu, ticks, p50, p99 = asyncio.run(drive(count, args.seconds))
+        print(f"{count:>8} {cpu:>8.3f} {ticks:>8} {p50:>13.2f} {p99:>13.2f}")
+
+
+if __name__ == "__main__":
+    main()
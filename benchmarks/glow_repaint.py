@@ -0,0 +1,59 @@
+"""
+Стоимость посекундной перерисовки при разных режимах свечения.
+
+Для каждого режима EffectManager ("effect" - QGraphicsDropShadowEffect,
+"pixmap" - кэшированная картинка) и без свечения обновляет метку
+таймера и синхронно перерисовывает окно, как это происходит на тике.
+
+Запуск: python benchmarks/glow_repaint.py [--ticks 200]
+"""
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+from PySide6.QtWidgets import QApplication
+
+from src.ui.effects import EffectManager
+from src.ui.main_window import MainWindow
+
+
+def measure(app, window, ticks):
+    timings = []
+    for i in range(ticks):
+        t0 = time.perf_counter()
+        window.timer_widget.update_time(window.timer.format_time(1500 - i))
+        window.repaint()
+        timings.append(time.perf_counter() - t0)
+    timings.sort()
+    return timings[len(timings) // 2], timings[int(len(timings) * 0.95)]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--ticks", type=int, default=200)
+    args = parser.parse_args()
+
+    app = QApplication.instance() or QApplication(sys.argv)
+
+    print(f"{'mode':>8} {'p50, ms':>9} {'p95, ms':>9}")
+    for mode in ("none", EffectManager.MODE_EFFECT, EffectManager.MODE_PIXMAP):
+        window = MainWindow()
+        if mode != "none":
+            window.effects.mode = mode
+            window.add_neon_glow_effect(window.centralWidget(), "#FF6B6B", 25)
+        window.show()
+        app.processEvents()
+
+        p50, p95 = measure(app, window, args.ticks)
+        print(f"{mode:>8} {p50 * 1e3:>9.3f} {p95 * 1e3:>9.3f}")
+        window.hide()
+        window.deleteLater()
+        app.processEvents()
+
+
+if __name__ == "__main__":
+    main()
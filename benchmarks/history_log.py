@@ -0,0 +1,67 @@
+"""
+Журнал сессий: скорость дозаписи, выборки за период и восстановления.
+
+Пишет N сессий (по умолчанию миллион, ~12 в день на протяжении многих
+лет), печатает p50/p99 времени append, время выборки за неделю через
+индекс и время открытия журнала с оборванной последней записью.
+
+Запуск: python benchmarks/history_log.py [--sessions 1000000]
+"""
+import argparse
+import os
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.core.history import SessionLog, MODE_WORK, MODE_BREAK, FLAG_COMPLETED
+
+
+def percentile(values, q):
+    values = sorted(values)
+    return values[min(len(values) - 1, int(len(values) * q))]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--sessions", type=int, default=1000000)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "history.log")
+        start = 1.0e9
+        step = 86400 / 12
+
+        log = SessionLog(path)
+        timings = []
+        for i in range(args.sessions):
+            t0 = time.perf_counter()
+            mode = MODE_WORK if i % 2 == 0 else MODE_BREAK
+            log.append((start + i * step, start + i * step + 1500, mode, 1500, 1500, 0, FLAG_COMPLETED))
+            timings.append(time.perf_counter() - t0)
+        log.close()
+
+        print(f"sessions:      {args.sessions}")
+        print(f"file size:     {os.path.getsize(path) / 1e6:.1f} MB")
+        print(f"append p50:    {percentile(timings, 0.5) * 1e6:.1f} us")
+        print(f"append p99:    {percentile(timings, 0.99) * 1e6:.1f} us")
+        print(f"append max:    {max(timings) * 1e3:.2f} ms")
+
+        # Обрываем последнюю запись, как при сбое во время записи
+        with open(path, "r+b") as f:
+            f.truncate(os.path.getsize(path) - 7)
+
+        t0 = time.perf_counter()
+        log = SessionLog(path)
+        print(f"recover:       {(time.perf_counter() - t0) * 1e3:.2f} ms, {len(log)} records")
+
+        middle = start + (args.sessions // 2) * step
+        t0 = time.perf_counter()
+        week = log.sessions(middle, middle + 7 * 86400)
+        print(f"week query:    {(time.perf_counter() - t0) * 1e3:.2f} ms, {len(week)} sessions")
+        log.close()
+
+
+if __name__ == "__main__":
+    main()
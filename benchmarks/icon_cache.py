@@ -0,0 +1,71 @@
+"""
+Смена иконки кнопки старта/плеера: QIcon из файла против AssetManager.
+
+Раньше каждое переключение делало QIcon("pause.svg") / QIcon("play.svg"):
+файл заново читается из текущего каталога и SVG разбирается при
+отрисовке. Скрипт переключает иконку N раз и рисует кнопку, как при
+смене состояния, в двух вариантах, и печатает счетчики кэша. Отдельно
+проверяется запуск не из каталога приложения: QIcon("play.svg") тогда
+пустая, а иконка из пакета ресурсов - нет.
+
+Запуск: python benchmarks/icon_cache.py [--toggles 2000]
+"""
+import argparse
+import os
+import sys
+import tempfile
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+from PySide6.QtCore import QSize
+from PySide6.QtGui import QIcon
+from PySide6.QtWidgets import QApplication, QPushButton
+
+from src.core.asset_pack import APP_DIR, PACK_FILE, AssetPack
+from src.ui.assets import AssetManager
+
+
+def measure(button, make_icon, toggles):
+    t0 = time.perf_counter()
+    for i in range(toggles):
+        button.setIcon(make_icon("pause.svg" if i % 2 else "play.svg"))
+        button.repaint()
+    return (time.perf_counter() - t0) / toggles
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--toggles", type=int, default=2000)
+    args = parser.parse_args()
+
+    app = QApplication.instance() or QApplication(sys.argv)
+    button = QPushButton()
+    button.setFixedSize(50, 50)
+    button.setIconSize(QSize(30, 30))
+    button.show()
+    app.processEvents()
+
+    os.chdir(ROOT)
+    from_file = measure(button, QIcon, args.toggles)
+
+    manager = AssetManager(AssetPack(os.path.join(APP_DIR, PACK_FILE)))
+    from_cache = measure(button, lambda name: manager.icon(name, button.iconSize(), button), args.toggles)
+
+    os.chdir(tempfile.gettempdir())
+    elsewhere_file = QIcon("play.svg").isNull()
+    elsewhere_pack = AssetManager().icon("play.svg", 30).isNull()
+
+    metrics = manager.metrics()
+    print(f"QIcon(path) per toggle:   {from_file * 1e6:8.1f} us")
+    print(f"AssetManager per toggle:  {from_cache * 1e6:8.1f} us ({from_file / from_cache:.1f}x)")
+    print(f"cache: {metrics['hits']} hits, {metrics['misses']} misses, "
+          f"{metrics['entries']} entries, {metrics['bytes'] / 1024:.1f} KB, packed={metrics['packed']}")
+    print(f"launched from another directory: QIcon(path) null={elsewhere_file}, "
+          f"AssetManager null={elsewhere_pack}")
+
+
+if __name__ == "__main__":
+    main()
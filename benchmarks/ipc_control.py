@@ -0,0 +1,156 @@
+"""
+Стоимость команды запущенному экземпляру через сокет управления.
+
+Поднимает ControlServer с обработчиком-заглушкой (без Qt) в отдельном
+потоке во временном каталоге данных и меряет:
+- круговую задержку send_command() внутри процесса;
+- полное время `python main.py status` (новый процесс) против пустого
+  запуска интерпретатора - то есть цену самой пересылки команды.
+Отдельно проверяется, что сокет упавшего процесса подхватывается, что
+медленный клиент (команда не целиком) не задерживает поток владельца и
+что из нескольких одновременно запущенных экземпляров адрес занимает
+ровно один.
+
+Запуск: python benchmarks/ipc_control.py [--rounds 1000]
+"""
+import argparse
+import os
+import selectors
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+
+def serve(server, stop):
+    """Цикл владельца сервера: сокет и недочитанные соединения в одном селекторе."""
+    selector = selectors.DefaultSelector()
+    selector.register(server.fileno(), selectors.EVENT_READ)
+    clients = []
+    while not stop.is_set():
+        for key, _ in selector.select(0.1):
+            if key.fd == server.fileno():
+                server.handle_pending()
+            else:
+                server.handle_client(key.fd)
+        server.expire()
+        # Дескрипторы закрытых соединений могут достаться новым - перерегистрируем все
+        for fd in clients:
+            try:
+                selector.unregister(fd)
+            except (KeyError, ValueError):
+                pass
+        clients = server.waiting()
+        for fd in clients:
+            selector.register(fd, selectors.EVENT_READ)
+
+
+RACE_SCRIPT = """
+import sys, time
+sys.path.insert(0, sys.argv[1])
+from src.core.ipc import AlreadyRunning, ControlServer
+time.sleep(float(sys.argv[2]) - time.time())
+try:
+    server = ControlServer(lambda command: {"ok": True}).listen()
+except AlreadyRunning:
+    print("busy")
+else:
+    print("listening", flush=True)
+    time.sleep(1.0)
+    server.close()
+"""
+
+
+def race(processes, env):
+    """Одновременный запуск нескольких экземпляров поверх сокета упавшего процесса."""
+    start = time.time() + 0.5
+    children = [
+        subprocess.Popen([sys.executable, "-c", RACE_SCRIPT, ROOT, str(start)],
+                         env=env, stdout=subprocess.PIPE, text=True)
+        for _ in range(processes)
+    ]
+    return sum(child.communicate()[0].strip() == "listening" for child in children)
+
+
+def process_time(args, rounds, env):
+    best = float("inf")
+    for _ in range(rounds):
+        t0 = time.perf_counter()
+        subprocess.run(args, cwd=ROOT, env=env, stdout=subprocess.DEVNULL, check=True)
+        best = min(best, time.perf_counter() - t0)
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--rounds", type=int, default=1000)
+    parser.add_argument("--processes", type=int, default=5)
+    args = parser.parse_args()
+
+    directory = tempfile.mkdtemp()
+    os.environ["POMODORO_DATA_DIR"] = directory
+    from src.core.ipc import ControlServer, _connect, send_command, use_unix_socket
+
+    # Сокет, оставшийся от "упавшего" процесса
+    crashed = ControlServer(lambda command: {"ok": True}).listen()
+    crashed._sock.close()
+
+    state = {"running": False}
+
+    def handler(command):
+        state["running"] = command == "start" or (state["running"] and command == "status")
+        return {"ok": True, "mode": "work", "running": state["running"], "time_left": 1500, "display": "25:00"}
+
+    server = ControlServer(handler).listen()
+
+    # Медленный клиент: соединился и прислал полкоманды - поток владельца не ждет
+    slow = _connect(1.0)
+    slow.sendall(b"sta")
+    time.sleep(0.05)
+    t0 = time.perf_counter()
+    server.handle_pending()
+    slow_blocked = time.perf_counter() - t0
+    slow.sendall(b"tus\n")
+    time.sleep(0.05)
+    slow_answered = server.handle_client(server.waiting()[0])
+    slow.close()
+
+    stop = threading.Event()
+    thread = threading.Thread(target=serve, args=(server, stop), daemon=True)
+    thread.start()
+
+    t0 = time.perf_counter()
+    for _ in range(args.rounds):
+        send_command("status")
+    round_trip = (time.perf_counter() - t0) / args.rounds
+
+    env = dict(os.environ)
+    bare = process_time([sys.executable, "-c", "pass"], args.processes, env)
+    status = process_time([sys.executable, "main.py", "status"], args.processes, env)
+
+    stop.set()
+    thread.join()
+    server.close()
+
+    winners = None
+    if use_unix_socket():
+        stale = ControlServer(lambda command: {"ok": True}).listen()
+        stale._sock.close()
+        winners = race(args.processes, env)
+
+    print("stale socket from crashed process: reclaimed")
+    print(f"send_command round trip:   {round_trip * 1e6:8.1f} us")
+    print(f"half-sent command:         handle_pending {slow_blocked * 1e6:.0f} us, "
+          f"answered after the rest: {'yes' if slow_answered else 'no'}")
+    if winners is not None:
+        print(f"{args.processes} simultaneous starts:     {winners} listening")
+    print(f"python -c pass:            {bare * 1000:8.1f} ms")
+    print(f"python main.py status:     {status * 1000:8.1f} ms  (+{(status - bare) * 1000:.1f} ms over bare interpreter)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,110 @@
+"""
+Журнал переходов таймера: восстановление по снимку против полного повтора.
+
+Пишет журнал из N событий (по умолчанию миллион: старт, пауза, старт,
+окончание со сменой режима, смена длительности) через TimerJournal со
+снимком каждые SNAPSHOT_EVERY событий и обрывает его без закрытия, как
+при сбое во время записи. Затем для нескольких длин истории сравнивает:
+- открытие журнала (снимок + хвост) - то, что делает приложение при старте;
+- полный повтор всех событий с начала, как без снимков.
+Отдельно меряется цена одного перехода в потоке интерфейса: fsync на
+каждое событие против пачек по умолчанию (старт, окончание, каждые
+sync_every событий или sync_interval секунд).
+
+Запуск: python benchmarks/journal_replay.py [--events 1000000]
+"""
+import argparse
+import os
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.core.journal import KIND_CODES, RECORD_SIZE, SNAPSHOT_EVERY, TimerJournal, initial_state, replay
+
+CYCLE = ("start", "pause", "start", "finish", "switch_mode", "set_work_time")
+
+
+def write_journal(path, count):
+    """Пишет count событий и "падает": без закрытия и финального снимка."""
+    journal = TimerJournal(path, sync_every=4096, sync_kinds=())
+    t = 1.0e9
+    for i in range(count):
+        name = CYCLE[i % len(CYCLE)]
+        arg = 1500 if name == "set_work_time" else 0
+        journal.append((t, KIND_CODES[name], arg, 1500.0 - (i % 7)))
+        t += 60.0
+    journal.sync()
+    journal._file.close()
+
+
+def append_cost(path, count, **options):
+    """Средняя цена перехода: смесь событий комнаты (sync) и кнопок, как в общей комнате."""
+    journal = TimerJournal(path, **options)
+    names = ("sync",) * 8 + ("pause", "start")
+    t0 = time.perf_counter()
+    for i in range(count):
+        journal.append((time.time(), KIND_CODES[names[i % len(names)]], 0, 1500.0))
+    elapsed = time.perf_counter() - t0
+    journal.close()
+    return elapsed / count
+
+
+def timed(func, rounds=3):
+    best = float("inf")
+    for _ in range(rounds):
+        t0 = time.perf_counter()
+        result = func()
+        best = min(best, time.perf_counter() - t0)
+    return best, result
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--events", type=int, default=1000000)
+    parser.add_argument("--appends", type=int, default=2000)
+    args = parser.parse_args()
+
+    sizes = sorted({size for size in (args.events // 100, args.events // 10, args.events) if size})
+    print(f"snapshot every {SNAPSHOT_EVERY} events")
+    print(f"{'events':>10} {'file MB':>8} {'write s':>8} {'open+recover':>14} {'replayed':>9} {'full replay':>12}")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        for size in sizes:
+            path = os.path.join(tmp, f"timer-{size}.journal")
+            # size-е событие оборвано на середине записи, поэтому после
+            # последнего снимка остается наихудший хвост - SNAPSHOT_EVERY - 1
+            t0 = time.perf_counter()
+            write_journal(path, size - 1)
+            write_time = time.perf_counter() - t0
+            with open(path, "ab") as f:
+                f.write(b"\x00" * (RECORD_SIZE // 2))
+
+            def recover():
+                journal = TimerJournal(path)
+                state, replayed = journal.recover(), journal.replayed
+                journal._file.close()
+                return state, replayed
+
+            def full_replay():
+                journal = TimerJournal(path)
+                state = replay(initial_state(), journal.read(0))
+                journal._file.close()
+                return state
+
+            recover_time, (state, replayed) = timed(recover)
+            full_time, full_state = timed(full_replay, rounds=1)
+            assert state == full_state, (state, full_state)
+
+            print(f"{size:>10} {os.path.getsize(path) / 1e6:>8.1f} {write_time:>8.2f} "
+                  f"{recover_time * 1e3:>11.2f} ms {replayed:>9} {full_time * 1e3:>9.1f} ms")
+
+        every = append_cost(os.path.join(tmp, "every.journal"), args.appends, sync_every=1)
+        batched = append_cost(os.path.join(tmp, "batched.journal"), args.appends)
+        print(f"transition, fsync every event: {every * 1e6:8.1f} us")
+        print(f"transition, batched (default): {batched * 1e6:8.1f} us")
+
+
+if __name__ == "__main__":
+    main()
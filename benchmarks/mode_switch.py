@@ -0,0 +1,60 @@
+"""
+Задержка переключения режима: полный setStyleSheet против ThemeEngine.
+
+Строит MainWindow (платформа offscreen по умолчанию) и переключает тему
+работа/отдых N раз каждым способом. Замеряется вызов вместе с обработкой
+отложенных событий (полировка, раскладка, отрисовка).
+
+Запуск: python benchmarks/mode_switch.py [--switches 200]
+"""
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+from PySide6.QtWidgets import QApplication
+
+from src.styles.style import BASE_STYLE, WORK_MODE_BUTTONS, BREAK_MODE_BUTTONS
+from src.ui.main_window import MainWindow
+
+
+def measure(app, switch, count):
+    timings = []
+    for i in range(count):
+        t0 = time.perf_counter()
+        switch(i % 2 == 0)
+        app.processEvents()
+        timings.append(time.perf_counter() - t0)
+    timings.sort()
+    return timings[len(timings) // 2], timings[int(len(timings) * 0.95)]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--switches", type=int, default=200)
+    args = parser.parse_args()
+
+    app = QApplication.instance() or QApplication(sys.argv)
+    window = MainWindow()
+    window.show()
+    app.processEvents()
+
+    def restyle(is_break):
+        window.setStyleSheet(BASE_STYLE + (BREAK_MODE_BUTTONS if is_break else WORK_MODE_BUTTONS))
+
+    def theme(is_break):
+        window.theme.apply("break" if is_break else "work")
+
+    print(f"{'approach':>14} {'p50, ms':>9} {'p95, ms':>9}")
+    for name, switch in (("setStyleSheet", restyle), ("ThemeEngine", theme)):
+        if switch is theme:
+            window.theme.install("work")
+        p50, p95 = measure(app, switch, args.switches)
+        print(f"{name:>14} {p50 * 1e3:>9.3f} {p95 * 1e3:>9.3f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,66 @@
+"""
+Стоимость уведомлений для потока интерфейса и работа очереди.
+
+Медленный бэкенд (как winotify с PowerShell) моделируется MemoryBackend
+с задержкой --delay. Сравнивается синхронный показ из потока интерфейса
+и NotificationService: время вызова notify(), задержка до показа,
+схлопывание пачки быстрых уведомлений (старт/пауза подряд).
+
+Запуск: python benchmarks/notifications.py [--delay 0.3]
+"""
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.core.notifications import MemoryBackend, NotificationService
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--delay", type=float, default=0.3, help="время показа одним бэкендом, с")
+    parser.add_argument("--burst", type=int, default=50)
+    args = parser.parse_args()
+
+    # Как раньше: показ прямо в обработчике
+    backend = MemoryBackend(args.delay)
+    t0 = time.perf_counter()
+    backend.show("Таймер запущен", "Время работать")
+    direct = time.perf_counter() - t0
+
+    # Через очередь
+    backend = MemoryBackend(args.delay)
+    service = NotificationService([backend], min_interval=0.5)
+    t0 = time.perf_counter()
+    service.notify("Таймер запущен", "Время работать")
+    queued = time.perf_counter() - t0
+
+    # Пачка: пользователь жмет старт/пауза и переключает режимы
+    titles = ("Таймер запущен", "Отдых", "Пауза")
+    t0 = time.perf_counter()
+    for i in range(args.burst):
+        service.notify(titles[i % len(titles)], f"событие {i}")
+    burst = time.perf_counter() - t0
+
+    deadline = time.perf_counter() + 10
+    while service.metrics()["pending"] and time.perf_counter() < deadline:
+        time.sleep(0.01)
+    time.sleep(args.delay + 0.1)
+    service.close()
+    metrics = service.metrics()
+
+    print(f"backend delay:          {args.delay * 1000:.0f} ms")
+    print(f"UI blocked, direct:     {direct * 1000:8.2f} ms per notification")
+    print(f"UI blocked, queued:     {queued * 1000:8.3f} ms per notification")
+    print(f"burst of {args.burst}:            {burst * 1000:8.3f} ms to enqueue, "
+          f"shown {metrics['shown']}, coalesced {metrics['coalesced']}, dropped {metrics['dropped']}")
+    print(f"enqueue-to-display:     mean {metrics['latency_mean'] * 1000:.0f} ms, "
+          f"p95 {metrics['latency_p95'] * 1000:.0f} ms, max {metrics['latency_max'] * 1000:.0f} ms")
+    for title, message, _ in backend.shown:
+        print(f"  shown: {title} - {message}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,155 @@
+"""
+Кадры выезда панелей: старая анимация maximumHeight против PanelAnimator.
+
+Для каждой панели (настройки, статистика, плеер) меряются открытие и
+закрытие:
+- legacy - QPropertyAnimation(maximumHeight) 0 -> 200 -> 0, как было в
+  панелях: каждый кадр перестраивает раскладку окна;
+- animator - src/ui/animator.py: раскладка один раз, кадры из снимков.
+
+Печатаются кадры, интервалы между ними, перестроения раскладки окна
+(LayoutRequest) и процессорное время потока интерфейса на переход. --load добавляет в цикл событий постороннюю
+работу каждые 16 мс: видно, что переход не растягивается, а лишние
+кадры пропускаются.
+
+Запуск: python benchmarks/panel_animation.py [--repeat 5] [--load 0]
+"""
+import argparse
+import os
+import statistics
+import sys
+import tempfile
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+os.environ["POMODORO_DATA_DIR"] = tempfile.mkdtemp(prefix="pomodoro-bench-")
+
+from PySide6.QtCore import QEasingCurve, QEvent, QEventLoop, QObject, QPropertyAnimation, QTimer
+from PySide6.QtWidgets import QApplication
+
+from src.ui.animator import PanelAnimator
+
+PANELS = ("settings", "stats", "player")
+
+
+class LayoutCounter(QObject):
+    """Считает запросы перестроения раскладки (LayoutRequest) у виджета."""
+    def __init__(self):
+        super().__init__()
+        self.count = 0
+
+    def eventFilter(self, obj, event):
+        if event.type() == QEvent.LayoutRequest:
+            self.count += 1
+        return False
+
+
+def spin(seconds):
+    loop = QEventLoop()
+    QTimer.singleShot(int(seconds * 1000), loop.quit)
+    loop.exec()
+
+
+def legacy_toggle(panel, visible):
+    """Анимация панели до общего аниматора."""
+    animation = QPropertyAnimation(panel, b"maximumHeight")
+    animation.setDuration(PanelAnimator.DURATION)
+    animation.setStartValue(0 if visible else PanelAnimator.PANEL_HEIGHT)
+    animation.setEndValue(PanelAnimator.PANEL_HEIGHT if visible else 0)
+    animation.setEasingCurve(QEasingCurve.InOutQuad)
+    frames = []
+    animation.valueChanged.connect(lambda value: frames.append(time.perf_counter()))
+    animation.start()
+    return animation, frames
+
+
+def measure(window, name, visible, legacy, counter):
+    panel = getattr(window, f"{name}_widget")
+    animator = PanelAnimator.of(window)
+    counter.count = 0
+    cpu0 = time.process_time()
+    t0 = time.perf_counter()
+    if legacy:
+        animation, frames = legacy_toggle(panel, visible)
+        while animation.state() == QPropertyAnimation.Running:
+            spin(0.01)
+        intervals = [b - a for a, b in zip(frames, frames[1:])]
+        frame_count = len(frames)
+        interval_p50 = statistics.median(intervals) * 1000 if intervals else 0.0
+        interval_max = max(intervals) * 1000 if intervals else 0.0
+    else:
+        animator.set_panel_visible(panel, visible)
+        while animator.running:
+            spin(0.01)
+        report = animator.reports[-1]
+        frame_count = report["frames"]
+        interval_p50 = report["interval_p50_ms"]
+        interval_max = report["interval_max_ms"]
+    return {
+        "frames": frame_count,
+        "interval_p50_ms": interval_p50,
+        "interval_max_ms": interval_max,
+        "layouts": counter.count,
+        "cpu_ms": (time.process_time() - cpu0) * 1000,
+        "elapsed_ms": (time.perf_counter() - t0) * 1000,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--load", type=float, default=0.0, help="мс посторонней работы каждые 16 мс")
+    args = parser.parse_args()
+
+    app = QApplication.instance() or QApplication(sys.argv)
+    from src.ui.main_window import MainWindow
+    window = MainWindow()
+    window.show()
+    app.processEvents()
+    for name in PANELS:
+        getattr(window, f"{name}_widget").show()
+    spin(0.2)
+
+    counter = LayoutCounter()
+    window.main_layout.parentWidget().installEventFilter(counter)
+
+    if args.load:
+        def busy():
+            deadline = time.perf_counter() + args.load / 1000
+            while time.perf_counter() < deadline:
+                pass
+        load_timer = QTimer()
+        load_timer.timeout.connect(busy)
+        load_timer.start(16)
+
+    print(f"{'panel':10} {'mode':9} {'dir':6} {'frames':>6} {'interval p50':>13} {'max':>7} "
+          f"{'layouts':>8} {'cpu ms':>7} {'total ms':>9}")
+    for name in PANELS:
+        for legacy in (True, False):
+            runs = {True: [], False: []}
+            for _ in range(args.repeat):
+                for visible in (True, False):
+                    runs[visible].append(measure(window, name, visible, legacy, counter))
+            for visible in (True, False):
+                row = {key: statistics.median(run[key] for run in runs[visible]) for key in runs[visible][0]}
+                print(f"{name:10} {'legacy' if legacy else 'animator':9} {'open' if visible else 'close':6} "
+                      f"{row['frames']:>6.0f} {row['interval_p50_ms']:>10.1f} ms {row['interval_max_ms']:>7.1f} "
+                      f"{row['layouts']:>8.0f} {row['cpu_ms']:>7.1f} {row['elapsed_ms']:>9.1f}")
+
+    animator = PanelAnimator.of(window)
+    report = animator.reports[-1]
+    print(f"animator snapshot {report['snapshot_ms']:.1f} ms, commit {report['commit_ms']:.2f} ms, "
+          f"frame paint p50 {report['frame_p50_ms']:.2f} ms (max {report['frame_max_ms']:.2f}), "
+          f"dropped {report['dropped']}")
+
+    window.watchdog.close()
+    window.journal.close()
+    window.state_publisher.close()
+    window.notifications.close()
+    window.player_widget.close_playback()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,137 @@
+"""
+Задержка потока интерфейса при управлении воспроизведением.
+
+Медленный хост моделируется фальшивым бэкендом, у которого open()
+блокируется на --open-delay секунд. Сравниваются прямые вызовы бэкенда
+из обработчика (как раньше в toggle_playback) и PlaybackWorker: пока идут
+команды, 10-мс QTimer в потоке интерфейса меряет самую долгую паузу
+между тиками. Отдельно проверяется схлопывание 200 изменений громкости.
+
+Запуск: QT_QPA_PLATFORM=offscreen python benchmarks/playback_latency.py
+"""
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from PySide6.QtCore import QCoreApplication, QTimer
+
+from src.core.playback import PlaybackWorker
+
+
+class SlowBackend:
+    """Бэкенд, который долго подключается к потоку."""
+    def __init__(self, open_delay=0.5, on_state=None, network_caching=1000):
+        self.open_delay = open_delay
+        self.on_state = on_state
+        self.network_caching = network_caching
+        self.volume_calls = 0
+
+    def open(self, url):
+        time.sleep(self.open_delay)
+
+    def play(self):
+        if self.on_state is not None:
+            self.on_state("playing")
+
+    def pause(self):
+        pass
+
+    def stop(self):
+        pass
+
+    def set_volume(self, value):
+        self.volume_calls += 1
+        time.sleep(0.002)
+
+    def close(self):
+        pass
+
+
+def measure_stall(app, actions, duration):
+    """Выполняет actions в потоке интерфейса и возвращает максимальный разрыв тиков, мс."""
+    gaps = []
+    last = [time.perf_counter()]
+
+    def tick():
+        now = time.perf_counter()
+        gaps.append(now - last[0])
+        last[0] = now
+
+    ticker = QTimer()
+    ticker.timeout.connect(tick)
+    ticker.start(10)
+    for delay, action in actions:
+        QTimer.singleShot(delay, action)
+    QTimer.singleShot(duration, app.quit)
+    app.exec()
+    ticker.stop()
+    return max(gaps) * 1000
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--open-delay", type=float, default=0.5)
+    args = parser.parse_args()
+
+    app = QCoreApplication([])
+
+    # Прямые вызовы из потока интерфейса
+    backend = SlowBackend(args.open_delay)
+
+    def direct_play():
+        backend.open("http://slow.example/stream")
+        backend.play()
+
+    actions = [(50, direct_play), (300, direct_play)]
+    stall_direct = measure_stall(app, actions, 1500 + int(args.open_delay * 2000))
+
+    # Через рабочий поток
+    backends = []
+
+    def factory(on_state=None, network_caching=1000):
+        backends.append(SlowBackend(args.open_delay, on_state, network_caching))
+        return backends[-1]
+
+    worker = PlaybackWorker(backend_factory=factory)
+    states = []
+    errors = []
+    worker.state_changed.connect(lambda state, station: states.append(state))
+    worker.error.connect(errors.append)
+
+    actions = [
+        (50, lambda: worker.play("http://slow.example/a", "a")),
+        (300, lambda: worker.switch("http://slow.example/b", "b")),
+    ]
+    stall_worker = measure_stall(app, actions, 1500 + int(args.open_delay * 2000))
+
+    # Перетаскивание ползунка громкости: 200 значений подряд
+    t0 = time.perf_counter()
+    for value in range(200):
+        worker.set_volume(value % 101)
+    submit = (time.perf_counter() - t0) * 1000
+    worker.stop()
+    deadline = time.perf_counter() + 5
+    while worker.state != "stopped" and time.perf_counter() < deadline:
+        time.sleep(0.01)
+    worker.close()
+    if not backends:
+        print(f"worker created no backend: {'; '.join(errors) or 'no error reported'}", file=sys.stderr)
+        return 1
+
+    print(f"open() delay:              {args.open_delay * 1000:.0f} ms")
+    print(f"max UI stall, direct:      {stall_direct:.1f} ms")
+    print(f"max UI stall, worker:      {stall_worker:.1f} ms")
+    print(f"200 volume changes:        submitted in {submit:.2f} ms, applied {backends[0].volume_calls} times")
+    print(f"states:                    {' -> '.join(states)}")
+    if errors:
+        print(f"worker errors:             {'; '.join(errors)}")
+    for name, m in sorted(worker.metrics().items()):
+        print(f"  {name:8s} count={m['count']:3d} mean={m['mean'] * 1000:7.2f} ms "
+              f"max={m['max'] * 1000:7.2f} ms last={m['last'] * 1000:7.2f} ms")
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,83 @@
+"""
+Цена встроенного профилирования (src/core/profiling.py).
+
+- Без POMODORO_PROFILE методы не оборачиваются: в отдельном процессе
+  проверяется, что слоты MainWindow остаются исходными функциями.
+- С профилированием меряется добавка на один вызов: пустой метод и
+  TimerEngine.tick (типичный посекундный путь) с оберткой и без.
+
+Запуск: python benchmarks/profiling_overhead.py [--calls 1000000]
+"""
+import argparse
+import os
+import subprocess
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from src.core.engine import TimerEngine
+from src.core.profiling import Profiler
+
+CHECK = (
+    "import os; os.environ.setdefault('QT_QPA_PLATFORM', 'offscreen');"
+    "from src.ui.main_window import MainWindow;"
+    "print(hasattr(MainWindow._on_time_updated, '__profiled__'))"
+)
+
+
+def per_call(func, calls):
+    t0 = time.perf_counter()
+    for _ in range(calls):
+        func()
+    return (time.perf_counter() - t0) / calls
+
+
+def wrapped_in_process(profile):
+    env = dict(os.environ)
+    env.pop("POMODORO_PROFILE", None)
+    if profile:
+        env["POMODORO_PROFILE"] = "1"
+    result = subprocess.run([sys.executable, "-c", CHECK], cwd=ROOT, env=env,
+                            capture_output=True, text=True, check=True)
+    return result.stdout.strip()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--calls", type=int, default=1000000)
+    args = parser.parse_args()
+
+    profiler = Profiler()
+
+    def noop():
+        pass
+
+    engine = TimerEngine()
+    engine.start()
+    tick = engine.tick
+
+    # Прогрев: очередь трассы заполняется до предела, дальше размер постоянный
+    warm = profiler.wrap(noop, "warm-up")
+    for _ in range(profiler.trace.maxlen):
+        warm()
+
+    rows = []
+    for name, func in (("empty call", noop), ("TimerEngine.tick", tick)):
+        plain = per_call(func, args.calls)
+        wrapped = per_call(profiler.wrap(func, name), args.calls)
+        rows.append((name, plain, wrapped))
+
+    print(f"slots wrapped without POMODORO_PROFILE: {wrapped_in_process(False)}")
+    print(f"slots wrapped with POMODORO_PROFILE=1:  {wrapped_in_process(True)}")
+    for name, plain, wrapped in rows:
+        print(f"{name:18} plain {plain * 1e9:7.0f} ns   profiled {wrapped * 1e9:7.0f} ns   "
+              f"(+{(wrapped - plain) * 1e9:.0f} ns per call)")
+    report = profiler.report()["sites"]["TimerEngine.tick"]
+    print(f"TimerEngine.tick histogram: p50 <= {report['p50_us']} us, p99 <= {report['p99_us']} us, "
+          f"{len(profiler.trace)} trace events kept")
+
+
+if __name__ == "__main__":
+    main()
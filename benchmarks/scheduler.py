@@ -0,0 +1,100 @@
+"""
+Общий планировщик на куче против одного таймера на экземпляр.
+
+Моделирует N таймеров с циклами работа/отдых на поддельных часах.
+Схема "один QTimer на экземпляр" будит каждый таймер каждую секунду,
+TimerScheduler просыпается только на дедлайнах. Печатает число
+пробуждений и процессорное время обеих схем.
+
+Запуск: python benchmarks/scheduler.py [--timers 10000] [--seconds 300]
+"""
+import argparse
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.core.engine import TimerEngine
+from src.core.scheduler import TimerScheduler
+
+
+class FakeClock:
+    """Монотонные часы, которые двигаются только вручную."""
+
+    def __init__(self, start=1000.0):
+        self.now = start
+
+    def __call__(self):
+        return self.now
+
+
+def make_engines(count, clock, seed):
+    """Создает таймеры со случайными длительностями, которые сами перезапускаются."""
+    rng = random.Random(seed)
+    engines = []
+    finished = [0]
+
+    def on_finished():
+        finished[0] += 1
+
+    for _ in range(count):
+        engine = TimerEngine(rng.randint(60, 300), rng.randint(30, 120), clock=clock)
+        engine.timer_finished.connect(on_finished)
+        # После окончания сессии сразу запускаем следующую
+        engine.mode_changed.connect(lambda _, engine=engine: engine.start())
+        engines.append(engine)
+    return engines, finished
+
+
+def run_per_instance(count, seconds, seed):
+    """Каждый таймер будится раз в секунду, как QTimer на экземпляр."""
+    clock = FakeClock()
+    engines, finished = make_engines(count, clock, seed)
+    for engine in engines:
+        engine.start()
+
+    wakeups = 0
+    cpu_start = time.process_time()
+    for _ in range(seconds):
+        clock.now += 1.0
+        for engine in engines:
+            wakeups += 1
+            engine.tick()
+    return wakeups, time.process_time() - cpu_start, finished[0]
+
+
+def run_scheduler(count, seconds, seed):
+    """Один будильник на все таймеры, пробуждения только на дедлайнах."""
+    clock = FakeClock()
+    engines, finished = make_engines(count, clock, seed)
+    armed = [None]
+    scheduler = TimerScheduler(lambda delay: armed.__setitem__(0, delay), clock=clock)
+    for engine in engines:
+        scheduler.add(engine)
+        engine.start()
+
+    end = clock.now + seconds
+    cpu_start = time.process_time()
+    while armed[0] is not None and clock.now + armed[0] <= end:
+        clock.now += armed[0]
+        scheduler.run_due()
+    return scheduler.wakeups, time.process_time() - cpu_start, finished[0]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--timers", type=int, default=10000)
+    parser.add_argument("--seconds", type=int, default=300)
+    parser.add_argument("--seed", type=int, default=1)
+    args = parser.parse_args()
+
+    print(f"{'scheme':>14} {'wakeups':>10} {'cpu, s':>8} {'sessions':>9}")
+    for name, run in (("per-instance", run_per_instance), ("heap", run_scheduler)):
+        wakeups, cpu, sessions = run(args.timers, args.seconds, args.seed)
+        print(f"{name:>14} {wakeups:>10} {cpu:>8.3f} {sessions:>9}")
+
+
+if __name__ == "__main__":
+    main()
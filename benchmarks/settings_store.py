@@ -0,0 +1,108 @@
+"""
+Загрузка и запись настроек, схлопывание изменений слайдера.
+
+1. Время SettingsStore при старте (чтение и проверка JSON).
+2. Перетаскивание окна и громкости: сколько записей на диск делает
+   отложенный flush против записи на каждое изменение.
+3. SettingsWidget: сколько раз value_changed доходит до таймера при
+   перетаскивании слайдера и при прокрутке колесом.
+
+Запуск: QT_QPA_PLATFORM=offscreen python benchmarks/settings_store.py
+"""
+import argparse
+import os
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.core.settings import SettingsStore
+
+
+def bench_load(path, rounds):
+    store = SettingsStore(path)
+    store.set("work_time", 50)
+    store.set("station", "Smooth Jazz")
+    store.set("window_x", 400)
+    store.set("window_y", 300)
+    store.flush()
+
+    t0 = time.perf_counter()
+    for _ in range(rounds):
+        SettingsStore(path)
+    return (time.perf_counter() - t0) / rounds
+
+
+def bench_writes(path, changes):
+    # Запись на каждое изменение
+    store = SettingsStore(path)
+    t0 = time.perf_counter()
+    for i in range(changes):
+        store.set("window_x", i)
+        store.flush()
+    eager = time.perf_counter() - t0, store.writes
+
+    # Изменения копятся, запись одна по таймеру
+    store = SettingsStore(path)
+    t0 = time.perf_counter()
+    for i in range(changes):
+        store.set("window_x", -i)
+        store.set("volume", i % 101)
+    store.flush()
+    deferred = time.perf_counter() - t0, store.writes
+    return eager, deferred
+
+
+def bench_slider():
+    from PySide6.QtWidgets import QApplication
+    from src.ui.settings_widget import SettingsWidget
+
+    app = QApplication.instance() or QApplication([])
+    widget = SettingsWidget()
+    applied = []
+    widget.value_changed.connect(applied.append)
+    slider = widget.time_slider
+
+    # Перетаскивание: 25 -> 55 по одной минуте
+    slider.setSliderDown(True)
+    for value in range(26, 56):
+        slider.setValue(value)
+        app.processEvents()
+    slider.setSliderDown(False)
+    drag = list(applied)
+
+    # Колесо/клавиши: 10 шагов подряд, затем пауза
+    applied.clear()
+    for _ in range(10):
+        slider.setValue(slider.value() - 1)
+        app.processEvents()
+    deadline = time.perf_counter() + widget.APPLY_DELAY / 1000 + 0.5
+    while time.perf_counter() < deadline:
+        app.processEvents()
+        time.sleep(0.01)
+    return drag, list(applied)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--rounds", type=int, default=2000)
+    parser.add_argument("--changes", type=int, default=300)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "settings.json")
+        load = bench_load(path, args.rounds)
+        (eager_time, eager_writes), (deferred_time, deferred_writes) = bench_writes(path, args.changes)
+
+    drag, wheel = bench_slider()
+
+    print(f"load at startup:      {load * 1e6:8.1f} us")
+    print(f"{args.changes} window moves, write each: {eager_writes:4d} writes, {eager_time * 1000:8.1f} ms")
+    print(f"{args.changes} moves + volume, deferred:  {deferred_writes:4d} writes, {deferred_time * 1000:8.1f} ms")
+    print(f"slider drag 25->55:   applied {len(drag)} time(s): {drag}")
+    print(f"10 wheel steps:       applied {len(wheel)} time(s): {wheel}")
+
+
+if __name__ == "__main__":
+    main()
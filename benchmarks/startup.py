@@ -0,0 +1,94 @@
+"""
+Холодный старт: время импорта модулей и время до первой отрисовки MainWindow.
+
+Запускает приложение в отдельном процессе (по умолчанию с платформой
+offscreen), ловит первое событие Paint главного окна и выходит.
+С флагом --importtime дополнительно печатает самые дорогие импорты
+из вывода python -X importtime.
+
+Запуск: python benchmarks/startup.py [--runs 5] [--importtime]
+"""
+import argparse
+import os
+import subprocess
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Код дочернего процесса: отсчет идет с самого начала интерпретатора
+CHILD = r"""
+import time
+t0 = time.perf_counter()
+import sys
+from PySide6.QtWidgets import QApplication
+from PySide6.QtCore import QObject, QEvent
+app = QApplication(sys.argv)
+t_qt = time.perf_counter()
+from src.ui.main_window import MainWindow
+t_import = time.perf_counter()
+
+class FirstPaint(QObject):
+    def eventFilter(self, obj, event):
+        if event.type() == QEvent.Paint:
+            t_paint = time.perf_counter()
+            print(f"{(t_qt - t0) * 1e3:.1f} {(t_import - t_qt) * 1e3:.1f} "
+                  f"{(t_construct - t_import) * 1e3:.1f} {(t_paint - t0) * 1e3:.1f}")
+            app.quit()
+        return False
+
+window = MainWindow()
+t_construct = time.perf_counter()
+first_paint = FirstPaint()
+window.installEventFilter(first_paint)
+window.show()
+app.exec()
+"""
+
+
+def run_child(extra_args=()):
+    env = dict(os.environ)
+    env.setdefault("QT_QPA_PLATFORM", "offscreen")
+    return subprocess.run(
+        [sys.executable, *extra_args, "-c", CHILD],
+        cwd=ROOT, env=env, capture_output=True, text=True, check=True,
+    )
+
+
+def top_imports(stderr, limit):
+    """Разбирает вывод -X importtime и возвращает самые дорогие модули."""
+    rows = []
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        # Формат: "import time:   self [us] | cumulative | name"
+        self_us, cumulative_us, name = line[len("import time:"):].split("|")
+        rows.append((int(cumulative_us), name.strip()))
+    rows.sort(reverse=True)
+    return rows[:limit]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--importtime", action="store_true")
+    args = parser.parse_args()
+
+    results = []
+    for _ in range(args.runs):
+        line = run_child().stdout.strip().splitlines()[-1]
+        results.append([float(value) for value in line.split()])
+
+    best = [min(column) for column in zip(*results)]
+    print(f"Qt init:          {best[0]:.1f} ms")
+    print(f"import UI:        {best[1]:.1f} ms")
+    print(f"MainWindow():     {best[2]:.1f} ms")
+    print(f"first paint:      {best[3]:.1f} ms (from interpreter start)")
+
+    if args.importtime:
+        print("\nslowest imports (cumulative):")
+        for cumulative_us, name in top_imports(run_child(["-X", "importtime"]).stderr, 15):
+            print(f"  {cumulative_us / 1e3:8.1f} ms  {name}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,67 @@
+"""
+Параллельная проверка станций через StationManager на локальном сервере.
+
+Поднимает benchmarks/stream_server.py в фоне, создает N станций
+(потоки с icy-br, без заголовков, через редирект и мертвые) и
+замеряет время полной проверки, повторного вызова из кэша и
+число открытых/переиспользованных соединений в первом и в повторном
+раунде (пул живет вместе с менеджером).
+
+Запуск: python benchmarks/station_probe.py [--stations 40]
+"""
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from stream_server import start_in_thread
+
+from src.core.stations import Station, StationManager
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--stations", type=int, default=40)
+    args = parser.parse_args()
+
+    base = start_in_thread()
+    kinds = ("stream", "raw", "redirect", "dead")
+    stations = [
+        Station(f"{kinds[i % 4]}-{i}", f"{base}/{kinds[i % 4]}/{i}")
+        for i in range(args.stations)
+    ]
+    manager = StationManager(stations, timeout=2.0, sample_time=0.3)
+
+    t0 = time.perf_counter()
+    manager.probe_all_blocking()
+    cold = time.perf_counter() - t0
+
+    t0 = time.perf_counter()
+    manager.probe_all_blocking()
+    cached = time.perf_counter() - t0
+
+    # Повторный раунд: соединения редиректов остались в пуле менеджера
+    opened, reused = manager.pool.opened, manager.pool.reused
+    t0 = time.perf_counter()
+    manager.probe_all_blocking(force=True)
+    forced = time.perf_counter() - t0
+    pool = manager.pool
+
+    reachable = sum(1 for name in manager.names() if manager.health(name).reachable)
+    print(f"stations:         {args.stations} ({reachable} reachable)")
+    print(f"probe all (cold): {cold * 1e3:.0f} ms")
+    print(f"probe all (ttl):  {cached * 1e3:.2f} ms")
+    print(f"probe all (again): {forced * 1e3:.0f} ms")
+    print(f"pool, first round: opened={opened} reused={reused}")
+    print(f"pool, next round:  opened={pool.opened - opened} reused={pool.reused - reused}")
+    print("order:", ", ".join(manager.ordered()[:6]), "...")
+    for name in manager.names()[:4]:
+        print(f"  {name:>12}: {manager.health(name)}")
+    manager.close()
+
+
+if __name__ == "__main__":
+    main()
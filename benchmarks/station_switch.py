@@ -0,0 +1,140 @@
+"""
+Время до первого звука при переключении станций.
+
+Поднимает benchmarks/stream_server.py и переключает PlaybackWorker
+между станциями /slow/ (ответ через SLOW_DELAY). Сравниваются холодный
+старт (warm_standby=False) и резервный канал, заранее подключенный через
+prepare(). Если python-vlc установлен, используется настоящий VLC (--vlc),
+иначе - бэкенд, который читает поток по HTTP и считает звук начавшимся,
+когда набран буфер network-caching миллисекунд.
+
+Запуск: python benchmarks/station_switch.py [--switches 6] [--caching 1000]
+"""
+import argparse
+import os
+import socket
+import sys
+import threading
+import time
+from urllib.parse import urlsplit
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from stream_server import BITRATE, start_in_thread
+
+from src.core.playback import PlaybackWorker, VlcBackend, load_vlc
+
+
+class HttpBufferBackend:
+    """Канал, который подключается к потоку и копит network-caching мс звука."""
+    def __init__(self, on_state=None, network_caching=1000):
+        self.on_state = on_state
+        self.network_caching = network_caching
+        self.url = None
+        self.volume = 100
+        self._stop = None
+        self._thread = None
+
+    def open(self, url):
+        self.stop()
+        self.url = url
+
+    def play(self):
+        stop = self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._read, args=(self.url, stop), daemon=True)
+        self._thread.start()
+
+    def _read(self, url, stop):
+        parts = urlsplit(url)
+        need = BITRATE * 1000 // 8 * self.network_caching // 1000
+        with socket.create_connection((parts.hostname, parts.port)) as sock:
+            sock.sendall(f"GET {parts.path} HTTP/1.1\r\nHost: {parts.netloc}\r\n\r\n".encode())
+            data = b""
+            while b"\r\n\r\n" not in data:
+                data += sock.recv(4096)
+            buffered = len(data.split(b"\r\n\r\n", 1)[1])
+            playing = False
+            while not stop.is_set():
+                if not playing and buffered >= need:
+                    playing = True
+                    if self.on_state is not None:
+                        self.on_state("playing")
+                chunk = sock.recv(65536)
+                if not chunk:
+                    break
+                buffered += len(chunk)
+
+    def pause(self):
+        self.stop()
+
+    def stop(self):
+        if self._stop is not None:
+            self._stop.set()
+            self._stop = None
+
+    def set_volume(self, value):
+        self.volume = value
+
+    def close(self):
+        self.stop()
+
+
+def wait_playing(worker, station, timeout=10.0):
+    deadline = time.perf_counter() + timeout
+    while time.perf_counter() < deadline:
+        if worker.state == "playing" and worker.station == station:
+            return True
+        time.sleep(0.001)
+    return False
+
+
+def run(base, factory, warm, switches, caching, listen):
+    worker = PlaybackWorker(backend_factory=factory, warm_standby=warm, network_caching=caching, crossfade=0.2)
+    names = [f"st{i}" for i in range(switches + 1)]
+
+    def url(name):
+        return f"{base}/slow/{name}"
+
+    worker.play(url(names[0]), names[0])
+    wait_playing(worker, names[0])
+    worker.prepare(url(names[1]), names[1])
+
+    results = []
+    for current, target in zip(names, names[1:]):
+        time.sleep(listen)  # Пользователь слушает текущую станцию
+        started = time.perf_counter()
+        worker.switch(url(target), target)
+        ok = wait_playing(worker, target)
+        results.append((time.perf_counter() - started) if ok else float("nan"))
+        following = names[(names.index(target) + 1) % len(names)]
+        worker.prepare(url(following), following)
+
+    worker.stop()
+    worker.close()
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--switches", type=int, default=6)
+    parser.add_argument("--caching", type=int, default=1000, help="network-caching, мс")
+    parser.add_argument("--listen", type=float, default=1.5, help="пауза между переключениями, с")
+    parser.add_argument("--vlc", action="store_true", help="использовать настоящий VLC")
+    args = parser.parse_args()
+
+    if args.vlc and load_vlc() is None:
+        parser.error("python-vlc не установлен")
+    factory = VlcBackend if args.vlc else HttpBufferBackend
+
+    base = start_in_thread()
+    print(f"backend: {factory.__name__}, network-caching {args.caching} ms, {args.switches} switches")
+    for label, warm in (("cold start", False), ("warm standby", True)):
+        times = [t * 1000 for t in run(base, factory, warm, args.switches, args.caching, args.listen)]
+        ordered = sorted(times)
+        print(f"{label:13s} time to first audio: median {ordered[len(ordered) // 2]:7.1f} ms, "
+              f"max {ordered[-1]:7.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
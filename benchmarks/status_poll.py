@@ -0,0 +1,113 @@
+"""
+Цена одного опроса состояния для виджетов панелей (polybar, waybar).
+
+Сравнивает чтение блока состояния (read_state, mmap + seqlock) и
+запрос через сокет управления (send_command("status")) внутри процесса,
+а также полный запуск `python main.py status` в обоих вариантах.
+
+Проверка на разорванные чтения: писатель в соседнем потоке без пауз
+публикует состояния, где work_time == break_time == номер записи;
+читатель считает ответы, в которых поля не совпали.
+
+Запуск: python benchmarks/status_poll.py [--polls 20000]
+"""
+import argparse
+import os
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from ipc_control import serve
+
+
+def per_call(func, rounds):
+    t0 = time.perf_counter()
+    for _ in range(rounds):
+        func()
+    return (time.perf_counter() - t0) / rounds
+
+
+def process_time(args, rounds, env):
+    best = float("inf")
+    for _ in range(rounds):
+        t0 = time.perf_counter()
+        subprocess.run(args, cwd=ROOT, env=env, stdout=subprocess.DEVNULL, check=True)
+        best = min(best, time.perf_counter() - t0)
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--polls", type=int, default=20000)
+    parser.add_argument("--processes", type=int, default=5)
+    args = parser.parse_args()
+
+    directory = tempfile.mkdtemp()
+    os.environ["POMODORO_DATA_DIR"] = directory
+    from src.core.ipc import ControlServer, send_command
+    from src.core.state_block import STATE_FILE, StateBlock, read_state
+
+    path = os.path.join(directory, STATE_FILE)
+    block = StateBlock(path)
+    block.write(True, True, 1500.0, 1500, 300)
+
+    # Сокет управления с тем же ответом
+    reply = read_state(path)
+    server = ControlServer(lambda command: reply).listen()
+    stop = threading.Event()
+
+    thread = threading.Thread(target=serve, args=(server, stop), daemon=True)
+    thread.start()
+
+    mmap_poll = per_call(lambda: read_state(path), args.polls)
+    socket_poll = per_call(lambda: send_command("status"), min(args.polls, 5000))
+
+    env = dict(os.environ)
+    process_block = process_time([sys.executable, "main.py", "status"], args.processes, env)
+    os.remove(path)  # без блока status уходит в сокет
+    process_socket = process_time([sys.executable, "main.py", "status"], args.processes, env)
+    stop.set()
+    thread.join()
+    server.close()
+
+    # Разорванные чтения под постоянной записью
+    block = StateBlock(path)
+    writing = threading.Event()
+    writing.set()
+
+    def writer():
+        n = 0
+        while writing.is_set():
+            n += 1
+            block.write(n % 2 == 0, True, 100.0, n, n)
+
+    writer_thread = threading.Thread(target=writer, daemon=True)
+    writer_thread.start()
+    torn = failed = 0
+    for _ in range(args.polls):
+        state = read_state(path)
+        if state is None:
+            failed += 1
+        elif state["work_time"] != state["break_time"]:
+            torn += 1
+    writing.clear()
+    writer_thread.join()
+    writes = block.writes
+    block.close()
+
+    print(f"poll via mmap block:       {mmap_poll * 1e6:8.1f} us")
+    print(f"poll via control socket:   {socket_poll * 1e6:8.1f} us")
+    print(f"main.py status, block:     {process_block * 1000:8.1f} ms")
+    print(f"main.py status, socket:    {process_socket * 1000:8.1f} ms")
+    print(f"torn reads: {torn} of {args.polls} polls during {writes} concurrent writes "
+          f"(gave up after retries: {failed})")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,137 @@
+"""
+Локальная замена интернет-радио для проверок и бенчмарков.
+
+HTTP-сервер на asyncio отдает бесконечный поток MP3-кадров
+(MPEG-1 Layer III, 128 кбит/с, 44.1 кГц, тишина) в реальном темпе:
+
+    /stream/<имя>     поток с заголовком icy-br
+    /raw/<имя>        поток без заголовков о битрейте
+    /redirect/<имя>   302 на /stream/<имя> с keep-alive
+    /slow/<имя>       как /stream/, но ответ приходит через SLOW_DELAY секунд
+    /flaky/<имя>      поток рвется через FLAKY_UP секунд, затем FLAKY_DOWN секунд 503
+    /dead/<имя>       404
+
+Запуск: python benchmarks/stream_server.py [--port 8765]
+"""
+import argparse
+import asyncio
+import threading
+
+# Заголовок кадра: синхрослово, MPEG-1 Layer III, 128 кбит/с, 44.1 кГц, без CRC
+FRAME_HEADER = bytes([0xFF, 0xFB, 0x90, 0x64])
+FRAME_SIZE = 417  # 144 * 128000 / 44100
+FRAME = FRAME_HEADER + bytes(FRAME_SIZE - len(FRAME_HEADER))
+FRAME_DURATION = 1152 / 44100
+BITRATE = 128
+
+# Сколько кадров отдать сразу, как буфер сервера радио (~1 с)
+BURST_FRAMES = 38
+
+# Задержка ответа /slow/: DNS, TLS и очередь удаленного сервера
+SLOW_DELAY = 0.3
+
+# Обрыв сети для /flaky/: сколько поток живет и сколько станция недоступна
+FLAKY_UP = 2.0
+FLAKY_DOWN = 3.0
+_down_until = {}  # имя -> время восстановления
+
+
+async def handle(reader, writer):
+    try:
+        while True:
+            request = await reader.readline()
+            if not request:
+                return
+            while (await reader.readline()) not in (b"\r\n", b"\n", b""):
+                pass
+
+            method, path, _ = request.decode("latin-1").split(" ", 2)
+            kind, _, name = path.strip("/").partition("/")
+
+            if kind == "redirect":
+                writer.write(
+                    f"HTTP/1.1 302 Found\r\nLocation: /stream/{name}\r\n"
+                    f"Content-Length: 0\r\nConnection: keep-alive\r\n\r\n".encode("latin-1")
+                )
+                await writer.drain()
+                continue
+
+            loop = asyncio.get_running_loop()
+            stream_until = None
+            if kind == "flaky":
+                if loop.time() < _down_until.get(name, 0.0):
+                    writer.write(b"HTTP/1.1 503 Service Unavailable\r\nContent-Length: 0\r\n\r\n")
+                    await writer.drain()
+                    continue
+                stream_until = loop.time() + FLAKY_UP
+                kind = "stream"
+
+            if kind == "slow":
+                await asyncio.sleep(SLOW_DELAY)
+                kind = "stream"
+
+            if kind not in ("stream", "raw"):
+                writer.write(b"HTTP/1.1 404 Not Found\r\nContent-Length: 0\r\n\r\n")
+                await writer.drain()
+                continue
+
+            headers = "HTTP/1.1 200 OK\r\nContent-Type: audio/mpeg\r\nConnection: close\r\n"
+            if kind == "stream":
+                headers += f"icy-br: {BITRATE}\r\nicy-name: {name}\r\n"
+            writer.write((headers + "\r\n").encode("latin-1"))
+            writer.write(FRAME * BURST_FRAMES)
+            await writer.drain()
+
+            next_frame = loop.time()
+            while stream_until is None or loop.time() < stream_until:
+                next_frame += FRAME_DURATION
+                await asyncio.sleep(max(0.0, next_frame - loop.time()))
+                writer.write(FRAME)
+                await writer.drain()
+            _down_until[name] = loop.time() + FLAKY_DOWN
+            return
+    except (ConnectionError, asyncio.IncompleteReadError, ValueError):
+        pass
+    finally:
+        writer.close()
+
+
+async def serve(host="127.0.0.1", port=0):
+    """Запускает сервер и возвращает его (порт: server.sockets[0].getsockname()[1])."""
+    return await asyncio.start_server(handle, host, port)
+
+
+def start_in_thread(host="127.0.0.1", port=0):
+    """Запускает сервер в фоновом потоке и возвращает базовый URL."""
+    ready = threading.Event()
+    address = {}
+
+    def run():
+        loop = asyncio.new_event_loop()
+        server = loop.run_until_complete(serve(host, port))
+        address["port"] = server.sockets[0].getsockname()[1]
+        ready.set()
+        loop.run_forever()
+
+    threading.Thread(target=run, name="stream-server", daemon=True).start()
+    ready.wait()
+    return f"http://{host}:{address['port']}"
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    args = parser.parse_args()
+
+    async def run():
+        server = await serve(args.host, args.port)
+        print(f"serving on http://{args.host}:{args.port}/stream/test")
+        async with server:
+            await server.serve_forever()
+
+    asyncio.run(run())
+
+
+if __name__ == "__main__":
+    main()
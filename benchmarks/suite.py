@@ -0,0 +1,297 @@
+"""
+Набор воспроизводимых замеров таймера, интерфейса и плеера.
+
+Все случаи работают без экрана (QT_QPA_PLATFORM=offscreen) и во
+временном каталоге данных, настройки и журналы пользователя не
+трогаются:
+- cold_start   - MainWindow в новом процессе: конструктор и первая отрисовка;
+- tick         - PomodoroTimer._update_timer -> TimerWidget.update_time с отрисовкой;
+- mode_switch  - MainWindow._on_mode_changed с отрисовкой;
+- slider_drag  - перетаскивание ползунка настроек: шагов в секунду и
+                 сколько раз значение применилось;
+- player       - команды PlayerWidget с поддельным VLC: время в потоке
+                 интерфейса и до ответа рабочего потока.
+
+Результаты пишутся в JSON (по умолчанию benchmarks/results/<время>.json).
+compare сравнивает два файла и завершается с кодом 1, если какая-то
+метрика ухудшилась больше порога (для p95 - больше двух порогов).
+Метрики *_per_s - чем больше, тем лучше, остальные (время) - чем
+меньше, тем лучше. Время - медиана по повторам после прогрева.
+
+Запуск: python benchmarks/suite.py run [--only tick,player] [--out FILE]
+        python benchmarks/suite.py compare BASE.json NEW.json [--threshold 0.15]
+"""
+import argparse
+import json
+import os
+import platform
+import statistics
+import sys
+import tempfile
+import time
+
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+ROOT = os.path.dirname(BENCH_DIR)
+sys.path.insert(0, ROOT)
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+RESULTS_DIR = os.path.join(BENCH_DIR, "results")
+
+
+def percentiles(timings, scale=1e6):
+    """p50 и p95 списка длительностей (с) в единицах scale."""
+    timings = sorted(timings)
+    return timings[len(timings) // 2] * scale, timings[int(len(timings) * 0.95)] * scale
+
+
+class FakeClock:
+    """Монотонные часы, которые двигаются только вручную."""
+    def __init__(self, start=1000.0):
+        self.now = start
+
+    def __call__(self):
+        return self.now
+
+
+def new_window(app):
+    from src.ui.main_window import MainWindow
+    window = MainWindow()
+    window.show()
+    app.processEvents()
+    return window
+
+
+def close_window(app, window):
+    # Как force_quit, но без выхода из приложения
+    for name in ("history", "journal", "state_publisher", "watchdog"):
+        resource = getattr(window, name, None)
+        if resource is not None:
+            resource.close()
+    window.notifications.close()
+    if "player" in window._panels:
+        window._panels["player"].close_playback()
+    window.hide()
+    window.deleteLater()
+    app.processEvents()
+
+
+def case_cold_start(app, args):
+    from startup import run_child
+
+    runs = [[float(value) for value in run_child().stdout.split()] for _ in range(args.runs)]
+    columns = list(zip(*runs))
+    return {
+        "construct_ms": statistics.median(columns[2]),
+        "first_paint_ms": statistics.median(columns[3]),
+    }
+
+
+def case_tick(app, args):
+    window = new_window(app)
+    clock = FakeClock()
+    timer = window.timer
+    timer.engine._clock = clock
+    timer.start()
+    app.processEvents()
+
+    timings = []
+    for _ in range(args.warmup + args.iterations):
+        clock.now += 1.0
+        t0 = time.perf_counter()
+        timer._update_timer()
+        app.processEvents()
+        timings.append(time.perf_counter() - t0)
+    timer.pause()
+    del timings[:args.warmup]
+    close_window(app, window)
+
+    p50, p95 = percentiles(timings)
+    return {"tick_p50_us": p50, "tick_p95_us": p95}
+
+
+def case_mode_switch(app, args):
+    window = new_window(app)
+    timings = []
+    for i in range(args.warmup + args.iterations // 4):
+        t0 = time.perf_counter()
+        window._on_mode_changed(i % 2 == 1)
+        app.processEvents()
+        timings.append(time.perf_counter() - t0)
+    close_window(app, window)
+    del timings[:args.warmup]
+
+    p50, p95 = percentiles(timings)
+    return {"switch_p50_us": p50, "switch_p95_us": p95}
+
+
+def case_slider_drag(app, args):
+    window = new_window(app)
+    settings = window.settings_widget
+    slider = settings.time_slider
+    applied = []
+    settings.value_changed.connect(applied.append)
+    app.processEvents()
+
+    steps = 0
+    t0 = time.perf_counter()
+    for drag in range(args.iterations // 100):
+        slider.setSliderDown(True)
+        for value in list(range(1, 61)) + list(range(60, 0, -1)):
+            slider.setValue(value)
+            app.processEvents()
+            steps += 1
+        slider.setSliderDown(False)
+        app.processEvents()
+    elapsed = time.perf_counter() - t0
+    drags = args.iterations // 100
+    close_window(app, window)
+
+    return {"drag_steps_per_s": steps / elapsed, "applies_per_drag": len(applied) / max(1, drags)}
+
+
+def case_player(app, args):
+    from playback_latency import SlowBackend
+    from src.core.playback import PlaybackWorker
+
+    window = new_window(app)
+    player = window.player_widget
+
+    def factory(on_state=None, network_caching=1000):
+        return SlowBackend(0.0, on_state, network_caching)
+
+    player.playback = PlaybackWorker(backend_factory=factory)
+    player.playback.state_changed.connect(player._on_playback_state)
+    states = []
+    player.playback.state_changed.connect(lambda state, station: states.append(time.perf_counter()))
+    player.station_combo.setCurrentText(next(iter(player.NOISE_STATIONS)))
+
+    play, answer, pause = [], [], []
+    for _ in range(args.iterations // 20):
+        states.clear()
+        t0 = time.perf_counter()
+        player.toggle_playback()
+        t1 = time.perf_counter()
+        deadline = t1 + 2.0
+        while not states and time.perf_counter() < deadline:
+            app.processEvents()
+        if states:
+            answer.append(states[0] - t0)
+        play.append(t1 - t0)
+
+        t0 = time.perf_counter()
+        player.toggle_playback()
+        pause.append(time.perf_counter() - t0)
+        app.processEvents()
+    close_window(app, window)
+
+    play_p50, _ = percentiles(play)
+    answer_p50, answer_p95 = percentiles(answer)
+    pause_p50, _ = percentiles(pause)
+    return {
+        "play_ui_p50_us": play_p50,
+        "pause_ui_p50_us": pause_p50,
+        "play_answer_p50_us": answer_p50,
+        "play_answer_p95_us": answer_p95,
+    }
+
+
+CASES = {
+    "cold_start": case_cold_start,
+    "tick": case_tick,
+    "mode_switch": case_mode_switch,
+    "slider_drag": case_slider_drag,
+    "player": case_player,
+}
+
+
+def run(args):
+    from PySide6 import __version__ as pyside_version
+    from PySide6.QtWidgets import QApplication
+
+    names = args.only.split(",") if args.only else list(CASES)
+    unknown = [name for name in names if name not in CASES]
+    if unknown:
+        print(f"неизвестные случаи: {', '.join(unknown)}", file=sys.stderr)
+        return 2
+
+    os.environ["POMODORO_DATA_DIR"] = tempfile.mkdtemp(prefix="pomodoro-bench-")
+    app = QApplication.instance() or QApplication(sys.argv)
+
+    results = {}
+    for name in names:
+        t0 = time.perf_counter()
+        results[name] = CASES[name](app, args)
+        metrics = "  ".join(f"{key}={value:.1f}" for key, value in results[name].items())
+        print(f"{name:12} {metrics}  ({time.perf_counter() - t0:.1f} s)")
+
+    report = {
+        "meta": {
+            "created": time.strftime("%Y-%m-%dT%H:%M:%S"),
+            "python": platform.python_version(),
+            "pyside": pyside_version,
+            "platform": platform.platform(),
+            "qpa": os.environ["QT_QPA_PLATFORM"],
+            "iterations": args.iterations,
+            "warmup": args.warmup,
+        },
+        "results": results,
+    }
+    out = args.out
+    if out is None:
+        os.makedirs(RESULTS_DIR, exist_ok=True)
+        out = os.path.join(RESULTS_DIR, time.strftime("%Y%m%d-%H%M%S") + ".json")
+    with open(out, "w", encoding="utf-8") as f:
+        json.dump(report, f, indent=2)
+    print(f"results: {out}")
+    return 0
+
+
+def compare(args):
+    with open(args.base, encoding="utf-8") as f:
+        base = json.load(f)["results"]
+    with open(args.new, encoding="utf-8") as f:
+        new = json.load(f)["results"]
+
+    regressions = 0
+    print(f"{'metric':34} {'base':>10} {'new':>10} {'change':>8}")
+    for case, metrics in base.items():
+        for key, old in metrics.items():
+            value = new.get(case, {}).get(key)
+            if value is None or not old:
+                continue
+            change = (value - old) / old
+            # Для пропускной способности хуже - меньше; хвосты (p95) шумнее
+            # медиан, для них порог вдвое больше
+            worse = -change if key.endswith("_per_s") else change
+            threshold = args.threshold * 2 if "_p95" in key else args.threshold
+            flag = ""
+            if worse > threshold:
+                flag = "  REGRESSION"
+                regressions += 1
+            print(f"{case + '.' + key:34} {old:>10.1f} {value:>10.1f} {change:>+7.1%}{flag}")
+
+    print(f"{regressions} regression(s) beyond {args.threshold:.0%} (p95: {args.threshold * 2:.0%})")
+    return 1 if regressions else 0
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    run_parser = commands.add_parser("run", help="выполнить замеры и сохранить JSON")
+    run_parser.add_argument("--only", help="случаи через запятую: " + ",".join(CASES))
+    run_parser.add_argument("--iterations", type=int, default=2000)
+    run_parser.add_argument("--warmup", type=int, default=100, help="неучитываемых повторов в начале")
+    run_parser.add_argument("--runs", type=int, default=5, help="процессов для cold_start")
+    run_parser.add_argument("--out", help="файл результатов")
+
+    compare_parser = commands.add_parser("compare", help="сравнить два файла результатов")
+    compare_parser.add_argument("base")
+    compare_parser.add_argument("new")
+    compare_parser.add_argument("--threshold", type=float, default=0.15)
+
+    args = parser.parse_args()
+    return run(args) if args.command == "run" else compare(args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
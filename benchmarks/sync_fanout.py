@@ -0,0 +1,185 @@
+"""
+Нагрузочный тест сервера общих комнат: один процесс сервера и тысячи
+подключенных клиентов на localhost.
+
+Запускает `python main.py serve 127.0.0.1:0` отдельным процессом,
+подключает --clients клиентов (asyncio, у каждого свой TimerEngine) к
+одной комнате, и один участник --rounds раз меняет состояние (старт /
+пауза). Для каждой доставки меряется задержка от отправки до приема;
+печатаются перцентили по всем доставкам и время до последнего клиента
+в раунде, расхождение дедлайнов клиентов после раунда и память сервера.
+
+Запуск: python benchmarks/sync_fanout.py [--clients 10000] [--rounds 20]
+"""
+import argparse
+import asyncio
+import json
+import os
+import subprocess
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from src.core.engine import TimerEngine
+from src.core.sync import apply_state, encode, engine_state
+
+ROOM = "bench"
+
+
+class Client(asyncio.Protocol):
+    """
+    Клиент комнаты. В data_received только отмечается время приема:
+    разбор и применение к движку выполняются после раунда, иначе
+    10 тысяч клиентов в одном процессе меряли бы сами себя. Движок на
+    время применения видит часы, остановленные на моменте приема.
+    """
+    def __init__(self, deliveries):
+        self.engine = TimerEngine(clock=self.clock)
+        self.deliveries = deliveries
+        self.transport = None
+        self.joined = asyncio.get_running_loop().create_future()
+        self.pending = []
+        self._buffer = b""
+        self._frozen = None
+
+    def clock(self):
+        return self._frozen if self._frozen is not None else time.monotonic()
+
+    def connection_made(self, transport):
+        self.transport = transport
+        transport.write(encode({"type": "join", "room": ROOM}))
+
+    def data_received(self, data):
+        received = time.monotonic()
+        self._buffer += data
+        while b"\n" in self._buffer:
+            line, self._buffer = self._buffer.split(b"\n", 1)
+            if not self.joined.done():
+                self.joined.set_result(None)
+                continue
+            self.pending.append((received, line))
+            self.deliveries.append(received)
+
+    def apply_pending(self):
+        for received, line in self.pending:
+            self._frozen = received
+            apply_state(self.engine, json.loads(line))
+        self._frozen = None
+        self.pending.clear()
+
+
+def percentile(values, p):
+    values = sorted(values)
+    return values[min(len(values) - 1, int(len(values) * p / 100))]
+
+
+def raise_fd_limit(needed):
+    try:
+        import resource
+    except ImportError:
+        return
+    soft, hard = resource.getrlimit(resource.RLIMIT_NOFILE)
+    if soft < needed:
+        resource.setrlimit(resource.RLIMIT_NOFILE, (min(needed, hard), hard))
+
+
+def server_rss(pid):
+    try:
+        with open(f"/proc/{pid}/status") as f:
+            for line in f:
+                if line.startswith("VmRSS:"):
+                    return int(line.split()[1]) / 1024
+    except OSError:
+        return None
+
+
+async def run(args, port, pid):
+    loop = asyncio.get_running_loop()
+    deliveries = []
+
+    t0 = time.monotonic()
+    clients = []
+    for start in range(0, args.clients, args.batch):
+        batch = [
+            loop.create_connection(lambda: Client(deliveries), "127.0.0.1", port)
+            for _ in range(min(args.batch, args.clients - start))
+        ]
+        for _, client in await asyncio.gather(*batch):
+            clients.append(client)
+        await asyncio.gather(*(client.joined for client in clients[start:]))
+    connect_time = time.monotonic() - t0
+    rss = server_rss(pid)
+
+    publisher, receivers = clients[0], clients[1:]
+    latencies = []
+    last = []
+    spreads = []
+    for n in range(args.rounds):
+        if n % 2 == 0:
+            publisher.engine.start()
+        else:
+            publisher.engine.pause()
+        deliveries.clear()
+        sent = time.monotonic()
+        publisher.transport.write(encode(engine_state(publisher.engine)))
+
+        deadline = sent + 10.0
+        while len(deliveries) < len(receivers) and time.monotonic() < deadline:
+            await asyncio.sleep(0)
+        round_latencies = [received - sent for received in deliveries]
+        latencies.extend(round_latencies)
+        last.append(max(round_latencies))
+
+        for client in receivers:
+            client.apply_pending()
+        remaining = [client.engine.remaining() for client in clients]
+        if publisher.engine.is_running:
+            # Остаток у всех считается от одного дедлайна; сравниваем дедлайны
+            deadlines = [client.engine.deadline for client in clients]
+            spreads.append(max(deadlines) - min(deadlines))
+        else:
+            spreads.append(max(remaining) - min(remaining))
+        await asyncio.sleep(args.pause)
+
+    for client in clients:
+        client.transport.close()
+    return connect_time, rss, latencies, last, spreads
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--clients", type=int, default=10000)
+    parser.add_argument("--rounds", type=int, default=20)
+    parser.add_argument("--batch", type=int, default=500)
+    parser.add_argument("--pause", type=float, default=0.2)
+    args = parser.parse_args()
+
+    raise_fd_limit(args.clients + 256)
+    server = subprocess.Popen(
+        [sys.executable, "main.py", "serve", "127.0.0.1:0"],
+        cwd=ROOT, stdout=subprocess.PIPE, text=True,
+    )
+    try:
+        port = int(server.stdout.readline().strip().rpartition(":")[2])
+        connect_time, rss, latencies, last, spreads = asyncio.run(run(args, port, server.pid))
+    finally:
+        server.terminate()
+        server.wait()
+
+    expected = (args.clients - 1) * args.rounds
+    print(f"clients: {args.clients} in one room, server pid {server.pid}")
+    print(f"connect + join all:  {connect_time:8.2f} s")
+    if rss is not None:
+        print(f"server RSS:          {rss:8.1f} MB ({rss * 1024 / args.clients:.1f} KB per client)")
+    print(f"deliveries:          {len(latencies)} of {expected}")
+    for p in (50, 90, 99):
+        print(f"fan-out p{p}:         {percentile(latencies, p) * 1000:8.2f} ms")
+    print(f"fan-out max:         {max(latencies) * 1000:8.2f} ms")
+    print(f"last client, median: {percentile(last, 50) * 1000:8.2f} ms per round")
+    print(f"deadline spread:     {max(spreads) * 1000:8.2f} ms (max over rounds)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,90 @@
+"""
+Прогон таймера на поддельных часах: тысячи тиков с задержками и джиттером.
+
+Проверяет, что отображаемое время всегда совпадает с идеальным
+значением, вычисленным от момента старта, то есть дрейф равен нулю.
+
+Запуск: python benchmarks/timer_drift.py [--ticks 20000] [--seed 1]
+"""
+import argparse
+import math
+import os
+import random
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from PySide6.QtCore import QCoreApplication
+
+from src.core.timer import PomodoroTimer
+
+
+class FakeClock:
+    """Монотонные часы, которые двигаются только вручную."""
+
+    def __init__(self, start=1000.0):
+        self.now = start
+
+    def __call__(self):
+        return self.now
+
+    def advance(self, seconds):
+        self.now += seconds
+
+
+def replay(ticks, seed):
+    """Прогоняет ticks пробуждений и возвращает максимальный дрейф в секундах."""
+    rng = random.Random(seed)
+    clock = FakeClock()
+    duration = 25 * 60
+    timer = PomodoroTimer(duration, 5 * 60, clock=clock)
+
+    finished = []
+    timer.timer_finished.connect(lambda: finished.append(clock()))
+
+    started_at = clock()
+    timer.start()
+    max_drift = 0
+    sessions = 0
+
+    for _ in range(ticks):
+        # Обычный тик с джиттером, иногда длинный стопор цикла событий
+        roll = rng.random()
+        if roll < 0.01:
+            step = rng.uniform(5.0, 120.0)
+        elif roll < 0.05:
+            step = rng.uniform(1.0, 3.0)
+        else:
+            step = 1.0 + rng.uniform(-0.05, 0.05)
+        clock.advance(step)
+        timer._update_timer()
+
+        if finished:
+            # Сессия закончилась: стартуем следующую с нуля
+            sessions += 1
+            finished.clear()
+            duration = timer.WORK_TIME if timer.is_work_mode else timer.BREAK_TIME
+            started_at = clock()
+            timer.start()
+            continue
+
+        expected = max(0, math.ceil(duration - (clock() - started_at)))
+        max_drift = max(max_drift, abs(timer.time_left - expected))
+
+    return max_drift, sessions
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--ticks", type=int, default=20000)
+    parser.add_argument("--seed", type=int, default=1)
+    args = parser.parse_args()
+
+    app = QCoreApplication.instance() or QCoreApplication(sys.argv)
+    drift, sessions = replay(args.ticks, args.seed)
+    print(f"ticks={args.ticks} sessions={sessions} max_drift={drift}s")
+    return 0 if drift == 0 else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,105 @@
+"""
+Проверка сторожа цикла событий (src/core/watchdog.py).
+
+- В поток интерфейса подставляются блокирующие вызовы с узнаваемыми
+  именами (открытие VLC, показ уведомления, перерисовка стилей); в
+  журнале должен оказаться стек с именем виновника, меряется задержка
+  обнаружения и точность длительности.
+- Простой цикл событий с работающим таймером: ложных срабатываний быть
+  не должно, меряется цена отметок (доля процессорного времени).
+
+Запуск: python benchmarks/watchdog.py [--stall 600] [--idle 5]
+"""
+import argparse
+import os
+import sys
+import tempfile
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+from PySide6.QtCore import QEventLoop, QTimer
+from PySide6.QtWidgets import QApplication
+
+from src.core.engine import TimerEngine
+from src.core.watchdog import EventLoopWatchdog
+
+
+def fake_vlc_open(seconds):
+    time.sleep(seconds)
+
+
+def fake_notification_show(seconds):
+    time.sleep(seconds)
+
+
+def fake_restyle(seconds):
+    # Зависание на процессоре, а не в системном вызове
+    deadline = time.perf_counter() + seconds
+    while time.perf_counter() < deadline:
+        pass
+
+
+def spin(app, seconds):
+    loop = QEventLoop()
+    QTimer.singleShot(int(seconds * 1000), loop.quit)
+    loop.exec()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--stall", type=int, default=600, help="длительность зависания, мс")
+    parser.add_argument("--idle", type=float, default=5.0, help="секунд простоя для ложных срабатываний")
+    args = parser.parse_args()
+
+    app = QApplication.instance() or QApplication(sys.argv)
+    log_path = os.path.join(tempfile.mkdtemp(prefix="pomodoro-watchdog-"), "stalls.log")
+    engine = TimerEngine()
+    engine.start()
+    watchdog = EventLoopWatchdog(engine, log_path)
+    watchdog.set_active(True)
+    spin(app, 0.5)
+
+    stall = args.stall / 1000
+    print(f"{'culprit':24} {'found':>6} {'measured ms':>12} {'detected after ms':>18}")
+    for culprit in (fake_vlc_open, fake_notification_show, fake_restyle):
+        before = watchdog.count
+        size = os.path.getsize(log_path) if os.path.exists(log_path) else 0
+        QTimer.singleShot(0, lambda: culprit(stall))
+        spin(app, 0.5 + stall)
+        with open(log_path, encoding="utf-8") as f:
+            f.seek(size)
+            report = f.read()
+        found = culprit.__name__ in report
+        if watchdog.count == before:
+            print(f"{culprit.__name__:24} {'no':>6} {'-':>12} {'-':>18}")
+            continue
+        recorded = watchdog.stalls[-1]
+        # В первой записи длительность на момент обнаружения
+        detected = float(report.split("не отвечает ", 1)[1].split(" ", 1)[0]) + watchdog.interval * 1000
+        print(f"{culprit.__name__:24} {'yes' if found else 'no':>6} "
+              f"{recorded.duration * 1000 + watchdog.interval * 1000:>12.0f} {detected:>18.0f}")
+
+    # Простой: таймер идет, отметки идут, зависаний нет
+    before = watchdog.count
+    beats = watchdog.beats
+    cpu0 = time.process_time()
+    t0 = time.perf_counter()
+    spin(app, args.idle)
+    cpu = time.process_time() - cpu0
+    elapsed = time.perf_counter() - t0
+    print(f"idle {elapsed:.1f} s: {watchdog.count - before} false stalls, {watchdog.beats - beats} heartbeats, "
+          f"cpu {cpu / elapsed:.2%}")
+
+    watchdog.set_active(False)
+    beats = watchdog.beats
+    spin(app, 1.0)
+    print(f"inactive 1.0 s: {watchdog.beats - beats} heartbeats")
+    watchdog.close()
+    print(f"log: {log_path}")
+
+
+if __name__ == "__main__":
+    main()
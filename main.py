@@ -1,12 +1,5 @@
 import sys
-from PySide6.QtWidgets import QApplication
-from src.ui.main_window import MainWindow
+from src.cli import main
 
 if __name__ == "__main__":
-    app = QApplication(sys.argv)
-    app.setStyle("Fusion")
-
-    window = MainWindow()
-    window.show()
-
-    sys.exit(app.exec())
+    sys.exit(main(sys.argv))
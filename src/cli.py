@@ -0,0 +1,190 @@
+import json
+import os
+import sys
+
+# Здесь нельзя импортировать Qt: команды запущенному экземпляру
+# отправляются без загрузки интерфейса
+from .core.ipc import COMMANDS, AlreadyRunning, ControlServer, send_command
+from .core.paths import data_path
+from .core.state_block import STATE_FILE, read_state
+
+USAGE = """Использование:
+  main.py [start|pause|reset|show]     запустить приложение или передать ему команду
+          [--profile]                  с профилированием (как POMODORO_PROFILE=1)
+  main.py status [--json|--format FMT] состояние таймера из блока состояния
+  main.py ctl COMMAND                  передать команду запущенному экземпляру
+  main.py serve [[HOST:]PORT]          сервер общих комнат (порт 8765)
+  main.py pack-assets [--check]        собрать иконки в assets.pack
+                                       (--check: только проверить, что пакет свежий)
+
+Поля для --format: {display} {mode} {running} {time_left} {work_time} {break_time}"""
+
+# Команды, с которыми запускается новый экземпляр, если его еще нет
+LAUNCH_COMMANDS = ("show", "start")
+
+# Сколько ждать ответа экземпляра, который как раз запускается, с
+STARTUP_TIMEOUT = 10.0
+
+
+def _print_reply(command, reply):
+    if not reply.get("ok"):
+        print(reply.get("error", "ошибка"), file=sys.stderr)
+    elif command == "status":
+        mode = "работа" if reply["mode"] == "work" else "отдых"
+        state = "идет" if reply["running"] else "пауза"
+        print(f"{reply['display']} {mode}, {state}")
+
+
+def status(args):
+    """
+    Печатает состояние таймера. Читает блок состояния, который публикует
+    запущенный экземпляр, без обращения к нему; сокет - только запасной путь.
+    """
+    state = read_state(data_path(STATE_FILE))
+    if state is None:
+        try:
+            state = send_command("status")
+        except (OSError, ValueError):
+            print("Pomodoro Timer не запущен", file=sys.stderr)
+            return 1
+
+    if args[:1] == ["--json"]:
+        print(json.dumps(state, ensure_ascii=False))
+    elif args[:1] == ["--format"] and len(args) > 1:
+        try:
+            print(args[1].format(**state))
+        except (KeyError, IndexError, ValueError):
+            print(USAGE, file=sys.stderr)
+            return 2
+    else:
+        _print_reply("status", state)
+    return 0
+
+
+def ctl(args):
+    """Передает команду запущенному экземпляру, не запуская новый."""
+    if len(args) != 1 or args[0] not in COMMANDS:
+        print(USAGE, file=sys.stderr)
+        return 2
+    try:
+        reply = send_command(args[0])
+    except (OSError, ValueError):
+        print("Pomodoro Timer не запущен", file=sys.stderr)
+        return 1
+    _print_reply(args[0], reply)
+    return 0 if reply.get("ok") else 1
+
+
+def sync_server(args):
+    """Запускает сервер общих комнат до Ctrl+C."""
+    from .core.sync import DEFAULT_HOST, DEFAULT_PORT, serve
+
+    host, port = DEFAULT_HOST, DEFAULT_PORT
+    if args:
+        address, _, port_text = args[0].rpartition(":")
+        try:
+            port = int(port_text)
+        except ValueError:
+            print(USAGE, file=sys.stderr)
+            return 2
+        host = address or host
+
+    def ready(server):
+        print(f"Сервер комнат слушает {server.host}:{server.port}", flush=True)
+
+    serve(host, port, ready)
+    return 0
+
+
+def pack_assets(args):
+    """
+    Собирает иконки из каталога приложения в assets.pack. С --check
+    ничего не пишет: код 1, если пакета нет или иконки новее него.
+    """
+    from .core.asset_pack import APP_DIR, ASSET_FILES, PACK_FILE, pack_assets as pack, stale_assets
+
+    path = os.path.join(APP_DIR, PACK_FILE)
+    if "--check" in args:
+        stale = stale_assets(path)
+        if stale:
+            print(f"{path} устарел, пересоберите (main.py pack-assets): " + ", ".join(stale),
+                  file=sys.stderr)
+            return 1
+        print(f"{path}: пакет свежий")
+        return 0
+
+    packed = pack(path)
+    skipped = [name for name in ASSET_FILES if name not in packed]
+    print(f"{path}: {len(packed)} файлов, {os.path.getsize(path)} байт")
+    if skipped:
+        print("Пропущены (нет файла или он пустой): " + ", ".join(skipped), file=sys.stderr)
+    return 0
+
+
+def main(argv):
+    """Точка входа: пересылает команду запущенному экземпляру или запускает приложение."""
+    if "--profile" in argv:
+        # Профилировщик читает переменную при импорте интерфейса в launch()
+        argv = [arg for arg in argv if arg != "--profile"]
+        os.environ["POMODORO_PROFILE"] = "1"
+    command = argv[1] if len(argv) > 1 else "show"
+    if command == "status":
+        return status(argv[2:])
+    if command == "ctl":
+        return ctl(argv[2:])
+    if command == "serve":
+        return sync_server(argv[2:])
+    if command == "pack-assets":
+        return pack_assets(argv[2:])
+    if command not in COMMANDS:
+        print(USAGE, file=sys.stderr)
+        return 2
+
+    try:
+        reply = send_command(command)
+    except (OSError, ValueError):
+        reply = None
+
+    if reply is None and command in LAUNCH_COMMANDS:
+        server = ControlServer()
+        try:
+            server.listen()
+        except AlreadyRunning:
+            # Другой экземпляр успел запуститься одновременно с нами; он
+            # ответит, когда соберет окно и войдет в цикл событий
+            try:
+                reply = send_command(command, timeout=STARTUP_TIMEOUT)
+            except (OSError, ValueError):
+                print("Pomodoro Timer запускается и пока не отвечает", file=sys.stderr)
+                return 1
+        except OSError:
+            # Без сокета управления приложение все равно работает
+            server = None
+        if reply is None:
+            return launch(argv, command, server)
+
+    if reply is None:
+        print("Pomodoro Timer не запущен", file=sys.stderr)
+        return 1
+    _print_reply(command, reply)
+    return 0 if reply.get("ok") else 1
+
+
+def launch(argv, command, server=None):
+    """Запускает интерфейс; server - уже занятый сокет управления."""
+    from PySide6.QtWidgets import QApplication
+    from .ui.main_window import MainWindow
+
+    app = QApplication(argv)
+    app.setStyle("Fusion")
+
+    window = MainWindow(control=server)
+    window.show()
+    if command == "start":
+        window.handle_command("start")
+
+    try:
+        return app.exec()
+    finally:
+        if server is not None:
+            server.close()
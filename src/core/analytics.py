@@ -0,0 +1,338 @@
+import os
+import time
+import zlib
+
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+
+from .history.log import FLAG_COMPLETED, HEADER, MODE_WORK, RECORD_SIZE
+
+SECONDS_PER_DAY = 86400
+
+if NUMPY_AVAILABLE:
+    # Структурный тип, совпадающий с записью журнала сессий байт в байт
+    SESSION_DTYPE = np.dtype([
+        ("start", "<f8"),
+        ("end", "<f8"),
+        ("planned", "<u4"),
+        ("actual", "<u4"),
+        ("pauses", "<u2"),
+        ("mode", "u1"),
+        ("flags", "u1"),
+        ("crc", "<u4"),
+    ])
+    assert SESSION_DTYPE.itemsize == RECORD_SIZE
+    # actual, pauses, mode и flags одним little-endian словом
+    PACKED_DTYPE = np.dtype({
+        "names": ["packed"],
+        "formats": ["<u8"],
+        "offsets": [SESSION_DTYPE.fields["actual"][1]],
+        "itemsize": RECORD_SIZE,
+    })
+
+
+def local_utc_offset():
+    """Текущее смещение местного времени от UTC в секундах."""
+    return time.localtime().tm_gmtoff
+
+
+PAYLOAD_WORDS = (RECORD_SIZE - 4) // 2  # 16-битных слов в записи до контрольной суммы
+CRC_CHUNK = 1 << 16  # Записей за один проход проверки контрольных сумм
+
+_crc_tables = None
+
+
+def _payload_crc_tables():
+    """
+    Таблицы для crc32 данных записи сразу по всему массиву.
+
+    Для сообщений одной длины crc32 линейна над GF(2): контрольная сумма
+    записи - crc32 нулевых данных, xor вкладов каждого 16-битного слова
+    на его месте. Вклады отдельных битов считаются через zlib, а таблицы
+    на 65536 значений собираются из них xor-ами.
+    """
+    global _crc_tables
+    if _crc_tables is None:
+        size = PAYLOAD_WORDS * 2
+        empty = zlib.crc32(bytes(size))
+        bits = np.zeros((size, 8), np.uint32)
+        for position in range(size):
+            for bit in range(8):
+                data = bytearray(size)
+                data[position] = 1 << bit
+                bits[position, bit] = zlib.crc32(data) ^ empty
+        values = np.arange(256)
+        by_byte = np.zeros((size, 256), np.uint32)
+        for bit in range(8):
+            by_byte ^= np.where((values >> bit) & 1, bits[:, bit:bit + 1], 0).astype(np.uint32)
+        # Слово little-endian: младший байт - четная позиция
+        words = (by_byte[1::2, :, None] ^ by_byte[0::2, None, :]).reshape(PAYLOAD_WORDS, 65536)
+        _crc_tables = (words, np.uint32(empty))
+    return _crc_tables
+
+
+def _invalid_records(sessions):
+    """Номера записей, у которых контрольная сумма не сходится."""
+    tables, empty = _payload_crc_tables()
+    words = sessions.view(np.uint16).reshape(len(sessions), RECORD_SIZE // 2)
+    invalid = []
+    for first in range(0, len(sessions), CRC_CHUNK):
+        # Слова кусками по столбцам подряд: выборка из таблиц идет по плотной памяти
+        chunk = np.ascontiguousarray(words[first:first + CRC_CHUNK, :PAYLOAD_WORDS].T)
+        crc = tables[0].take(chunk[0])
+        for word in range(1, PAYLOAD_WORDS):
+            np.bitwise_xor(crc, tables[word].take(chunk[word]), out=crc)
+        crc ^= empty
+        invalid.append(np.flatnonzero(crc != sessions["crc"][first:first + CRC_CHUNK]) + first)
+    return np.concatenate(invalid) if invalid else np.zeros(0, np.intp)
+
+
+def _map_sessions(path):
+    """Журнал как структурный массив поверх numpy.memmap и os.stat файла."""
+    try:
+        stat = os.stat(path)
+    except FileNotFoundError:
+        return np.zeros(0, dtype=SESSION_DTYPE), None
+    count = max(0, stat.st_size - HEADER.size) // RECORD_SIZE
+    if count == 0:
+        return np.zeros(0, dtype=SESSION_DTYPE), stat
+    sessions = np.memmap(path, dtype=SESSION_DTYPE, mode="r", offset=HEADER.size, shape=(count,))
+    # Обычный ndarray поверх той же памяти: индексация memmap заметно медленнее
+    return sessions.view(np.ndarray), stat
+
+
+def load_sessions(path):
+    """
+    Отображает журнал сессий в память как структурный массив NumPy.
+
+    Файл не читается целиком: numpy.memmap подгружает страницы по мере
+    обращения. Оборванный хвост отбрасывается, записи с неверной
+    контрольной суммой - тоже, как при чтении через SessionLog.
+    Проверяются все записи; для повторных загрузок есть SessionLoader.
+    """
+    sessions, _ = _map_sessions(path)
+    invalid = _invalid_records(sessions) if len(sessions) else ()
+    return np.delete(sessions, invalid) if len(invalid) else sessions
+
+
+class SessionLoader:
+    """
+    Повторные загрузки одного журнала сессий (load_sessions с памятью).
+
+    Журнал только дописывается, поэтому проверенные записи запоминаются,
+    и при следующей загрузке контрольные суммы считаются лишь у нового
+    хвоста. Хранятся только число проверенных записей, байты последней
+    из них и номера битых - ни отображения файла, ни копий массива. Если
+    журнал подменили или обрезали (последняя проверенная запись не та),
+    он проверяется заново.
+    """
+    def __init__(self, path):
+        self.path = path
+        self._checked = None  # (файл, число записей, последняя запись, номера битых)
+
+    def load(self):
+        """Записи журнала без оборванного хвоста и битых записей."""
+        sessions, invalid = self._check()
+        # Битые записи - редкость, копия без них делается только тогда
+        return np.delete(sessions, invalid) if len(invalid) else sessions
+
+    def summary(self, now=None, utc_offset=None):
+        """Сводка по журналу; битые записи пропускаются без копии массива."""
+        sessions, invalid = self._check()
+        return summary(sessions, now, utc_offset, exclude=invalid)
+
+    def _check(self):
+        """Отображение журнала и номера битых записей в нем."""
+        sessions, stat = _map_sessions(self.path)
+        count = len(sessions)
+        if count == 0:
+            self._checked = None
+            return sessions, ()
+
+        identity = (stat.st_dev, stat.st_ino)
+        checked, invalid = 0, np.zeros(0, np.intp)
+        if self._checked is not None:
+            cached_identity, cached_count, last, cached_invalid = self._checked
+            # Последняя проверенная запись на месте - значит, начало журнала то же
+            if (cached_identity == identity and cached_count <= count
+                    and sessions[cached_count - 1].tobytes() == last):
+                checked, invalid = cached_count, cached_invalid
+        if checked < count:
+            invalid = np.concatenate((invalid, _invalid_records(sessions[checked:]) + checked))
+            self._checked = (identity, count, sessions[count - 1].tobytes(), invalid)
+        return sessions, invalid
+
+
+def _work_columns(sessions, utc_offset, exclude=()):
+    """
+    Выбирает рабочие сессии и раскладывает нужные поля по плотным массивам:
+    местный день, секунда дня, фактическая длительность, паузы, завершенность.
+    Записи с номерами из exclude (битые) пропускаются.
+    """
+    # Маска применяется к полям, а не к целым структурным записям: так
+    # копируются не все 32 байта. actual, pauses, mode и flags лежат
+    # подряд в восьми байтах и выбираются одним словом
+    work = sessions["mode"] == MODE_WORK
+    if len(exclude):
+        work[exclude] = False
+    packed = sessions.view(PACKED_DTYPE)["packed"][work]
+    # Целочисленное деление в разы быстрее деления чисел с плавающей точкой
+    local = (sessions["start"][work] + utc_offset).astype(np.int64)
+    days = local // SECONDS_PER_DAY
+    return {
+        "days": days,
+        "second_of_day": local - days * SECONDS_PER_DAY,
+        "actual": (packed & 0xFFFFFFFF).astype(np.float64),
+        "pauses": ((packed >> 32) & 0xFFFF).astype(np.int64),
+        "completed": ((packed >> 56) & FLAG_COMPLETED) != 0,
+    }
+
+
+def _dense_daily(columns):
+    """Суммы по дням плотным массивом от первого дня: (первый день, секунды)."""
+    days = columns["days"]
+    if len(days) == 0:
+        return 0, np.zeros(0)
+    first = int(days.min())
+    return first, np.bincount(days - first, weights=columns["actual"])
+
+
+def _daily(columns):
+    first, dense = _dense_daily(columns)
+    present = np.flatnonzero(np.bincount(columns["days"] - first)) if len(dense) else np.zeros(0, np.int64)
+    return present + first, dense[present]
+
+
+def _weekly(columns):
+    first, dense = _dense_daily(columns)
+    if len(dense) == 0:
+        return np.zeros(0, np.int64), np.zeros(0)
+    # 1 января 1970 года - четверг, сдвигаем так, чтобы неделя начиналась в понедельник
+    weeks = (np.arange(first, first + len(dense)) + 3) // 7
+    counts = np.bincount(columns["days"] - first, minlength=len(dense))
+    first_week = int(weeks[0])
+    totals = np.bincount(weeks - first_week, weights=dense)
+    present = np.flatnonzero(np.bincount(weeks - first_week, weights=counts))
+    return present + first_week, totals[present]
+
+
+def _hourly(columns):
+    hours = columns["second_of_day"] // 3600
+    return np.bincount(hours, weights=columns["actual"], minlength=24)
+
+
+def _streaks(columns, today):
+    days = columns["days"][columns["completed"]]
+    if len(days) == 0:
+        return 0, 0
+
+    # Плотная маска дней с завершенной сессией от первого до последнего дня
+    first = int(days.min())
+    active = np.bincount(days - first) > 0
+    # Границы серий - переходы маски 0 -> 1 и 1 -> 0
+    edges = np.flatnonzero(np.diff(np.concatenate(([False], active, [False])).astype(np.int8)))
+    lengths = edges[1::2] - edges[::2]
+    longest = int(lengths.max())
+
+    last = first + len(active) - 1
+    # Текущая серия жива, если последний день - сегодня или вчера
+    current = int(lengths[-1]) if today - last <= 1 else 0
+    return current, longest
+
+
+def _completion(columns):
+    completed = columns["completed"]
+    if len(completed) == 0:
+        return 0.0
+    return float(np.count_nonzero(completed)) / len(completed)
+
+
+def _interruptions(columns, bins):
+    return np.bincount(np.minimum(columns["pauses"], bins - 1), minlength=bins)
+
+
+def _today(now, utc_offset):
+    return int((now + utc_offset) // SECONDS_PER_DAY)
+
+
+def daily_totals(sessions, utc_offset=None):
+    """Суммарное время фокуса по дням: (дни, секунды)."""
+    if utc_offset is None:
+        utc_offset = local_utc_offset()
+    return _daily(_work_columns(sessions, utc_offset))
+
+
+def weekly_totals(sessions, utc_offset=None):
+    """Суммарное время фокуса по неделям (с понедельника): (недели, секунды)."""
+    if utc_offset is None:
+        utc_offset = local_utc_offset()
+    return _weekly(_work_columns(sessions, utc_offset))
+
+
+def hourly_totals(sessions, utc_offset=None):
+    """Время фокуса по часу начала сессии: массив из 24 значений в секундах."""
+    if utc_offset is None:
+        utc_offset = local_utc_offset()
+    return _hourly(_work_columns(sessions, utc_offset))
+
+
+def streaks(sessions, today=None, utc_offset=None):
+    """
+    Серии дней подряд с хотя бы одной завершенной рабочей сессией:
+    (текущая серия, самая длинная серия).
+    """
+    if utc_offset is None:
+        utc_offset = local_utc_offset()
+    if today is None:
+        today = _today(time.time(), utc_offset)
+    return _streaks(_work_columns(sessions, utc_offset), today)
+
+
+def completion_ratio(sessions):
+    """Доля рабочих сессий, доведенных до конца."""
+    return _completion(_work_columns(sessions, 0))
+
+
+def interruption_histogram(sessions, bins=10):
+    """
+    Гистограмма числа пауз в рабочих сессиях: элемент i - сколько
+    сессий с i паузами, последний элемент собирает bins-1 и больше.
+    """
+    return _interruptions(_work_columns(sessions, 0), bins)
+
+
+def summary(sessions, now=None, utc_offset=None, exclude=()):
+    """
+    Сводка для панели статистики; поля сессий разбираются один раз.
+    Гистограммы по часам и паузам сюда не входят - их панель не
+    показывает (см. hourly_totals и interruption_histogram).
+    exclude - номера записей, которые не учитываются (битые).
+    """
+    if now is None:
+        now = time.time()
+    if utc_offset is None:
+        utc_offset = local_utc_offset()
+    today = _today(now, utc_offset)
+    columns = _work_columns(sessions, utc_offset, exclude)
+
+    first, dense = _dense_daily(columns)
+    week_start = today - (today + 3) % 7
+    current, longest = _streaks(columns, today)
+
+    def total_since(day):
+        return float(dense[max(0, day - first):].sum())
+
+    today_total = float(dense[today - first]) if 0 <= today - first < len(dense) else 0.0
+
+    return {
+        "today": today_total,
+        "week": total_since(week_start) if len(dense) else 0.0,
+        "total": float(dense.sum()),
+        "sessions": int(len(columns["days"])),
+        "current_streak": current,
+        "longest_streak": longest,
+        "completion_ratio": _completion(columns),
+    }
@@ -0,0 +1,142 @@
+import os
+import struct
+
+# Каталог приложения: иконки ищутся здесь, а не в текущем каталоге
+APP_DIR = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+PACK_FILE = "assets.pack"
+
+# Файлы, которые входят в пакет
+ASSET_FILES = (
+    "pause.svg",
+    "play.svg",
+    "stop.svg",
+    "reset_icon.svg",
+    "settings_icon.svg",
+    "radio.png",
+    "title.png",
+)
+
+# Заголовок: сигнатура, версия формата, число файлов; затем оглавление
+# (длина имени, смещение и размер данных, имя) и данные подряд
+HEADER = struct.Struct("<4sHH")
+ENTRY = struct.Struct("<HII")
+MAGIC = b"PMAS"
+VERSION = 1
+
+
+def pack_assets(path, directory=APP_DIR, names=ASSET_FILES):
+    """
+    Собирает файлы в один пакет; пустые и отсутствующие пропускаются.
+    Возвращает список упакованных имен.
+    """
+    blobs = []
+    for name in names:
+        try:
+            with open(os.path.join(directory, name), "rb") as f:
+                data = f.read()
+        except OSError:
+            continue
+        if data:
+            blobs.append((name.encode("utf-8"), data))
+
+    offset = HEADER.size + sum(ENTRY.size + len(name) for name, _ in blobs)
+    index = []
+    for name, data in blobs:
+        index.append(ENTRY.pack(len(name), offset, len(data)) + name)
+        offset += len(data)
+
+    tmp = path + ".tmp"
+    with open(tmp, "wb") as f:
+        f.write(HEADER.pack(MAGIC, VERSION, len(blobs)))
+        f.write(b"".join(index))
+        for _, data in blobs:
+            f.write(data)
+    os.replace(tmp, path)
+    return [name.decode("utf-8") for name, _ in blobs]
+
+
+def stale_assets(path, directory=APP_DIR, names=ASSET_FILES):
+    """
+    Имена файлов, измененных после сборки пакета (без пакета - все
+    существующие). Пустой список - пакет собран из текущих файлов.
+    """
+    try:
+        built = os.stat(path).st_mtime_ns
+    except OSError:
+        built = None
+    stale = []
+    for name in names:
+        try:
+            modified = os.stat(os.path.join(directory, name)).st_mtime_ns
+        except OSError:
+            continue
+        if built is None or modified > built:
+            stale.append(name)
+    return stale
+
+
+class AssetPack:
+    """
+    Пакет ресурсов, прочитанный в память одним чтением файла.
+
+    Пакет собирается при упаковке приложения (main.py pack-assets) и в
+    репозитории не хранится. Без пакета (например, при запуске из
+    исходников) файлы читаются по одному из каталога приложения; файл,
+    измененный после сборки пакета, тоже читается с диска, а не из
+    пакета. Пустые файлы считаются отсутствующими.
+    """
+    def __init__(self, path=None, directory=APP_DIR):
+        self.directory = directory
+        self.path = path if path is not None else os.path.join(directory, PACK_FILE)
+        self._data = b""
+        self._index = {}
+        self._load()
+
+    @property
+    def packed(self):
+        return bool(self._index)
+
+    def names(self):
+        return list(self._index)
+
+    def get(self, name):
+        """Содержимое файла или None, если его нет ни в пакете, ни на диске."""
+        entry = self._index.get(name)
+        if entry is not None:
+            offset, size = entry
+            return self._data[offset:offset + size]
+        try:
+            with open(os.path.join(self.directory, name), "rb") as f:
+                return f.read() or None
+        except OSError:
+            return None
+
+    def _load(self):
+        try:
+            with open(self.path, "rb") as f:
+                data = f.read()
+            magic, version, count = HEADER.unpack_from(data, 0)
+        except (OSError, struct.error):
+            return
+        if magic != MAGIC or version != VERSION:
+            return
+
+        index = {}
+        position = HEADER.size
+        try:
+            for _ in range(count):
+                name_size, offset, size = ENTRY.unpack_from(data, position)
+                position += ENTRY.size
+                name = data[position:position + name_size].decode("utf-8")
+                position += name_size
+                if offset + size > len(data):
+                    return
+                index[name] = (offset, size)
+        except (struct.error, UnicodeDecodeError):
+            return
+        # Правка иконки не должна молча теряться из-за старого пакета
+        for name in stale_assets(self.path, self.directory, list(index)):
+            del index[name]
+        self._data = data
+        self._index = index
@@ -0,0 +1,205 @@
+import hashlib
+import mmap
+import os
+import struct
+import threading
+from collections import OrderedDict
+
+# Заголовок кольцевого файла: сигнатура, версия, емкость, всего записано байт
+RING_HEADER = struct.Struct("<4sIQQ")
+RING_MAGIC = b"PMAC"
+RING_VERSION = 1
+
+
+class RingBuffer:
+    """
+    Кольцевой буфер фиксированного размера в файле, отображенном в память.
+
+    Хранит последние capacity байт потока. Позиции считаются от начала
+    записи (written), поэтому читатель может идти за писателем по
+    абсолютному смещению, пока данные не перезаписаны.
+    """
+    def __init__(self, path, capacity):
+        self.path = path
+        exists = os.path.exists(path)
+        self._file = open(path, "r+b" if exists else "w+b")
+
+        if exists and os.path.getsize(path) >= RING_HEADER.size:
+            magic, version, stored_capacity, written = RING_HEADER.unpack(self._file.read(RING_HEADER.size))
+            if magic == RING_MAGIC and version == RING_VERSION and stored_capacity == capacity:
+                self.capacity = capacity
+                self.written = written
+            else:
+                # Чужой или старый формат - начинаем с пустого буфера
+                exists = False
+        if not exists or os.path.getsize(path) != RING_HEADER.size + capacity:
+            self.capacity = capacity
+            self.written = 0
+            self._file.truncate(RING_HEADER.size + capacity)
+
+        self._map = mmap.mmap(self._file.fileno(), RING_HEADER.size + capacity)
+        self._write_header()
+
+    @property
+    def start(self):
+        """Абсолютное смещение самого старого байта в буфере."""
+        return max(0, self.written - self.capacity)
+
+    def write(self, data):
+        """Дописывает данные, затирая самые старые."""
+        if len(data) > self.capacity:
+            self.written += len(data) - self.capacity
+            data = data[-self.capacity:]
+        pos = self.written % self.capacity
+        first = min(len(data), self.capacity - pos)
+        base = RING_HEADER.size
+        self._map[base + pos:base + pos + first] = data[:first]
+        if first < len(data):
+            self._map[base:base + len(data) - first] = data[first:]
+        self.written += len(data)
+        self._write_header()
+
+    def read(self, offset, size):
+        """Читает до size байт с абсолютного смещения offset."""
+        offset = max(offset, self.start)
+        size = min(size, self.written - offset)
+        if size <= 0:
+            return b""
+        pos = offset % self.capacity
+        first = min(size, self.capacity - pos)
+        base = RING_HEADER.size
+        data = self._map[base + pos:base + pos + first]
+        if first < size:
+            data += self._map[base:base + size - first]
+        return data
+
+    def tail(self, size):
+        """Последние size байт потока."""
+        return self.read(self.written - size, size)
+
+    def close(self):
+        self._map.close()
+        self._file.close()
+
+    def _write_header(self):
+        self._map[:RING_HEADER.size] = RING_HEADER.pack(RING_MAGIC, RING_VERSION, self.capacity, self.written)
+
+
+class AudioCache:
+    """
+    Дисковый кэш потоков радиостанций с вытеснением по LRU.
+
+    На каждую станцию - один RingBuffer размера ring_size. Суммарный
+    объем ограничен max_bytes: при открытии новой станции удаляются
+    кольца станций, которые дольше всех не использовались. Кольца
+    переживают перезапуск, порядок LRU восстанавливается по времени
+    изменения файлов.
+
+    Кольца открывает поток локального аудиосервера, а поток интерфейса
+    спрашивает has(), поэтому порядок LRU защищен блокировкой.
+    """
+    def __init__(self, directory, ring_size=4 * 1024 * 1024, max_bytes=64 * 1024 * 1024):
+        self.directory = directory
+        self.ring_size = ring_size
+        self.max_bytes = max_bytes
+        os.makedirs(directory, exist_ok=True)
+
+        self._lock = threading.Lock()
+        self._rings = OrderedDict()  # имя файла -> RingBuffer или None (не открыт)
+        files = [name for name in os.listdir(directory) if name.endswith(".ring")]
+        files.sort(key=lambda name: os.path.getmtime(os.path.join(directory, name)))
+        for name in files:
+            self._rings[name] = None
+
+        # Счетчики для оценки пользы кэша
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def ring(self, station):
+        """Кольцо станции; создается и вытесняет старые при необходимости."""
+        with self._lock:
+            return self._open(self._file_name(station))
+
+    def has(self, station):
+        """Есть ли у станции данные в кэше (в том числе с прошлого запуска)."""
+        name = self._file_name(station)
+        with self._lock:
+            if name not in self._rings:
+                return False
+            ring = self._rings[name]
+            if ring is not None:
+                return ring.written > 0
+            # Кольцо с прошлого запуска не открываем: достаточно заголовка
+            return self._stored_bytes(name) > 0
+
+    def cached(self, station):
+        """Кольцо станции с данными или None; счетчики попаданий обновляются."""
+        name = self._file_name(station)
+        with self._lock:
+            if name not in self._rings:
+                self.misses += 1
+                return None
+            ring = self._open(name)
+            if ring.written == 0:
+                self.misses += 1
+                return None
+            self.hits += 1
+            return ring
+
+    def stations_bytes(self):
+        """Сколько байт занимают все кольца на диске."""
+        with self._lock:
+            return len(self._rings) * (self.ring_size + RING_HEADER.size)
+
+    def close(self):
+        with self._lock:
+            for ring in self._rings.values():
+                if ring is not None:
+                    ring.close()
+            self._rings = OrderedDict((name, None) for name in self._rings)
+
+    def _stored_bytes(self, name):
+        """Сколько байт записано в неоткрытое кольцо по его заголовку."""
+        try:
+            with open(os.path.join(self.directory, name), "rb") as f:
+                header = f.read(RING_HEADER.size)
+        except OSError:
+            return 0
+        if len(header) < RING_HEADER.size:
+            return 0
+        magic, version, capacity, written = RING_HEADER.unpack(header)
+        if magic != RING_MAGIC or version != RING_VERSION or capacity != self.ring_size:
+            return 0
+        return written
+
+    def _open(self, name):
+        """Кольцо по имени файла; вызывается под блокировкой."""
+        if name in self._rings:
+            self._rings.move_to_end(name)
+            ring = self._rings[name]
+            if ring is not None:
+                return ring
+        self._evict(keep=name)
+        ring = RingBuffer(os.path.join(self.directory, name), self.ring_size)
+        self._rings[name] = ring
+        return ring
+
+    def _evict(self, keep):
+        size = self.ring_size + RING_HEADER.size
+        while self._rings and (len(self._rings) + (keep not in self._rings)) * size > self.max_bytes:
+            name = next(iter(self._rings))
+            if name == keep:
+                break
+            ring = self._rings.pop(name)
+            if ring is not None:
+                ring.close()
+            try:
+                os.remove(os.path.join(self.directory, name))
+            except OSError:
+                pass
+            self.evictions += 1
+
+    @staticmethod
+    def _file_name(station):
+        return hashlib.sha1(station.encode("utf-8")).hexdigest()[:16] + ".ring"
@@ -0,0 +1,256 @@
+import asyncio
+import ssl
+import threading
+from urllib.parse import quote, unquote, urljoin, urlsplit
+
+from .noise import NOISE_COLORS, SAMPLE_RATE, NoiseGenerator, wav_header
+from .stations import MAX_REDIRECTS, USER_AGENT, read_head
+
+DEFAULT_BITRATE = 128  # кбит/с, если станция не сообщает битрейт
+CHUNK_SECONDS = 0.1  # Шаг отправки при повторе из кэша и генерации шума
+
+
+class LocalAudioServer:
+    """
+    Локальный HTTP-сервер звука для плеера, работает в своем потоке.
+
+    /station/<имя> - прокси к потоку станции: данные идут плееру и
+    параллельно пишутся в кольцевой буфер AudioCache. Если поток оборвался
+    или не открывается, сервер, пока переподключается, проигрывает в
+    реальном темпе последние replay_seconds секунд из кэша, поэтому
+    соединение с плеером не рвется и тишины нет.
+
+    /noise/<цвет> - бесконечный WAV с шумом от NoiseGenerator, без сети.
+    """
+    def __init__(self, cache=None, host="127.0.0.1", port=0, timeout=5.0,
+                 reconnect_delay=1.0, replay_seconds=30):
+        self.cache = cache
+        self.host = host
+        self.port = port
+        self.timeout = timeout
+        self.reconnect_delay = reconnect_delay
+        self.replay_seconds = replay_seconds
+
+        self._upstreams = {}  # имя станции -> URL
+        self._content_types = {}  # имя станции -> Content-Type последнего ответа
+        self._ssl = ssl.create_default_context()
+        self._loop = None
+        self._server = None
+        self._thread = None
+        self.base_url = None
+
+        # Счетчики: переподключения и сколько секунд отыграно из кэша
+        self.reconnects = 0
+        self.replayed_seconds = 0.0
+
+    def start(self):
+        """Запускает сервер в фоновом потоке и возвращает базовый URL."""
+        if self.base_url is not None:
+            return self.base_url
+        ready = threading.Event()
+
+        def run():
+            self._loop = asyncio.new_event_loop()
+            self._server = self._loop.run_until_complete(
+                asyncio.start_server(self._handle, self.host, self.port)
+            )
+            self.port = self._server.sockets[0].getsockname()[1]
+            ready.set()
+            self._loop.run_forever()
+            self._loop.close()
+
+        self._thread = threading.Thread(target=run, name="audio-server", daemon=True)
+        self._thread.start()
+        ready.wait()
+        self.base_url = f"http://{self.host}:{self.port}"
+        return self.base_url
+
+    def stop(self):
+        """Останавливает сервер."""
+        if self._loop is None:
+            return
+        try:
+            asyncio.run_coroutine_threadsafe(self._shutdown(), self._loop).result(2.0)
+        except Exception:
+            pass
+        self._loop.call_soon_threadsafe(self._loop.stop)
+        self._thread.join(2.0)
+        self._loop = None
+        self.base_url = None
+
+    async def _shutdown(self):
+        """Закрывает сервер и отменяет обработку открытых соединений."""
+        self._server.close()
+        tasks = [task for task in asyncio.all_tasks() if task is not asyncio.current_task()]
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+    def station_url(self, station, upstream):
+        """Локальный адрес станции с кэшированием потока."""
+        self._upstreams[station] = upstream
+        return f"{self.start()}/station/{quote(station)}"
+
+    def noise_url(self, color):
+        """Локальный адрес генератора шума."""
+        return f"{self.start()}/noise/{color}"
+
+    def has_cached(self, station):
+        """Есть ли у станции данные в кэше."""
+        return self.cache is not None and self.cache.has(station)
+
+    async def _handle(self, reader, writer):
+        try:
+            request = (await reader.readline()).decode("latin-1")
+            while (await reader.readline()) not in (b"\r\n", b"\n", b""):
+                pass
+            kind, _, name = request.split(" ")[1].strip("/").partition("/")
+            name = unquote(name)
+
+            if kind == "noise" and name in NOISE_COLORS:
+                await self._serve_noise(writer, name)
+            elif kind == "station" and name in self._upstreams:
+                await self._serve_station(writer, name)
+            else:
+                writer.write(b"HTTP/1.0 404 Not Found\r\n\r\n")
+        except (ConnectionError, IndexError, UnicodeDecodeError):
+            pass
+        except asyncio.CancelledError:
+            # Остановка сервера - соединение просто закрывается
+            pass
+        finally:
+            writer.close()
+
+    async def _serve_noise(self, writer, color):
+        generator = NoiseGenerator(color)
+        writer.write(b"HTTP/1.0 200 OK\r\nContent-Type: audio/wav\r\n\r\n" + wav_header())
+        loop = asyncio.get_running_loop()
+        block_time = generator.block_size / SAMPLE_RATE
+        next_block = loop.time()
+        while True:
+            writer.write(generator.next_pcm())
+            await writer.drain()
+            # Держим запас около секунды, дальше идем в реальном темпе
+            next_block += block_time
+            await asyncio.sleep(max(0.0, next_block - loop.time() - 1.0))
+
+    async def _serve_station(self, writer, station):
+        # Кольцо заводится только после ответа станции: неудачная попытка
+        # не должна выглядеть как кэш, из которого можно играть
+        ring = self.cache.cached(station) if self.cache is not None else None
+        upstream = self._upstreams[station]
+        bitrate = DEFAULT_BITRATE
+        headers_sent = False
+        replay_from = None
+        delay = 0.0
+
+        connect = None
+        try:
+            while True:
+                connect = asyncio.ensure_future(self._open_upstream(upstream, delay))
+                # Пока идет подключение, проигрываем кэш (если он есть)
+                while not connect.done():
+                    if ring is None or ring.written == 0:
+                        await asyncio.wait([connect])
+                        break
+                    if not headers_sent:
+                        self._send_headers(writer, station)
+                        headers_sent = True
+                    if replay_from is None or replay_from >= ring.written:
+                        replay_from = max(ring.start, ring.written - bitrate * 125 * self.replay_seconds)
+                    size = int(bitrate * 125 * CHUNK_SECONDS)
+                    writer.write(ring.read(replay_from, size))
+                    replay_from += size
+                    self.replayed_seconds += CHUNK_SECONDS
+                    await writer.drain()
+                    await asyncio.wait([connect], timeout=CHUNK_SECONDS)
+
+                try:
+                    reader, upstream_writer, headers = connect.result()
+                except (OSError, ValueError, asyncio.TimeoutError, ssl.SSLError):
+                    if not headers_sent:
+                        # Ни сети, ни кэша - отдавать нечего
+                        writer.write(b"HTTP/1.0 502 Bad Gateway\r\n\r\n")
+                        return
+                    # Следующая попытка после паузы, кэш играет и во время нее
+                    delay = self.reconnect_delay
+                    self.reconnects += 1
+                    continue
+
+                replay_from = None
+                delay = 0.0
+                if ring is None and self.cache is not None:
+                    ring = self.cache.ring(station)
+                self._content_types[station] = headers.get("content-type", "audio/mpeg")
+                if headers.get("icy-br", "").isdigit():
+                    bitrate = int(headers["icy-br"])
+                if not headers_sent:
+                    self._send_headers(writer, station)
+                    headers_sent = True
+
+                try:
+                    while True:
+                        chunk = await asyncio.wait_for(reader.read(65536), self.timeout)
+                        if not chunk:
+                            break
+                        writer.write(chunk)
+                        if ring is not None:
+                            ring.write(chunk)
+                        await writer.drain()
+                except (OSError, asyncio.TimeoutError):
+                    if writer.is_closing():
+                        raise ConnectionError("плеер отключился")
+                finally:
+                    upstream_writer.close()
+                # Поток оборвался - переподключаемся, заполняя паузу кэшем
+                self.reconnects += 1
+        finally:
+            if connect is not None and not connect.done():
+                connect.cancel()
+
+    def _send_headers(self, writer, station):
+        content_type = self._content_types.get(station, "audio/mpeg")
+        writer.write(f"HTTP/1.0 200 OK\r\nContent-Type: {content_type}\r\n\r\n".encode("latin-1"))
+
+    async def _open_upstream(self, url, delay=0.0):
+        """Открывает поток станции (через delay секунд), следуя перенаправлениям."""
+        if delay:
+            await asyncio.sleep(delay)
+        for _ in range(MAX_REDIRECTS + 1):
+            parts = urlsplit(url)
+            scheme = parts.scheme or "http"
+            port = parts.port or (443 if scheme == "https" else 80)
+            path = parts.path or "/"
+            if parts.query:
+                path += "?" + parts.query
+
+            reader, writer = await asyncio.wait_for(
+                asyncio.open_connection(
+                    parts.hostname, port,
+                    ssl=self._ssl if scheme == "https" else None,
+                    server_hostname=parts.hostname if scheme == "https" else None,
+                ),
+                self.timeout,
+            )
+            writer.write(
+                f"GET {path} HTTP/1.1\r\n"
+                f"Host: {parts.netloc}\r\n"
+                f"User-Agent: {USER_AGENT}\r\n"
+                f"Connection: close\r\n\r\n".encode("latin-1")
+            )
+            try:
+                status, headers = await asyncio.wait_for(read_head(reader), self.timeout)
+            except BaseException:
+                writer.close()
+                raise
+
+            if status in (301, 302, 303, 307, 308) and "location" in headers:
+                writer.close()
+                url = urljoin(url, headers["location"])
+                continue
+            if status != 200:
+                writer.close()
+                raise ValueError(f"HTTP {status}")
+            return reader, writer, headers
+
+        raise ValueError("слишком много перенаправлений")
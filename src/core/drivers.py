@@ -0,0 +1,93 @@
+import threading
+
+
+class AsyncTimerDriver:
+    """
+    Драйвер TimerEngine поверх цикла событий asyncio.
+
+    Вместо корутины на каждый таймер использует loop.call_later, поэтому
+    один цикл держит тысячи таймеров. Движок нужно вызывать из потока
+    цикла (из других потоков - через loop.call_soon_threadsafe).
+    """
+    def __init__(self, engine, loop):
+        self.engine = engine
+        self.loop = loop
+        self._handle = None
+
+        self.engine.state_changed.connect(self._rearm)
+        self._rearm()
+
+    def close(self):
+        """Отключает драйвер от движка."""
+        self.engine.state_changed.disconnect(self._rearm)
+        self._cancel()
+
+    def _rearm(self):
+        """Перевзводит пробуждение по текущему дедлайну."""
+        self._cancel()
+        delay = self.engine.next_tick_delay()
+        if delay is not None:
+            self._handle = self.loop.call_later(delay, self._on_tick)
+
+    def _on_tick(self):
+        """Обработчик пробуждения."""
+        self._handle = None
+        self.engine.tick()
+        if self._handle is None:
+            self._rearm()
+
+    def _cancel(self):
+        """Отменяет запланированное пробуждение."""
+        if self._handle is not None:
+            self._handle.cancel()
+            self._handle = None
+
+
+class ThreadTimerDriver:
+    """
+    Драйвер TimerEngine в отдельном потоке.
+
+    Команды движку из других потоков передаются через call(), чтобы
+    они не пересекались с пробуждениями драйвера. Обработчики событий
+    движка вызываются из потока драйвера или из потока, вызвавшего call().
+    """
+    def __init__(self, engine):
+        self.engine = engine
+        self._cond = threading.Condition(threading.RLock())
+        self._stopped = False
+        self._thread = threading.Thread(target=self._run, name="timer-driver", daemon=True)
+
+        self.engine.state_changed.connect(self._wake)
+
+    def start(self):
+        """Запускает поток драйвера."""
+        self._thread.start()
+
+    def stop(self, timeout=None):
+        """Останавливает поток драйвера и ждет его завершения."""
+        with self._cond:
+            self._stopped = True
+            self._cond.notify()
+        if self._thread.is_alive():
+            self._thread.join(timeout)
+        self.engine.state_changed.disconnect(self._wake)
+
+    def call(self, func, *args):
+        """Выполняет метод движка под блокировкой драйвера."""
+        with self._cond:
+            return func(*args)
+
+    def _wake(self):
+        """Будит поток драйвера после изменения дедлайна."""
+        with self._cond:
+            self._cond.notify()
+
+    def _run(self):
+        """Основной цикл потока драйвера."""
+        with self._cond:
+            while not self._stopped:
+                delay = self.engine.next_tick_delay()
+                if self._cond.wait(delay):
+                    continue
+                if not self._stopped:
+                    self.engine.tick()
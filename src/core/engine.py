@@ -0,0 +1,236 @@
+import math
+import time
+
+
+class Event:
+    """
+    Простая замена Qt-сигнала для кода, который работает без Qt.
+    """
+    def __init__(self):
+        self._callbacks = []
+
+    def connect(self, callback):
+        """Подписывает обработчик на событие."""
+        self._callbacks.append(callback)
+
+    def disconnect(self, callback):
+        """Отписывает обработчик от события."""
+        try:
+            self._callbacks.remove(callback)
+        except ValueError:
+            pass
+
+    def emit(self, *args):
+        """Вызывает все подписанные обработчики."""
+        for callback in list(self._callbacks):
+            callback(*args)
+
+
+class TimerEngine:
+    """
+    Конечный автомат таймера помодоро без зависимостей от Qt.
+
+    Хранит абсолютный дедлайн по монотонным часам и сам не просыпается:
+    драйвер (Qt, asyncio или поток) спрашивает next_tick_delay() и
+    вызывает tick() в нужный момент. Методы не потокобезопасны, их
+    нужно вызывать из того же потока, что и драйвер.
+    """
+    def __init__(self, work_time=25 * 60, break_time=5 * 60, clock=time.monotonic):
+        self.WORK_TIME = work_time  # Время работы в секундах
+        self.BREAK_TIME = break_time  # Время отдыха в секундах
+
+        self.is_work_mode = True  # Текущий режим
+        self.is_running = False  # Состояние таймера
+
+        # События для оповещения об изменениях состояния
+        self.time_updated = Event()  # Обновление оставшегося времени
+        self.mode_changed = Event()  # Изменение режима (True - работа, False - отдых)
+        self.timer_finished = Event()  # Завершение таймера
+        self.state_changed = Event()  # Изменение дедлайна, нужно перевзвести драйвер
+        self.transition = Event()  # Переход автомата: имя команды
+
+        self._clock = clock
+        self._deadline = None  # Момент окончания по монотонным часам
+        self._remaining = float(self.WORK_TIME)  # Остаток, пока таймер стоит
+        self._last_emitted = self.time_left
+
+    @property
+    def time_left(self):
+        """Оставшееся время в целых секундах (с округлением вверх)."""
+        return max(0, math.ceil(self.remaining()))
+
+    @property
+    def deadline(self):
+        """Момент окончания по монотонным часам или None, если таймер стоит."""
+        return self._deadline
+
+    @property
+    def display_lag(self):
+        """На сколько секунд последнее показанное время отстает от действительного."""
+        if not self.is_running:
+            return 0
+        return max(0, self._last_emitted - self.time_left)
+
+    def remaining(self):
+        """Точный остаток времени в секундах."""
+        if self._deadline is None:
+            return self._remaining
+        return self._deadline - self._clock()
+
+    def start(self):
+        """Запускает таймер."""
+        if not self.is_running:
+            self._deadline = self._clock() + self._remaining
+            self.is_running = True
+            self.transition.emit("start")
+            self.state_changed.emit()
+
+    def pause(self):
+        """Приостанавливает таймер."""
+        if self.is_running:
+            self._remaining = max(0.0, self.remaining())
+            self._deadline = None
+            self.is_running = False
+            self.transition.emit("pause")
+            self.state_changed.emit()
+
+    def reset(self):
+        """Сбрасывает таймер в начальное состояние."""
+        self._stop()
+
+        if self.is_work_mode:
+            self._set_remaining(self.WORK_TIME)
+        else:
+            self._set_remaining(self.BREAK_TIME)
+
+        self._emit_time()
+        self.transition.emit("reset")
+        self.state_changed.emit()
+
+    def switch_mode(self):
+        """Переключает режим работы/отдых."""
+        self._stop()
+
+        # Переключаем режим
+        self.is_work_mode = not self.is_work_mode
+
+        # Устанавливаем время для нового режима
+        if self.is_work_mode:
+            self._set_remaining(self.WORK_TIME)
+        else:
+            self._set_remaining(self.BREAK_TIME)
+
+        # Оповещаем об изменении режима
+        self.mode_changed.emit(self.is_work_mode)
+        self._emit_time()
+        self.transition.emit("switch_mode")
+        self.state_changed.emit()
+
+    def set_work_time(self, minutes):
+        """Устанавливает время работы в минутах."""
+        self.WORK_TIME = minutes * 60
+        self.transition.emit("set_work_time")
+        if self.is_work_mode:
+            self._set_remaining(self.WORK_TIME)
+            self._emit_time()
+            self.state_changed.emit()
+
+    def set_break_time(self, minutes):
+        """Устанавливает время отдыха в минутах."""
+        self.BREAK_TIME = minutes * 60
+        self.transition.emit("set_break_time")
+        if not self.is_work_mode:
+            self._set_remaining(self.BREAK_TIME)
+            self._emit_time()
+            self.state_changed.emit()
+
+    def apply_state(self, is_work_mode, is_running, remaining, work_time=None, break_time=None):
+        """
+        Принимает состояние извне (например, от сервера комнаты).
+
+        remaining - точный остаток в секундах; у запущенного таймера
+        дедлайн отсчитывается от текущего момента. Переходы излучаются
+        так же, как при локальных командах, чтобы журнал сессий видел
+        старт, паузу и смену режима; простая подстройка дедлайна - "sync".
+        """
+        if work_time is not None:
+            self.WORK_TIME = work_time
+        if break_time is not None:
+            self.BREAK_TIME = break_time
+
+        mode_changed = is_work_mode != self.is_work_mode
+        running_changed = is_running != self.is_running
+        if mode_changed:
+            self._stop()
+            self.is_work_mode = is_work_mode
+
+        self._remaining = max(0.0, float(remaining))
+        self.is_running = is_running
+        self._deadline = self._clock() + self._remaining if is_running else None
+
+        if mode_changed:
+            self.mode_changed.emit(is_work_mode)
+            self.transition.emit("switch_mode")
+        self._emit_time()
+        if mode_changed:
+            if is_running:
+                self.transition.emit("start")
+        elif running_changed:
+            self.transition.emit("start" if is_running else "pause")
+        else:
+            self.transition.emit("sync")
+        self.state_changed.emit()
+
+    def refresh(self):
+        """Повторно отправляет событие с текущим оставшимся временем."""
+        self._emit_time()
+
+    def next_tick_delay(self):
+        """
+        Возвращает задержку в секундах до смены отображаемой секунды
+        или None, если таймер не запущен.
+        """
+        if not self.is_running:
+            return None
+        remaining = self.remaining()
+        if remaining <= 0:
+            return 0.0
+        delay = remaining - math.floor(remaining)
+        if delay <= 0:
+            delay = 1.0
+        return delay
+
+    def tick(self):
+        """Обрабатывает пробуждение драйвера."""
+        if not self.is_running:
+            return
+
+        if self.time_left != self._last_emitted:
+            self._emit_time()
+
+        if self.remaining() <= 0:
+            self.transition.emit("finish")
+            self.timer_finished.emit()
+            self.switch_mode()
+
+    def _set_remaining(self, seconds):
+        """Задает остаток времени; у запущенного таймера переносит дедлайн."""
+        self._remaining = float(seconds)
+        if self.is_running:
+            self._deadline = self._clock() + self._remaining
+
+    def _stop(self):
+        """Останавливает отсчет без сохранения остатка."""
+        self.is_running = False
+        self._deadline = None
+
+    def _emit_time(self):
+        """Отправляет событие с текущим оставшимся временем."""
+        self._last_emitted = self.time_left
+        self.time_updated.emit(self._last_emitted)
+
+    @staticmethod
+    def format_time(seconds):
+        """Форматирует секунды в строку MM:SS."""
+        m, s = divmod(seconds, 60)
+        return f"{m:02d}:{s:02d}"
@@ -0,0 +1,3 @@
+# История сессий: журнал только на дозапись с индексом по дням
+from .log import Session, SessionLog, MODE_WORK, MODE_BREAK, FLAG_COMPLETED
+from .recorder import SessionRecorder
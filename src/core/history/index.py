@@ -0,0 +1,93 @@
+import bisect
+import os
+import struct
+
+# Запись индекса: номер дня (UTC) и номер первой записи журнала за этот день
+ENTRY = struct.Struct("<iQ")
+
+SECONDS_PER_DAY = 86400
+
+
+def day_of(timestamp):
+    """Номер дня (UTC) для unix-времени."""
+    return int(timestamp // SECONDS_PER_DAY)
+
+
+class DayIndex:
+    """
+    Индекс журнала сессий по дням.
+
+    Хранится отдельным файлом только на дозапись: одна запись на каждый
+    новый день. Целиком держится в памяти (два списка), поиск - бисекцией.
+    """
+    def __init__(self, path):
+        self.path = path
+        self.days = []
+        self.firsts = []
+
+        self._file = open(path, "a+b")
+        self._load()
+
+    def __len__(self):
+        return len(self.days)
+
+    def note(self, day, record):
+        """Отмечает запись журнала; новый день добавляет в индекс."""
+        if self.days and day <= self.days[-1]:
+            return
+        self.days.append(day)
+        self.firsts.append(record)
+        self._file.write(ENTRY.pack(day, record))
+
+    def first_record(self, day, count):
+        """Номер первой записи за день day или позже."""
+        pos = bisect.bisect_left(self.days, day)
+        if pos == len(self.days):
+            return count
+        return self.firsts[pos]
+
+    def end_record(self, day, count):
+        """Номер записи, следующей за последней записью дня day."""
+        pos = bisect.bisect_right(self.days, day)
+        if pos == len(self.days):
+            return count
+        return self.firsts[pos]
+
+    def last_record(self):
+        """Номер первой записи за последний проиндексированный день."""
+        return self.firsts[-1]
+
+    def truncate_to(self, count):
+        """Удаляет записи индекса, указывающие за конец журнала."""
+        keep = bisect.bisect_left(self.firsts, count)
+        if keep != len(self.firsts):
+            del self.days[keep:]
+            del self.firsts[keep:]
+            self._file.truncate(keep * ENTRY.size)
+
+    def sync(self):
+        """Сбрасывает индекс на диск."""
+        self._file.flush()
+        os.fsync(self._file.fileno())
+
+    def close(self):
+        """Закрывает файл индекса."""
+        if not self._file.closed:
+            self._file.close()
+
+    def _load(self):
+        """Читает индекс, отбрасывая оборванную последнюю запись."""
+        f = self._file
+        f.seek(0)
+        data = f.read()
+        usable = len(data) - len(data) % ENTRY.size
+        if usable != len(data):
+            f.truncate(usable)
+
+        for day, first in ENTRY.iter_unpack(data[:usable]):
+            # Порядок нарушен - дальше индексу не доверяем, перестроим хвост
+            if self.days and (day <= self.days[-1] or first < self.firsts[-1]):
+                f.truncate(len(self.days) * ENTRY.size)
+                break
+            self.days.append(day)
+            self.firsts.append(first)
@@ -0,0 +1,198 @@
+import os
+import struct
+import time
+import zlib
+from collections import namedtuple
+
+from .index import DayIndex, day_of
+
+# Заголовок файла: сигнатура, версия формата, размер записи
+HEADER = struct.Struct("<4sHH")
+MAGIC = b"PMHL"
+VERSION = 1
+
+# Запись фиксированного размера (32 байта):
+# начало, конец (unix-время), план и факт (с), паузы, режим, флаги, CRC32
+RECORD = struct.Struct("<ddIIHBBI")
+RECORD_SIZE = RECORD.size
+_PAYLOAD = struct.Struct("<ddIIHBB")
+
+MODE_BREAK = 0
+MODE_WORK = 1
+FLAG_COMPLETED = 1
+
+
+class Session(namedtuple("Session", "start end mode planned actual pauses flags")):
+    """Завершенная (или прерванная) сессия работы или отдыха."""
+    __slots__ = ()
+
+    @property
+    def is_work(self):
+        return self.mode == MODE_WORK
+
+    @property
+    def completed(self):
+        return bool(self.flags & FLAG_COMPLETED)
+
+
+def pack_session(session):
+    """Упаковывает сессию в запись с контрольной суммой."""
+    payload = _PAYLOAD.pack(
+        session.start, session.end, session.planned, session.actual,
+        session.pauses, session.mode, session.flags,
+    )
+    return payload + struct.pack("<I", zlib.crc32(payload))
+
+
+def unpack_session(data, offset=0):
+    """Распаковывает запись; возвращает None, если контрольная сумма не сошлась."""
+    start, end, planned, actual, pauses, mode, flags, crc = RECORD.unpack_from(data, offset)
+    payload = data[offset:offset + _PAYLOAD.size]
+    if zlib.crc32(payload) != crc:
+        return None
+    return Session(start, end, mode, planned, actual, pauses, flags)
+
+
+class SessionLog:
+    """
+    Журнал сессий: двоичный файл только на дозапись.
+
+    Записи фиксированного размера с CRC32, поэтому оборванная последняя
+    запись после сбоя обнаруживается и отрезается при открытии. Каждая
+    запись сразу уходит в ОС (flush), и падение приложения ее не теряет;
+    fsync выполняется пачками (каждые sync_every записей или
+    sync_interval секунд). Рядом лежит индекс по дням (*.idx), по
+    которому выборка за период читает только нужный участок файла.
+    Записи предполагаются упорядоченными по времени начала.
+    """
+    def __init__(self, path, sync_every=64, sync_interval=1.0):
+        self.path = path
+        self.sync_every = sync_every
+        self.sync_interval = sync_interval
+
+        self._file = open(path, "a+b")
+        self._count = self._recover()
+        self._pending = 0
+        self._last_sync = time.monotonic()
+
+        self.index = DayIndex(path + ".idx")
+        self._sync_index()
+
+    def __len__(self):
+        return self._count
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def append(self, session):
+        """Дописывает сессию в журнал."""
+        session = Session(*session)
+        self._file.write(pack_session(session))
+        self._file.flush()
+        self.index.note(day_of(session.start), self._count)
+        self._count += 1
+        self._pending += 1
+
+        if (self._pending >= self.sync_every
+                or time.monotonic() - self._last_sync >= self.sync_interval):
+            self.sync()
+
+    def sync(self):
+        """Сбрасывает буферы журнала и индекса на диск."""
+        self._file.flush()
+        os.fsync(self._file.fileno())
+        self.index.sync()
+        self._pending = 0
+        self._last_sync = time.monotonic()
+
+    def close(self):
+        """Сохраняет несброшенные записи и закрывает файлы."""
+        if self._file.closed:
+            return
+        if self._pending:
+            self.sync()
+        self._file.close()
+        self.index.close()
+
+    def read(self, first=0, last=None):
+        """Читает записи с номерами [first, last), пропуская поврежденные."""
+        return [session for _, session in self._records(first, last) if session is not None]
+
+    def sessions(self, start=None, end=None):
+        """
+        Возвращает сессии, начавшиеся в интервале [start, end)
+        (unix-время). Читается только участок файла по индексу дней.
+        """
+        first = 0 if start is None else self.index.first_record(day_of(start), self._count)
+        last = self._count if end is None else self.index.end_record(day_of(end), self._count)
+
+        sessions = self.read(first, last)
+        if start is not None or end is not None:
+            lo = float("-inf") if start is None else start
+            hi = float("inf") if end is None else end
+            sessions = [s for s in sessions if lo <= s.start < hi]
+        return sessions
+
+    def _recover(self):
+        """Проверяет заголовок, отрезает оборванный хвост; возвращает число записей."""
+        f = self._file
+        f.seek(0, os.SEEK_END)
+        size = f.tell()
+
+        if size < HEADER.size:
+            # Новый файл (или оборванный заголовок) - пишем заголовок заново
+            f.truncate(0)
+            f.write(HEADER.pack(MAGIC, VERSION, RECORD_SIZE))
+            f.flush()
+            os.fsync(f.fileno())
+            return 0
+
+        f.seek(0)
+        magic, version, record_size = HEADER.unpack(f.read(HEADER.size))
+        if magic != MAGIC or version != VERSION or record_size != RECORD_SIZE:
+            raise ValueError(f"{self.path}: неизвестный формат журнала")
+
+        count = (size - HEADER.size) // RECORD_SIZE
+
+        # Отбрасываем записи с конца, пока не встретим целую
+        while count:
+            f.seek(HEADER.size + (count - 1) * RECORD_SIZE)
+            if unpack_session(f.read(RECORD_SIZE)) is not None:
+                break
+            count -= 1
+
+        valid_size = HEADER.size + count * RECORD_SIZE
+        if valid_size != size:
+            f.truncate(valid_size)
+            f.flush()
+            os.fsync(f.fileno())
+        return count
+
+    def _records(self, first, last):
+        """Возвращает пары (номер, сессия или None) для записей [first, last)."""
+        if last is None or last > self._count:
+            last = self._count
+        if first >= last:
+            return []
+
+        self._file.flush()
+        with open(self.path, "rb") as f:
+            f.seek(HEADER.size + first * RECORD_SIZE)
+            data = f.read((last - first) * RECORD_SIZE)
+
+        return [
+            (first + i, unpack_session(data, i * RECORD_SIZE))
+            for i in range(len(data) // RECORD_SIZE)
+        ]
+
+    def _sync_index(self):
+        """Согласует индекс с журналом после сбоя или потери индекса."""
+        self.index.truncate_to(self._count)
+        first = self.index.last_record() if len(self.index) else 0
+        for number, session in self._records(first, None):
+            if session is not None:
+                self.index.note(day_of(session.start), number)
+        self.index.sync()
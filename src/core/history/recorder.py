@@ -0,0 +1,83 @@
+import time
+
+from .log import FLAG_COMPLETED, MODE_BREAK, MODE_WORK
+
+
+class SessionRecorder:
+    """
+    Следит за переходами TimerEngine и пишет каждую сессию в журнал.
+
+    Сессия начинается с первого старта и заканчивается либо по дедлайну
+    (завершена), либо сбросом, сменой режима или изменением длительности
+    текущего режима (прервана). Паузы считаются, время на паузе в
+    фактическую длительность не входит.
+    """
+    def __init__(self, engine, log, wall_clock=time.time, clock=time.monotonic):
+        self.engine = engine
+        self.log = log
+        self._wall_clock = wall_clock
+        self._clock = clock
+
+        self._start = None  # Начало сессии (unix-время)
+        self._mode = MODE_WORK
+        self._planned = 0
+        self._actual = 0.0  # Накопленное время в работе
+        self._resumed_at = None  # Момент последнего старта по монотонным часам
+        self._pauses = 0
+
+        self.engine.transition.connect(self._on_transition)
+
+    def close(self):
+        """Отключается от движка."""
+        self.engine.transition.disconnect(self._on_transition)
+
+    def _on_transition(self, name):
+        """Обработчик перехода автомата таймера."""
+        if name == "start":
+            if self._start is None:
+                self._begin()
+            self._resumed_at = self._clock()
+        elif name == "pause":
+            self._accumulate()
+            self._pauses += 1
+        elif name == "finish":
+            self._finish(completed=True)
+        elif name in ("reset", "switch_mode"):
+            self._finish(completed=False)
+        elif name == "set_work_time" and self._mode == MODE_WORK:
+            self._finish(completed=False)
+        elif name == "set_break_time" and self._mode == MODE_BREAK:
+            self._finish(completed=False)
+
+    def _begin(self):
+        """Открывает новую сессию."""
+        self._start = self._wall_clock()
+        self._mode = MODE_WORK if self.engine.is_work_mode else MODE_BREAK
+        self._planned = self.engine.WORK_TIME if self.engine.is_work_mode else self.engine.BREAK_TIME
+        self._actual = 0.0
+        self._pauses = 0
+
+    def _accumulate(self):
+        """Добавляет отрезок с последнего старта к фактическому времени."""
+        if self._resumed_at is not None:
+            self._actual += self._clock() - self._resumed_at
+            self._resumed_at = None
+
+    def _finish(self, completed):
+        """Закрывает текущую сессию и пишет ее в журнал."""
+        if self._start is None:
+            return
+        self._accumulate()
+
+        actual = min(round(self._actual), self._planned) if completed else round(self._actual)
+        if actual > 0:
+            self.log.append((
+                self._start,
+                self._wall_clock(),
+                self._mode,
+                self._planned,
+                actual,
+                min(self._pauses, 0xFFFF),
+                FLAG_COMPLETED if completed else 0,
+            ))
+        self._start = None
@@ -0,0 +1,248 @@
+import json
+import os
+import socket
+import sys
+import time
+from contextlib import contextmanager
+
+try:
+    import fcntl
+    FCNTL_AVAILABLE = True
+except ImportError:
+    FCNTL_AVAILABLE = False
+
+from .paths import data_dir
+
+# Команды, которые принимает запущенный экземпляр
+COMMANDS = ("start", "pause", "reset", "show", "status")
+
+SOCKET_NAME = "control.sock"
+PORT_FILE = "control.port"
+LOCK_FILE = "control.lock"
+
+# Предел длины пути AF_UNIX (sun_path) на Linux и macOS
+MAX_UNIX_PATH = 100
+
+
+def use_unix_socket():
+    return hasattr(socket, "AF_UNIX") and sys.platform != "win32"
+
+
+def socket_path():
+    """Путь сокета управления; для слишком длинного каталога данных - во временном каталоге."""
+    path = os.path.join(data_dir(), SOCKET_NAME)
+    if len(path) > MAX_UNIX_PATH:
+        import tempfile
+        path = os.path.join(tempfile.gettempdir(), f"pomodoro-{os.getuid()}.sock")
+    return path
+
+
+def port_path():
+    """Файл с номером TCP-порта управления (Windows)."""
+    return os.path.join(data_dir(), PORT_FILE)
+
+
+def lock_path():
+    """Файл блокировки, под которой экземпляр занимает адрес управления."""
+    return os.path.join(data_dir(), LOCK_FILE)
+
+
+@contextmanager
+def _listen_lock():
+    """
+    Исключительная блокировка (flock) на время проверки и захвата адреса:
+    два одновременно запущенных экземпляра не могут оба решить, что
+    сокет остался от упавшего процесса. Без fcntl (Windows) - без блокировки.
+    """
+    if not FCNTL_AVAILABLE:
+        yield
+        return
+    os.makedirs(os.path.dirname(lock_path()), exist_ok=True)
+    fd = os.open(lock_path(), os.O_RDWR | os.O_CREAT, 0o600)
+    try:
+        fcntl.flock(fd, fcntl.LOCK_EX)
+        yield
+    finally:
+        # Закрытие дескриптора снимает блокировку
+        os.close(fd)
+
+
+def _connect(timeout):
+    if use_unix_socket():
+        sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        address = socket_path()
+    else:
+        with open(port_path(), encoding="ascii") as f:
+            address = ("127.0.0.1", int(f.read().strip()))
+        sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+    sock.settimeout(timeout)
+    try:
+        sock.connect(address)
+    except BaseException:
+        sock.close()
+        raise
+    return sock
+
+
+def send_command(command, timeout=1.0):
+    """
+    Отправляет команду запущенному экземпляру и возвращает его ответ.
+
+    OSError (в том числе ConnectionRefusedError и FileNotFoundError)
+    означает, что экземпляр не запущен.
+    """
+    with _connect(timeout) as sock:
+        sock.sendall(command.encode("utf-8") + b"\n")
+        data = b""
+        while not data.endswith(b"\n"):
+            chunk = sock.recv(4096)
+            if not chunk:
+                break
+            data += chunk
+    if not data:
+        raise ConnectionError("экземпляр закрыл соединение без ответа")
+    return json.loads(data)
+
+
+class ControlServer:
+    """
+    Сокет управления единственного экземпляра.
+
+    listen() занимает адрес: AF_UNIX-сокет в каталоге данных или, в
+    Windows, TCP-порт на 127.0.0.1, записанный в файл. Если адрес занят
+    живым экземпляром, выбрасывается AlreadyRunning; сокет, оставшийся
+    от упавшего процесса, удаляется.
+
+    Сокет и принятые соединения неблокирующие, поток владельца (поток
+    интерфейса) на них не ждет. Владелец следит за fileno() (например,
+    через QSocketNotifier) и вызывает handle_pending(); соединения, чья
+    команда пришла не целиком, перечислены в waiting() - за ними
+    владелец следит так же и вызывает handle_client(), а раз в timeout
+    секунд - expire(). Каждое соединение - одна команда строкой и один
+    ответ JSON строкой; handler(команда) возвращает словарь ответа.
+    """
+    def __init__(self, handler=None, timeout=0.5):
+        self.handler = handler
+        self.timeout = timeout
+        self._sock = None
+        self._path = None
+        self._clients = {}  # дескриптор -> [соединение, прочитанные байты, срок]
+
+    def listen(self):
+        with _listen_lock():
+            if use_unix_socket():
+                self._path = socket_path()
+                sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+                try:
+                    sock.bind(self._path)
+                except OSError:
+                    if self._alive():
+                        sock.close()
+                        raise AlreadyRunning()
+                    # Сокет остался от упавшего процесса
+                    os.unlink(self._path)
+                    sock.bind(self._path)
+            else:
+                if self._alive():
+                    raise AlreadyRunning()
+                sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+                sock.bind(("127.0.0.1", 0))
+                self._path = port_path()
+                with open(self._path, "w", encoding="ascii") as f:
+                    f.write(str(sock.getsockname()[1]))
+
+            sock.listen(8)
+        sock.setblocking(False)
+        self._sock = sock
+        return self
+
+    def fileno(self):
+        return self._sock.fileno()
+
+    def waiting(self):
+        """Дескрипторы соединений, которые еще не прислали команду целиком."""
+        return list(self._clients)
+
+    def handle_pending(self):
+        """
+        Принимает все ожидающие соединения и отвечает тем, чья команда
+        уже пришла; возвращает число отправленных ответов.
+        """
+        handled = 0
+        while True:
+            try:
+                conn, _ = self._sock.accept()
+            except (BlockingIOError, InterruptedError):
+                return handled
+            conn.setblocking(False)
+            self._clients[conn.fileno()] = [conn, b"", time.monotonic() + self.timeout]
+            handled += self.handle_client(conn.fileno())
+
+    def handle_client(self, fd):
+        """Дочитывает команду соединения без ожидания; возвращает 1, если ответ отправлен."""
+        client = self._clients.get(fd)
+        if client is None:
+            return 0
+        conn, data, _ = client
+        try:
+            while not data.endswith(b"\n") and len(data) < 1024:
+                chunk = conn.recv(1024)
+                if not chunk:
+                    break
+                data += chunk
+        except (BlockingIOError, InterruptedError):
+            client[1] = data
+            return 0
+        except OSError:
+            self._drop(fd)
+            return 0
+
+        try:
+            self._reply(conn, data)
+        except OSError:
+            pass
+        self._drop(fd)
+        return 1
+
+    def expire(self):
+        """Закрывает соединения, не приславшие команду за timeout секунд."""
+        now = time.monotonic()
+        for fd, (_, _, deadline) in list(self._clients.items()):
+            if now >= deadline:
+                self._drop(fd)
+
+    def close(self):
+        if self._sock is None:
+            return
+        for fd in list(self._clients):
+            self._drop(fd)
+        self._sock.close()
+        self._sock = None
+        try:
+            os.unlink(self._path)
+        except OSError:
+            pass
+
+    def _drop(self, fd):
+        self._clients.pop(fd)[0].close()
+
+    def _reply(self, conn, data):
+        command = data.decode("utf-8", "replace").strip()
+
+        if command not in COMMANDS:
+            reply = {"ok": False, "error": f"неизвестная команда: {command}"}
+        else:
+            reply = self.handler(command)
+        # Ответ в несколько сотен байт целиком помещается в буфер сокета
+        conn.sendall(json.dumps(reply, ensure_ascii=False).encode("utf-8") + b"\n")
+
+    def _alive(self):
+        try:
+            _connect(self.timeout).close()
+        except (OSError, ValueError):
+            return False
+        return True
+
+
+class AlreadyRunning(Exception):
+    """Адрес управления занят другим запущенным экземпляром."""
@@ -0,0 +1,300 @@
+import json
+import os
+import struct
+import time
+import zlib
+from collections import namedtuple
+
+JOURNAL_FILE = "timer.journal"
+
+# Заголовок файла: сигнатура, версия формата, размер записи
+HEADER = struct.Struct("<4sHH")
+MAGIC = b"PMEV"
+VERSION = 1
+
+# Событие (28 байт): время (unix), вид, аргумент (длительность, флаги
+# sync), остаток после перехода (с), CRC32
+RECORD = struct.Struct("<dB3xIdI")
+RECORD_SIZE = RECORD.size
+_PAYLOAD = struct.Struct("<dB3xId")
+
+# Виды событий - имена переходов TimerEngine
+KINDS = ("start", "pause", "reset", "switch_mode", "set_work_time", "set_break_time", "finish", "sync")
+KIND_CODES = {name: code for code, name in enumerate(KINDS)}
+
+# Флаги аргумента события sync
+SYNC_WORK = 1
+SYNC_RUNNING = 2
+
+# Снимок пишется каждые столько событий, поэтому при восстановлении
+# повторяется не больше SNAPSHOT_EVERY событий
+SNAPSHOT_EVERY = 1000
+
+# После этих событий журнал сразу сбрасывается на диск (fsync)
+SYNC_KINDS = ("start", "finish")
+
+
+class Event(namedtuple("Event", "time kind arg value")):
+    """Переход таймера: время (unix), вид, аргумент и остаток после перехода."""
+    __slots__ = ()
+
+
+class TimerState(namedtuple("TimerState", "work_time break_time is_work_mode is_running remaining deadline")):
+    """
+    Состояние таймера, восстановленное из журнала. deadline - unix-время
+    окончания у запущенного таймера, remaining - остаток у остановленного.
+    """
+    __slots__ = ()
+
+    def remaining_at(self, now):
+        """Остаток на момент now (unix-время)."""
+        if self.is_running:
+            return max(0.0, self.deadline - now)
+        return self.remaining
+
+
+def initial_state(work_time=25 * 60, break_time=5 * 60):
+    return TimerState(work_time, break_time, True, False, float(work_time), None)
+
+
+def apply_event(state, event):
+    """Применяет событие к состоянию и возвращает новое состояние."""
+    t, kind, arg, value = event
+    name = KINDS[kind]
+    if name == "start":
+        return state._replace(is_running=True, remaining=value, deadline=t + value)
+    if name in ("pause", "reset"):
+        return state._replace(is_running=False, remaining=value, deadline=None)
+    if name == "switch_mode":
+        return state._replace(is_work_mode=not state.is_work_mode, is_running=False, remaining=value, deadline=None)
+    if name in ("set_work_time", "set_break_time"):
+        is_work = name == "set_work_time"
+        state = state._replace(**{"work_time" if is_work else "break_time": arg})
+        if state.is_work_mode != is_work:
+            return state
+        return state._replace(remaining=float(arg), deadline=t + arg if state.is_running else None)
+    if name == "sync":
+        running = bool(arg & SYNC_RUNNING)
+        return state._replace(
+            is_work_mode=bool(arg & SYNC_WORK), is_running=running,
+            remaining=value, deadline=t + value if running else None,
+        )
+    # finish сам по себе состояние не меняет, за ним следует switch_mode
+    return state
+
+
+def replay(state, events):
+    """Сворачивает последовательность событий в состояние."""
+    for event in events:
+        state = apply_event(state, event)
+    return state
+
+
+def pack_event(event):
+    payload = _PAYLOAD.pack(*event)
+    return payload + struct.pack("<I", zlib.crc32(payload))
+
+
+def unpack_event(data, offset=0):
+    """Распаковывает событие; возвращает None, если контрольная сумма не сошлась."""
+    t, kind, arg, value, crc = RECORD.unpack_from(data, offset)
+    if zlib.crc32(data[offset:offset + _PAYLOAD.size]) != crc or kind >= len(KINDS):
+        return None
+    return Event(t, kind, arg, value)
+
+
+class TimerJournal:
+    """
+    Журнал переходов таймера с периодическими снимками.
+
+    Каждый переход TimerEngine (старт, пауза, сброс, смена режима,
+    изменение длительности, внешнее состояние комнаты) дописывается
+    записью фиксированного размера с CRC32, как в журнале сессий. Каждые
+    snapshot_every событий состояние целиком сохраняется в снимок
+    (*.snap, атомарная замена) вместе с номером события, на котором он
+    сделан.
+
+    recover() читает снимок и повторяет только хвост журнала после него,
+    поэтому время восстановления ограничено snapshot_every событиями при
+    любой длине истории. Поврежденный снимок не страшен: тогда журнал
+    повторяется целиком.
+
+    Переходы пишутся в потоке интерфейса, поэтому fsync идет пачками, как
+    в журнале сессий. Каждое событие сразу уходит в ОС (write), и
+    падение приложения его не теряет. На диск журнал сбрасывается после
+    событий sync_kinds (старт и окончание), каждые sync_every событий или
+    sync_interval секунд и при закрытии. При отключении питания могут
+    пропасть события после последнего fsync - пауза, сброс, подстройка
+    под комнату; тогда восстановится состояние на момент последнего старта.
+    """
+    def __init__(self, path, snapshot_every=SNAPSHOT_EVERY, sync_every=64, sync_interval=1.0,
+                 sync_kinds=SYNC_KINDS, wall_clock=time.time, work_time=25 * 60, break_time=5 * 60):
+        self.path = path
+        self.snapshot_path = path + ".snap"
+        self.snapshot_every = snapshot_every
+        self.sync_every = sync_every
+        self.sync_interval = sync_interval
+        self._sync_codes = frozenset(KIND_CODES[name] for name in sync_kinds)
+        self._wall_clock = wall_clock
+        self._initial = initial_state(work_time, break_time)
+
+        self._file = open(path, "a+b")
+        self._count = self._recover_file()
+        self._pending = 0
+        self._last_sync = time.monotonic()
+        self.engine = None
+
+        # Состояние после последнего записанного события и номер события снимка
+        self.replayed = 0
+        self.state, self._snapshot_count = self._load()
+
+    def __len__(self):
+        return self._count
+
+    def recover(self):
+        """Состояние после последнего события или None, если журнал пуст."""
+        return self.state if self._count else None
+
+    def attach(self, engine):
+        """Начинает записывать переходы движка."""
+        self.engine = engine
+        engine.transition.connect(self._on_transition)
+
+    def append(self, event):
+        """Дописывает событие и обновляет состояние."""
+        event = Event(*event)
+        self._file.write(pack_event(event))
+        self._file.flush()
+        self._count += 1
+        self._pending += 1
+        self.state = apply_event(self.state, event)
+
+        if (event.kind in self._sync_codes or self._pending >= self.sync_every
+                or time.monotonic() - self._last_sync >= self.sync_interval):
+            self.sync()
+        if self._count - self._snapshot_count >= self.snapshot_every:
+            self.snapshot()
+
+    def sync(self):
+        """Сбрасывает буферы журнала на диск."""
+        self._file.flush()
+        os.fsync(self._file.fileno())
+        self._pending = 0
+        self._last_sync = time.monotonic()
+
+    def snapshot(self):
+        """Сохраняет текущее состояние в снимок."""
+        if self._pending:
+            self.sync()
+        tmp = self.snapshot_path + ".tmp"
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump({"version": VERSION, "events": self._count, "state": self.state._asdict()}, f)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp, self.snapshot_path)
+        self._snapshot_count = self._count
+
+    def close(self):
+        """Отключается от движка, пишет снимок и закрывает журнал."""
+        if self._file.closed:
+            return
+        if self.engine is not None:
+            self.engine.transition.disconnect(self._on_transition)
+            self.engine = None
+        if self._count != self._snapshot_count:
+            self.snapshot()
+        self._file.close()
+
+    def _on_transition(self, name):
+        engine = self.engine
+        now = self._wall_clock()
+        # Длительности из состояния комнаты приходят без своего перехода
+        if name != "set_work_time" and engine.WORK_TIME != self.state.work_time:
+            self.append((now, KIND_CODES["set_work_time"], engine.WORK_TIME, 0.0))
+        if name != "set_break_time" and engine.BREAK_TIME != self.state.break_time:
+            self.append((now, KIND_CODES["set_break_time"], engine.BREAK_TIME, 0.0))
+
+        arg = 0
+        if name == "set_work_time":
+            arg = engine.WORK_TIME
+        elif name == "set_break_time":
+            arg = engine.BREAK_TIME
+        elif name == "sync":
+            arg = (SYNC_WORK if engine.is_work_mode else 0) | (SYNC_RUNNING if engine.is_running else 0)
+        self.append((now, KIND_CODES[name], arg, max(0.0, engine.remaining())))
+
+    def _load(self):
+        """Снимок плюс повтор хвоста; возвращает (состояние, номер события снимка)."""
+        state, first = self._initial, 0
+        try:
+            with open(self.snapshot_path, encoding="utf-8") as f:
+                snapshot = json.load(f)
+            if snapshot["version"] == VERSION and 0 <= snapshot["events"] <= self._count:
+                state, first = TimerState(**snapshot["state"]), snapshot["events"]
+        except (OSError, ValueError, KeyError, TypeError):
+            pass
+
+        events = self.read(first)
+        self.replayed = len(events)
+        return replay(state, events), first
+
+    def read(self, first=0, last=None):
+        """Читает события с номерами [first, last), пропуская поврежденные."""
+        if last is None or last > self._count:
+            last = self._count
+        if first >= last:
+            return []
+
+        self._file.flush()
+        with open(self.path, "rb") as f:
+            f.seek(HEADER.size + first * RECORD_SIZE)
+            data = f.read((last - first) * RECORD_SIZE)
+
+        events = (unpack_event(data, offset) for offset in range(0, len(data) - RECORD_SIZE + 1, RECORD_SIZE))
+        return [event for event in events if event is not None]
+
+    def _recover_file(self):
+        """Проверяет заголовок, отрезает оборванный хвост; возвращает число событий."""
+        f = self._file
+        f.seek(0, os.SEEK_END)
+        size = f.tell()
+
+        if size < HEADER.size:
+            f.truncate(0)
+            f.write(HEADER.pack(MAGIC, VERSION, RECORD_SIZE))
+            f.flush()
+            os.fsync(f.fileno())
+            return 0
+
+        f.seek(0)
+        magic, version, record_size = HEADER.unpack(f.read(HEADER.size))
+        if magic != MAGIC or version != VERSION or record_size != RECORD_SIZE:
+            raise ValueError(f"{self.path}: неизвестный формат журнала")
+
+        count = (size - HEADER.size) // RECORD_SIZE
+        while count:
+            f.seek(HEADER.size + (count - 1) * RECORD_SIZE)
+            if unpack_event(f.read(RECORD_SIZE)) is not None:
+                break
+            count -= 1
+
+        valid_size = HEADER.size + count * RECORD_SIZE
+        if valid_size != size:
+            f.truncate(valid_size)
+            f.flush()
+            os.fsync(f.fileno())
+        return count
+
+
+def restore(engine, state, now=None):
+    """
+    Переносит восстановленное состояние в движок. Если дедлайн истек,
+    пока приложение не работало, таймер встает на начало следующего режима.
+    """
+    if now is None:
+        now = time.time()
+    is_work, running, remaining = state.is_work_mode, state.is_running, state.remaining_at(now)
+    if running and remaining <= 0:
+        is_work, running = not is_work, False
+        remaining = state.work_time if is_work else state.break_time
+    engine.apply_state(is_work, running, remaining, state.work_time, state.break_time)
@@ -0,0 +1,104 @@
+import struct
+
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+
+NOISE_COLORS = ("white", "pink", "brown")
+
+SAMPLE_RATE = 44100
+BLOCK_SIZE = 4096
+
+# Число октавных рядов в алгоритме Восса-Маккартни для розового шума
+PINK_ROWS = 16
+
+# Коэффициент утечки интегратора для коричневого шума (срез около 14 Гц)
+BROWN_LEAK = 0.998
+
+
+class NoiseGenerator:
+    """
+    Процедурный генератор шума для фоновой фокусировки.
+
+    next_block() возвращает блок отсчетов float32 в диапазоне [-1, 1].
+    Все цвета считаются векторно блоками NumPy, состояние фильтров
+    переносится между блоками, поэтому на стыках нет щелчков:
+
+    - white - нормальный шум;
+    - pink - алгоритм Восса-Маккартни: сумма PINK_ROWS рядов, ряд k
+      обновляется раз в 2**k отсчетов (спад 3 дБ на октаву);
+    - brown - белый шум через интегратор с утечкой (спад 6 дБ на октаву).
+    """
+    def __init__(self, color="pink", block_size=BLOCK_SIZE, seed=None, volume=0.3):
+        if color not in NOISE_COLORS:
+            raise ValueError(f"неизвестный цвет шума: {color}")
+        if not NUMPY_AVAILABLE:
+            raise RuntimeError("Для генератора шума нужен NumPy")
+        self.color = color
+        self.block_size = block_size
+        self.volume = volume
+        self._rng = np.random.default_rng(seed)
+
+        # Состояние между блоками
+        self._position = 0
+        self._pink_rows = self._rng.standard_normal(PINK_ROWS)
+        self._brown = 0.0
+
+    def next_block(self):
+        """Следующий блок отсчетов float32."""
+        if self.color == "white":
+            block = self._white()
+        elif self.color == "pink":
+            block = self._pink()
+        else:
+            block = self._brown_block()
+        self._position += self.block_size
+        return (np.clip(block, -1.0, 1.0) * self.volume).astype(np.float32)
+
+    def next_pcm(self):
+        """Следующий блок как 16-битный PCM (little-endian)."""
+        return (self.next_block() * 32767).astype("<i2").tobytes()
+
+    def _white(self):
+        return self._rng.standard_normal(self.block_size) / 3.0
+
+    def _pink(self):
+        n = self.block_size
+        index = np.arange(self._position, self._position + n)
+        total = np.zeros(n)
+        for row in range(PINK_ROWS):
+            period = 1 << row
+            # Номера отсчетов, где ряд получает новое случайное значение
+            updates = np.flatnonzero(index % period == 0)
+            values = np.empty(len(updates) + 1)
+            values[0] = self._pink_rows[row]
+            values[1:] = self._rng.standard_normal(len(updates))
+            # Для каждого отсчета - сколько обновлений уже произошло в блоке
+            counts = np.zeros(n, dtype=np.int64)
+            counts[updates] = 1
+            total += values[np.cumsum(counts)]
+            self._pink_rows[row] = values[-1]
+        white = self._rng.standard_normal(n)
+        return (total + white) / (3.0 * np.sqrt(PINK_ROWS + 1))
+
+    def _brown_block(self):
+        # y[i] = a*y[i-1] + x[i] в замкнутом виде: y[i] = a**(i+1) * (y0 + sum(x[k] / a**(k+1)))
+        n = self.block_size
+        x = self._rng.standard_normal(n) * 0.02
+        powers = BROWN_LEAK ** np.arange(1, n + 1)
+        y = powers * (self._brown + np.cumsum(x / powers))
+        self._brown = y[-1]
+        return y
+
+
+def wav_header(sample_rate=SAMPLE_RATE, channels=1, bits=16, data_size=0xFFFFFFFF - 36):
+    """Заголовок WAV для бесконечного потока PCM."""
+    byte_rate = sample_rate * channels * bits // 8
+    return struct.pack(
+        "<4sI4s4sIHHIIHH4sI",
+        b"RIFF", data_size + 36, b"WAVE",
+        b"fmt ", 16, 1, channels, sample_rate, byte_rate, channels * bits // 8, bits,
+        b"data", data_size,
+    )
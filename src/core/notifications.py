@@ -0,0 +1,239 @@
+import importlib.util
+import os
+import shutil
+import subprocess
+import sys
+import threading
+import time
+from collections import OrderedDict, deque, namedtuple
+
+from PySide6.QtCore import QObject, Qt, Signal
+
+APP_ID = "Pomodoro Timer"
+
+Notification = namedtuple("Notification", "title message key enqueued_at")
+
+
+class WinotifyBackend:
+    """Всплывающие уведомления Windows через winotify (PowerShell, медленно)."""
+    name = "winotify"
+
+    def __init__(self):
+        # winotify есть только в Windows; сам модуль грузится при первом показе
+        if importlib.util.find_spec("winotify") is None:
+            raise RuntimeError("winotify не установлен")
+
+    def show(self, title, message):
+        from winotify import Notification as Toast
+        Toast(app_id=APP_ID, title=title, msg=message, duration="short").show()
+
+
+class NotifySendBackend:
+    """Уведомления freedesktop (D-Bus) через утилиту notify-send."""
+    name = "notify-send"
+
+    def __init__(self, timeout=5.0):
+        self.command = shutil.which("notify-send")
+        if self.command is None:
+            raise RuntimeError("notify-send не найден")
+        self.timeout = timeout
+
+    def show(self, title, message):
+        subprocess.run(
+            [self.command, "--app-name", APP_ID, title, message],
+            check=True, timeout=self.timeout,
+            stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL,
+        )
+
+
+class TrayBackend(QObject):
+    """
+    Сообщения иконки в трее (QSystemTrayIcon.showMessage).
+
+    Иконка живет в потоке интерфейса, поэтому show() передает сообщение
+    туда сигналом (в очередь событий) и не ждет показа: иначе рабочий
+    поток зависал бы, пока занят цикл событий, а close() из потока
+    интерфейса ждал бы рабочий поток, который ждет поток интерфейса.
+    """
+    name = "tray"
+    _message = Signal(str, str)
+
+    def __init__(self, tray_icon, duration=3000):
+        super().__init__()
+        if not tray_icon.supportsMessages():
+            raise RuntimeError("трей не поддерживает сообщения")
+        self.tray_icon = tray_icon
+        self.duration = duration
+        self._message.connect(self._show, Qt.QueuedConnection)
+
+    def show(self, title, message):
+        self._message.emit(title, message)
+
+    def _show(self, title, message):
+        self.tray_icon.showMessage(title, message, self.tray_icon.icon(), self.duration)
+
+
+class MemoryBackend:
+    """Бэкенд для проверок: запоминает уведомления, может имитировать задержку."""
+    name = "memory"
+
+    def __init__(self, delay=0.0):
+        self.delay = delay
+        self.shown = []  # (заголовок, текст, время показа)
+
+    def show(self, title, message):
+        if self.delay:
+            time.sleep(self.delay)
+        self.shown.append((title, message, time.perf_counter()))
+
+
+BACKENDS = {
+    "winotify": WinotifyBackend,
+    "notify-send": NotifySendBackend,
+    "tray": TrayBackend,
+    "memory": MemoryBackend,
+}
+
+
+def default_backends(tray_icon=None):
+    """
+    Доступные бэкенды в порядке предпочтения. Переменная окружения
+    POMODORO_NOTIFY задает свой порядок, например "tray,memory".
+    """
+    if os.environ.get("POMODORO_NOTIFY"):
+        names = [name.strip() for name in os.environ["POMODORO_NOTIFY"].split(",")]
+    elif sys.platform == "win32":
+        names = ["winotify", "tray"]
+    else:
+        names = ["notify-send", "tray"]
+
+    backends = []
+    for name in names:
+        factory = BACKENDS.get(name)
+        if factory is None:
+            continue
+        try:
+            if factory is TrayBackend:
+                if tray_icon is None:
+                    continue
+                backends.append(factory(tray_icon))
+            else:
+                backends.append(factory())
+        except (ImportError, RuntimeError):
+            continue
+    return backends
+
+
+class NotificationService:
+    """
+    Очередь системных уведомлений с фоновым потоком показа.
+
+    notify() не блокирует вызывающего: уведомление кладется в очередь,
+    а показывает его рабочий поток через первый сработавший бэкенд.
+    Уведомления с одинаковым ключом, ждущие в очереди, схлопываются в
+    последнее; повтор уже показанного уведомления в течение dedup_window
+    секунд отбрасывается; между показами выдерживается min_interval.
+    Для каждого показа замеряется задержка от постановки в очередь.
+    """
+    def __init__(self, backends, min_interval=1.0, dedup_window=5.0, max_pending=16):
+        self.backends = list(backends)
+        self.min_interval = min_interval
+        self.dedup_window = dedup_window
+        self.max_pending = max_pending
+
+        self._pending = OrderedDict()  # ключ -> Notification
+        self._recent = {}  # (заголовок, текст) -> время показа
+        self._condition = threading.Condition()
+        self._closed = False
+        self._last_shown = 0.0
+
+        # Метрики
+        self.shown = 0
+        self.coalesced = 0
+        self.dropped = 0
+        self.failed = 0
+        self._latencies = deque(maxlen=256)
+
+        self._thread = threading.Thread(target=self._run, name="notifications", daemon=True)
+        self._thread.start()
+
+    def notify(self, title, message, key=None):
+        """Ставит уведомление в очередь; key определяет, что считать дубликатом."""
+        if key is None:
+            key = title
+        with self._condition:
+            if key in self._pending:
+                # Ждущее уведомление заменяется свежим, место в очереди сохраняется
+                self.coalesced += 1
+                enqueued_at = self._pending[key].enqueued_at
+            else:
+                enqueued_at = time.perf_counter()
+                if len(self._pending) >= self.max_pending:
+                    self._pending.popitem(last=False)
+                    self.dropped += 1
+            self._pending[key] = Notification(title, message, key, enqueued_at)
+            self._condition.notify()
+
+    def close(self, timeout=2.0):
+        """Останавливает поток; неотправленные уведомления отбрасываются."""
+        with self._condition:
+            self._closed = True
+            self._condition.notify()
+        self._thread.join(timeout)
+
+    def metrics(self):
+        """Счетчики и задержки показа (секунды) от постановки в очередь."""
+        latencies = sorted(self._latencies)
+        result = {
+            "shown": self.shown,
+            "coalesced": self.coalesced,
+            "dropped": self.dropped,
+            "failed": self.failed,
+            "pending": len(self._pending),
+        }
+        if latencies:
+            result.update(
+                latency_mean=sum(latencies) / len(latencies),
+                latency_p95=latencies[int(0.95 * (len(latencies) - 1))],
+                latency_max=latencies[-1],
+            )
+        return result
+
+    def _run(self):
+        while True:
+            with self._condition:
+                while not self._pending and not self._closed:
+                    self._condition.wait()
+                if self._closed:
+                    return
+                # Выдерживаем паузу между показами; пока ждем, очередь схлопывается
+                wait = self._last_shown + self.min_interval - time.perf_counter()
+                if wait > 0:
+                    self._condition.wait(wait)
+                    continue
+                _, notification = self._pending.popitem(last=False)
+
+            self._show(notification)
+
+    def _show(self, notification):
+        now = time.perf_counter()
+        text = (notification.title, notification.message)
+        if now - self._recent.get(text, float("-inf")) < self.dedup_window:
+            self.coalesced += 1
+            return
+
+        for backend in self.backends:
+            try:
+                backend.show(notification.title, notification.message)
+            except Exception:
+                continue
+            shown_at = time.perf_counter()
+            self._recent = {
+                key: at for key, at in self._recent.items() if shown_at - at < self.dedup_window
+            }
+            self._recent[text] = shown_at
+            self._last_shown = shown_at
+            self.shown += 1
+            self._latencies.append(shown_at - notification.enqueued_at)
+            return
+        self.failed += 1
@@ -0,0 +1,29 @@
+import os
+import sys
+
+
+def data_dir():
+    """
+    Возвращает каталог для данных приложения (история, настройки)
+    и создает его при необходимости.
+
+    Переменная окружения POMODORO_DATA_DIR переопределяет путь.
+    """
+    path = os.environ.get("POMODORO_DATA_DIR")
+    if not path:
+        if sys.platform == "win32":
+            base = os.environ.get("APPDATA") or os.path.expanduser("~")
+            path = os.path.join(base, "PomodoroTimer")
+        elif sys.platform == "darwin":
+            path = os.path.expanduser("~/Library/Application Support/PomodoroTimer")
+        else:
+            base = os.environ.get("XDG_DATA_HOME") or os.path.expanduser("~/.local/share")
+            path = os.path.join(base, "pomodoro-timer")
+
+    os.makedirs(path, exist_ok=True)
+    return path
+
+
+def data_path(name):
+    """Возвращает путь к файлу в каталоге данных приложения."""
+    return os.path.join(data_dir(), name)
@@ -0,0 +1,311 @@
+import queue
+import sys
+import threading
+import time
+
+from PySide6.QtCore import QObject, Signal
+
+from .profiling import instrument
+
+# Модуль python-vlc загружается при первом воспроизведении
+_vlc = None
+_vlc_loaded = False
+
+
+def load_vlc():
+    """Импортирует python-vlc при первом вызове; None, если библиотека недоступна."""
+    global _vlc, _vlc_loaded
+    if not _vlc_loaded:
+        _vlc_loaded = True
+        try:
+            import vlc
+            _vlc = vlc
+        except (ImportError, OSError):
+            _vlc = None
+    return _vlc
+
+
+# Состояния воспроизведения, которые сообщает рабочий поток
+STATE_STOPPED = "stopped"
+STATE_OPENING = "opening"
+STATE_PLAYING = "playing"
+STATE_PAUSED = "paused"
+STATE_ERROR = "error"
+
+
+class VlcBackend:
+    """
+    Один плеер VLC (канал). Все методы вызываются только из рабочего
+    потока воспроизведения и могут блокироваться. Экземпляр libvlc общий
+    для всех каналов.
+    """
+    _instance = None
+
+    def __init__(self, on_state=None, network_caching=1000):
+        vlc = load_vlc()
+        if vlc is None:
+            raise RuntimeError("Библиотека VLC не установлена")
+        if VlcBackend._instance is None:
+            VlcBackend._instance = vlc.Instance()
+        self.instance = VlcBackend._instance
+        self.player = self.instance.media_player_new()
+        self.network_caching = network_caching  # Размер сетевого буфера, мс
+        self._on_state = on_state
+
+        # VLC сообщает о фактическом старте и ошибках из своего потока
+        events = self.player.event_manager()
+        events.event_attach(vlc.EventType.MediaPlayerPlaying, lambda event: self._notify(STATE_PLAYING))
+        events.event_attach(vlc.EventType.MediaPlayerEncounteredError, lambda event: self._notify(STATE_ERROR))
+
+    def _notify(self, state):
+        if self._on_state is not None:
+            self._on_state(state)
+
+    def open(self, url):
+        media = self.instance.media_new(url)
+        # Добавляем заголовок User-Agent для решения проблемы с HTTP 403 Forbidden
+        media.add_option("http-user-agent=Mozilla/5.0")
+        media.add_option(f"network-caching={self.network_caching}")
+        self.player.set_media(media)
+
+    def play(self):
+        if self.player.play() == -1:
+            raise RuntimeError("VLC не смог начать воспроизведение")
+
+    def pause(self):
+        self.player.set_pause(1)
+
+    def stop(self):
+        self.player.stop()
+
+    def set_volume(self, value):
+        self.player.audio_set_volume(value)
+
+    def close(self):
+        self.player.stop()
+        self.player.release()
+
+
+class PlaybackWorker(QObject):
+    """
+    Рабочий поток воспроизведения радио.
+
+    Интерфейс только кладет команды (play, pause, stop, volume, switch,
+    prepare) в очередь и сразу возвращается: создание медиа и подключение
+    к потоку выполняются в отдельном потоке и не задерживают ни интерфейс,
+    ни тик таймера. О смене состояния поток сообщает сигналом state_changed.
+
+    Частые изменения громкости схлопываются: в очереди не больше одной
+    команды volume, и она применяет последнее значение. Для каждой команды
+    копится время от постановки в очередь до выполнения (metrics()).
+
+    В режиме warm_standby второй канал заранее подключается к станции из
+    prepare() и играет без звука; switch() на эту станцию делает
+    кроссфейд между каналами вместо подключения с нуля.
+    """
+    state_changed = Signal(str, str)  # состояние, станция
+    error = Signal(str)
+
+    def __init__(self, backend_factory=VlcBackend, warm_standby=True, network_caching=1000,
+                 crossfade=0.4):
+        super().__init__()
+        self._backend_factory = backend_factory
+        self.warm_standby = warm_standby
+        self.network_caching = network_caching
+        self.crossfade = crossfade  # Длительность кроссфейда, с
+
+        self._channels = [None, None]
+        self._active = 0
+        self._active_url = None
+        self._standby_url = None
+        self._standby_ready = False
+
+        self._queue = queue.Queue()
+        self._lock = threading.Lock()
+        self._pending_volume = None
+        self._volume = 100
+
+        self.state = STATE_STOPPED
+        self.station = ""
+
+        # Задержки команд: команда -> [число, сумма, максимум, последняя]
+        self._latency = {}
+
+        self._thread = threading.Thread(target=self._run, name="playback", daemon=True)
+        self._thread.start()
+
+    def play(self, url, station):
+        """Начинает воспроизведение станции."""
+        self._put("play", url, station)
+
+    def switch(self, url, station):
+        """Переключает играющий поток на другую станцию."""
+        self._put("switch", url, station)
+
+    def prepare(self, url, station):
+        """Заранее подключает резервный канал к вероятной следующей станции."""
+        if self.warm_standby:
+            self._put("prepare", url, station)
+
+    def pause(self):
+        """Ставит воспроизведение на паузу."""
+        self._put("pause")
+
+    def stop(self):
+        """Останавливает воспроизведение."""
+        self._put("stop")
+
+    def set_volume(self, value):
+        """Меняет громкость; подряд идущие изменения схлопываются."""
+        with self._lock:
+            queued = self._pending_volume is not None
+            self._pending_volume = value
+        if not queued:
+            self._put("volume")
+
+    def close(self, timeout=2.0):
+        """Останавливает поток и освобождает VLC."""
+        self._queue.put(None)
+        self._thread.join(timeout)
+
+    def metrics(self):
+        """Задержки команд в секундах: команда -> count/mean/max/last."""
+        with self._lock:
+            return {
+                name: {"count": count, "mean": total / count, "max": worst, "last": last}
+                for name, (count, total, worst, last) in self._latency.items()
+            }
+
+    def _put(self, name, *args):
+        self._queue.put((name, args, time.perf_counter()))
+
+    def _run(self):
+        while True:
+            command = self._queue.get()
+            if command is None:
+                break
+            name, args, queued_at = command
+            try:
+                getattr(self, "_do_" + name)(*args)
+            except Exception as e:
+                self._set_state(STATE_ERROR)
+                self.error.emit(str(e))
+            self._record(name, time.perf_counter() - queued_at)
+
+        for backend in self._channels:
+            if backend is not None:
+                backend.close()
+        self._channels = [None, None]
+
+    def _record(self, name, latency):
+        with self._lock:
+            count, total, worst, _ = self._latency.get(name, (0, 0.0, 0.0, 0.0))
+            self._latency[name] = (count + 1, total + latency, max(worst, latency), latency)
+
+    def _set_state(self, state, station=None):
+        if station is not None:
+            self.station = station
+        self.state = state
+        self.state_changed.emit(state, self.station)
+
+    def _on_backend_state(self, channel, state):
+        # Вызывается из потока VLC
+        if channel != self._active:
+            # Резервный канал набрал буфер и готов к переключению
+            if state == STATE_PLAYING:
+                self._standby_ready = True
+            return
+        # Паузу и остановку не перетираем
+        if self.state in (STATE_OPENING, STATE_PLAYING):
+            self._set_state(state)
+
+    def _channel(self, index):
+        if self._channels[index] is None:
+            try:
+                self._channels[index] = self._backend_factory(
+                    on_state=lambda state: self._on_backend_state(index, state),
+                    network_caching=self.network_caching,
+                )
+            except Exception as e:
+                # Иначе ошибка видна только подписчикам сигнала error
+                print(f"Не удалось создать бэкенд воспроизведения: {e!r}", file=sys.stderr)
+                raise
+        return self._channels[index]
+
+    def _drop_standby(self):
+        standby = self._channels[1 - self._active]
+        if standby is not None and self._standby_url is not None:
+            standby.stop()
+        self._standby_url = None
+        self._standby_ready = False
+
+    def _do_play(self, url, station):
+        if url == self._standby_url:
+            self._do_switch(url, station)
+            return
+        backend = self._channel(self._active)
+        backend.set_volume(self._volume)
+        self._active_url = url
+        self._set_state(STATE_OPENING, station)
+        backend.open(url)
+        backend.play()
+
+    def _do_switch(self, url, station):
+        if url != self._standby_url:
+            # Холодный старт: резервный канал подключен не к той станции
+            self._channel(self._active).stop()
+            self._do_play(url, station)
+            return
+
+        old = self._channel(self._active)
+        new = self._channel(1 - self._active)
+        ready = self._standby_ready
+        self._active = 1 - self._active
+        self._active_url = url
+        self._standby_url = None
+        self._standby_ready = False
+        self._set_state(STATE_PLAYING if ready else STATE_OPENING, station)
+
+        # Кроссфейд: новый канал нарастает, старый затихает
+        steps = max(1, int(self.crossfade / 0.02))
+        for step in range(1, steps + 1):
+            level = step / steps
+            new.set_volume(int(self._volume * level))
+            old.set_volume(int(self._volume * (1 - level)))
+            time.sleep(self.crossfade / steps)
+        old.stop()
+
+    def _do_prepare(self, url, station):
+        if url in (self._standby_url, self._active_url):
+            return
+        standby = self._channel(1 - self._active)
+        standby.stop()
+        standby.set_volume(0)
+        self._standby_url = url
+        self._standby_ready = False
+        standby.open(url)
+        standby.play()
+
+    def _do_pause(self):
+        self._drop_standby()
+        if self._channels[self._active] is not None:
+            self._channels[self._active].pause()
+        self._set_state(STATE_PAUSED)
+
+    def _do_stop(self):
+        self._drop_standby()
+        if self._channels[self._active] is not None:
+            self._channels[self._active].stop()
+        self._active_url = None
+        self._set_state(STATE_STOPPED)
+
+    def _do_volume(self):
+        with self._lock:
+            value, self._pending_volume = self._pending_volume, None
+        self._volume = value
+        if self._channels[self._active] is not None:
+            self._channels[self._active].set_volume(value)
+
+
+# Вызовы libvlc видны в профиле (POMODORO_PROFILE) по отдельности
+instrument(VlcBackend, ("open", "play", "pause", "stop", "set_volume", "close"))
@@ -0,0 +1,157 @@
+import functools
+import json
+import os
+import threading
+import time
+from collections import deque
+
+# Профилирование включается переменной окружения (или флагом --profile,
+# который выставляет ее): POMODORO_PROFILE=1. Решение принимается при
+# импорте, поэтому выключенное профилирование не оставляет оберток вовсе.
+ENABLED = os.environ.get("POMODORO_PROFILE", "") not in ("", "0")
+
+# Сколько последних вызовов хранится для трассы Chrome (about://tracing, Perfetto)
+TRACE_LIMIT = 200000
+
+# Корзины гистограммы: степени двойки в микросекундах, последняя - все, что дольше
+BUCKETS = 24
+
+
+class Histogram:
+    """Гистограмма задержек одного места вызова в корзинах по степеням двойки (мкс)."""
+    __slots__ = ("name", "count", "total_ns", "max_ns", "buckets")
+
+    def __init__(self, name):
+        self.name = name
+        self.count = 0
+        self.total_ns = 0
+        self.max_ns = 0
+        self.buckets = [0] * BUCKETS
+
+    def add(self, duration_ns):
+        self.count += 1
+        self.total_ns += duration_ns
+        if duration_ns > self.max_ns:
+            self.max_ns = duration_ns
+        self.buckets[min((duration_ns // 1000).bit_length(), BUCKETS - 1)] += 1
+
+    def percentile(self, q):
+        """Верхняя граница корзины, в которую попадает q-я доля вызовов, мкс."""
+        if not self.count:
+            return 0
+        rank = q * self.count
+        seen = 0
+        for index, count in enumerate(self.buckets):
+            seen += count
+            if seen >= rank:
+                return min(1 << index, self.max_ns / 1000)
+        return self.max_ns / 1000
+
+    def as_dict(self):
+        return {
+            "count": self.count,
+            "total_ms": self.total_ns / 1e6,
+            "mean_us": self.total_ns / self.count / 1000 if self.count else 0,
+            "p50_us": self.percentile(0.5),
+            "p99_us": self.percentile(0.99),
+            "max_us": self.max_ns / 1000,
+            # Корзина i: вызовы короче 2**i мкс (первая - короче 1 мкс)
+            "buckets_us": {str(1 << index): count for index, count in enumerate(self.buckets) if count},
+        }
+
+
+class Profiler:
+    """
+    Гистограммы задержек по местам вызова и трасса последних вызовов.
+
+    Запись одного вызова - два perf_counter_ns, одна корзина и кортеж в
+    ограниченной очереди. Вызовы из рабочих потоков пишутся так же: порча
+    отдельных счетчиков под GIL невозможна, а точная синхронизация здесь
+    не нужна.
+    """
+    def __init__(self, trace_limit=TRACE_LIMIT):
+        self.histograms = {}
+        self.trace = deque(maxlen=trace_limit)
+        self.started_ns = time.perf_counter_ns()
+        self.pid = os.getpid()
+
+    def site(self, name):
+        """Гистограмма места вызова (создается при первом обращении)."""
+        histogram = self.histograms.get(name)
+        if histogram is None:
+            histogram = self.histograms[name] = Histogram(name)
+        return histogram
+
+    def wrap(self, func, name):
+        """Оборачивает функцию замером времени каждого вызова."""
+        histogram = self.site(name)
+        trace = self.trace
+        clock = time.perf_counter_ns
+        get_ident = threading.get_ident
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            start = clock()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                duration = clock() - start
+                histogram.add(duration)
+                trace.append((name, start, duration, get_ident()))
+        wrapper.__profiled__ = func
+        return wrapper
+
+    def report(self):
+        """Сводка по местам вызова, самые затратные первыми."""
+        sites = sorted(self.histograms.values(), key=lambda h: h.total_ns, reverse=True)
+        return {
+            "uptime_s": (time.perf_counter_ns() - self.started_ns) / 1e9,
+            "sites": {h.name: h.as_dict() for h in sites if h.count},
+        }
+
+    def trace_events(self):
+        """Вызовы в формате Chrome trace event (полные события "X", мкс)."""
+        return {
+            "traceEvents": [
+                {
+                    "name": name, "cat": name.split(".", 1)[0], "ph": "X", "pid": self.pid, "tid": tid,
+                    "ts": (start - self.started_ns) / 1000, "dur": duration / 1000,
+                }
+                for name, start, duration, tid in list(self.trace)
+            ],
+            "displayTimeUnit": "ms",
+        }
+
+    def dump(self, directory, stem="profile"):
+        """Пишет сводку (stem.json) и трассу (stem.trace.json); возвращает пути."""
+        paths = []
+        for suffix, data in ((".json", self.report()), (".trace.json", self.trace_events())):
+            path = os.path.join(directory, stem + suffix)
+            tmp = path + ".tmp"
+            with open(tmp, "w", encoding="utf-8") as f:
+                json.dump(data, f, ensure_ascii=False)
+            os.replace(tmp, path)
+            paths.append(path)
+        return paths
+
+
+# Общий профилировщик; None, если профилирование выключено
+profiler = Profiler() if ENABLED else None
+
+
+def instrument(cls, names=(), prefix=None):
+    """
+    Оборачивает методы класса: перечисленные в names и все, чьи имена
+    начинаются с prefix. Без профилирования ничего не делает. Слоты
+    нужно оборачивать до создания объектов: connect запоминает метод.
+    """
+    if profiler is None:
+        return cls
+    selected = set(names)
+    if prefix is not None:
+        selected.update(name for name in vars(cls) if name.startswith(prefix))
+    for name in sorted(selected):
+        func = getattr(cls, name, None)
+        if callable(func) and not hasattr(func, "__profiled__"):
+            setattr(cls, name, profiler.wrap(func, f"{cls.__name__}.{name}"))
+    return cls
@@ -0,0 +1,121 @@
+import heapq
+import itertools
+import time
+
+
+class TimerScheduler:
+    """
+    Общий планировщик для множества TimerEngine.
+
+    Держит ближайшие пробуждения всех таймеров в min-куче и взводит один
+    системный таймер на самое раннее из них через функцию arm(delay)
+    (delay в секундах или None, если ждать нечего). Число пробуждений
+    растет с числом событий, а не как таймеры × секунды.
+    """
+    def __init__(self, arm, clock=time.monotonic):
+        self._arm = arm
+        self._clock = clock
+        self._heap = []  # (момент, порядковый номер, движок, версия)
+        self._counter = itertools.count()
+        self._engines = {}  # движок -> [версия, посекундные тики, обработчик]
+        self._armed_at = None
+
+        # Счетчики для оценки нагрузки
+        self.wakeups = 0
+        self.ticks = 0
+
+    def __len__(self):
+        return len(self._engines)
+
+    def add(self, engine, per_second=False):
+        """
+        Регистрирует движок.
+
+        per_second=True будит движок на каждой смене секунды (для таймеров,
+        которые отображаются), иначе только в момент дедлайна.
+        """
+        if engine in self._engines:
+            return
+
+        def on_state_changed(engine=engine):
+            self._reschedule(engine)
+            self._rearm()
+
+        self._engines[engine] = [0, per_second, on_state_changed]
+        engine.state_changed.connect(on_state_changed)
+        on_state_changed()
+
+    def remove(self, engine):
+        """Снимает движок с планировщика."""
+        entry = self._engines.pop(engine, None)
+        if entry is not None:
+            engine.state_changed.disconnect(entry[2])
+            self._rearm()
+
+    def set_per_second(self, engine, per_second):
+        """Переключает движок между посекундными тиками и ожиданием дедлайна."""
+        entry = self._engines.get(engine)
+        if entry is not None and entry[1] != per_second:
+            entry[1] = per_second
+            self._reschedule(engine)
+            self._rearm()
+
+    def next_wakeup(self):
+        """Момент ближайшего пробуждения по часам планировщика или None."""
+        self._discard_stale()
+        if not self._heap:
+            return None
+        return self._heap[0][0]
+
+    def run_due(self):
+        """Обрабатывает все наступившие пробуждения и перевзводит таймер."""
+        self.wakeups += 1
+        self._armed_at = None
+        now = self._clock()
+
+        while self._heap and self._heap[0][0] <= now:
+            _, _, engine, version = heapq.heappop(self._heap)
+            entry = self._engines.get(engine)
+            if entry is None or entry[0] != version:
+                continue
+            self.ticks += 1
+            engine.tick()
+            # Движок мог перевзвестись сам через state_changed
+            if self._engines.get(engine) is entry and entry[0] == version:
+                self._reschedule(engine)
+
+        self._rearm()
+
+    def _reschedule(self, engine):
+        """Кладет в кучу следующее пробуждение движка, старые помечает устаревшими."""
+        entry = self._engines[engine]
+        entry[0] += 1
+        if not engine.is_running:
+            return
+
+        if entry[1]:
+            when = self._clock() + engine.next_tick_delay()
+        else:
+            when = engine.deadline
+        heapq.heappush(self._heap, (when, next(self._counter), engine, entry[0]))
+
+    def _discard_stale(self):
+        """Выбрасывает с вершины кучи записи об устаревших пробуждениях."""
+        heap = self._heap
+        while heap:
+            _, _, engine, version = heap[0]
+            entry = self._engines.get(engine)
+            if entry is not None and entry[0] == version:
+                break
+            heapq.heappop(heap)
+
+    def _rearm(self):
+        """Взводит системный таймер на ближайшее пробуждение."""
+        when = self.next_wakeup()
+        if when == self._armed_at:
+            return
+        self._armed_at = when
+        if when is None:
+            self._arm(None)
+        else:
+            self._arm(max(0.0, when - self._clock()))
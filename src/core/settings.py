@@ -0,0 +1,97 @@
+import json
+import os
+import time
+
+# Значения по умолчанию; тип каждого поля проверяется при загрузке
+DEFAULTS = {
+    "work_time": 25,  # минуты
+    "break_time": 5,  # минуты
+    "volume": 70,
+    "station": "",
+    "window_x": None,
+    "window_y": None,
+}
+
+# Допустимые диапазоны числовых полей
+RANGES = {
+    "work_time": (1, 60),
+    "break_time": (1, 60),
+    "volume": (0, 100),
+}
+
+
+class SettingsStore:
+    """
+    Настройки приложения в JSON-файле.
+
+    set() только меняет значение в памяти и помечает настройки грязными;
+    на диск они попадают одним вызовом flush(), сколько бы изменений ни
+    накопилось. Запись атомарная: во временный файл рядом, fsync и
+    os.replace, поэтому после сбоя остается либо старый, либо новый файл.
+    Испорченный файл или поле неверного типа заменяются значением по
+    умолчанию.
+    """
+    def __init__(self, path, defaults=DEFAULTS):
+        self.path = path
+        self.defaults = dict(defaults)
+        self.dirty = False
+
+        # Счетчики для оценки схлопывания записей
+        self.changes = 0
+        self.writes = 0
+        self.load_time = 0.0
+
+        self._values = self._load()
+
+    def get(self, key):
+        return self._values.get(key, self.defaults.get(key))
+
+    def set(self, key, value):
+        """Меняет значение; возвращает True, если оно действительно изменилось."""
+        if self._values.get(key) == value:
+            return False
+        self._values[key] = value
+        self.dirty = True
+        self.changes += 1
+        return True
+
+    def as_dict(self):
+        return dict(self._values)
+
+    def flush(self):
+        """Записывает накопленные изменения на диск."""
+        if not self.dirty:
+            return False
+        tmp = self.path + ".tmp"
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump(self._values, f, ensure_ascii=False, indent=2)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp, self.path)
+        self.dirty = False
+        self.writes += 1
+        return True
+
+    def _load(self):
+        started = time.perf_counter()
+        values = dict(self.defaults)
+        try:
+            with open(self.path, encoding="utf-8") as f:
+                stored = json.load(f)
+        except (OSError, ValueError):
+            stored = {}
+
+        if isinstance(stored, dict):
+            for key, default in self.defaults.items():
+                value = stored.get(key, default)
+                if default is None:
+                    if value is None or type(value) is int:
+                        values[key] = value
+                elif type(value) is type(default):
+                    if key in RANGES:
+                        low, high = RANGES[key]
+                        value = max(low, min(high, value))
+                    values[key] = value
+
+        self.load_time = time.perf_counter() - started
+        return values
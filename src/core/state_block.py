@@ -0,0 +1,155 @@
+import mmap
+import os
+import struct
+import sys
+import time
+
+STATE_FILE = "state.bin"
+STATE_VERSION = 1
+BLOCK_SIZE = 64
+
+# Счетчик версии (seqlock) и тело блока:
+# версия формата, режим (1 - работа), идет ли отсчет, жив ли процесс,
+# pid, длительности работы и отдыха (с), дедлайн по time.time(),
+# остаток на паузе (с), время публикации
+SEQ = struct.Struct("<I")
+BODY = struct.Struct("<HBBBxIIIddd")
+BODY_OFFSET = 8
+
+# Сколько раз читатель повторяет попытку, если застал запись
+READ_RETRIES = 100
+
+
+def _format_time(seconds):
+    m, s = divmod(seconds, 60)
+    return f"{m:02d}:{s:02d}"
+
+
+class StateBlock:
+    """
+    Маленький блок состояния таймера в файле, отображенном в память.
+
+    Запущенный экземпляр пишет блок только при смене состояния (старт,
+    пауза, сброс, смена режима): вместо остатка времени хранится дедлайн
+    по системным часам, и читатель вычисляет остаток сам. Поэтому
+    виджетам панелей (polybar, waybar) не нужны ни сокет, ни Qt - только
+    чтение 64 байт.
+
+    Разорванное чтение исключено seqlock'ом: писатель делает счетчик
+    нечетным, пишет тело и делает его четным; читатель принимает тело,
+    только если счетчик до и после чтения одинаковый и четный.
+    """
+    def __init__(self, path):
+        self.path = path
+        with open(path, "a+b") as f:
+            if os.path.getsize(path) < BLOCK_SIZE:
+                f.truncate(BLOCK_SIZE)
+        self._file = open(path, "r+b")
+        self._map = mmap.mmap(self._file.fileno(), BLOCK_SIZE)
+        self._seq = SEQ.unpack_from(self._map, 0)[0] & ~1
+
+        # Счетчик публикаций
+        self.writes = 0
+
+    def write(self, is_work_mode, is_running, remaining, work_time, break_time, alive=True):
+        """Публикует состояние; remaining - точный остаток в секундах."""
+        now = time.time()
+        deadline = now + remaining if is_running else 0.0
+        self._seq += 1
+        SEQ.pack_into(self._map, 0, self._seq)  # нечетный: идет запись
+        BODY.pack_into(
+            self._map, BODY_OFFSET,
+            STATE_VERSION, int(is_work_mode), int(is_running), int(alive),
+            os.getpid(), int(work_time), int(break_time),
+            deadline, float(remaining), now,
+        )
+        self._seq += 1
+        SEQ.pack_into(self._map, 0, self._seq)
+        self.writes += 1
+
+    def close(self):
+        self._map.close()
+        self._file.close()
+
+
+class StatePublisher:
+    """Публикует состояние TimerEngine в StateBlock при каждом его изменении."""
+    def __init__(self, engine, path):
+        self.engine = engine
+        self.block = StateBlock(path)
+        engine.state_changed.connect(self.publish)
+        self.publish()
+
+    def publish(self, alive=True):
+        engine = self.engine
+        self.block.write(
+            engine.is_work_mode, engine.is_running, max(0.0, engine.remaining()),
+            engine.WORK_TIME, engine.BREAK_TIME, alive,
+        )
+
+    def close(self):
+        """Помечает экземпляр завершенным и закрывает блок."""
+        self.engine.state_changed.disconnect(self.publish)
+        self.publish(alive=False)
+        self.block.close()
+
+
+def _process_alive(pid):
+    if sys.platform == "win32":
+        # os.kill в Windows завершает процесс, проверку пропускаем
+        return True
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        pass
+    return True
+
+
+def read_state(path, now=None):
+    """
+    Читает блок состояния без обращения к запущенному экземпляру.
+
+    Возвращает словарь (mode, running, time_left, display, ...) или None,
+    если экземпляр не запущен или блок не удалось прочитать целиком.
+    """
+    try:
+        with open(path, "rb") as f:
+            block = mmap.mmap(f.fileno(), BLOCK_SIZE, access=mmap.ACCESS_READ)
+    except (OSError, ValueError):
+        return None
+
+    try:
+        for _ in range(READ_RETRIES):
+            before = SEQ.unpack_from(block, 0)[0]
+            if not before & 1:
+                body = BODY.unpack_from(block, BODY_OFFSET)
+                if SEQ.unpack_from(block, 0)[0] == before:
+                    break
+            # Застали запись - уступаем процессор писателю
+            time.sleep(0)
+        else:
+            return None
+    finally:
+        block.close()
+
+    version, work_mode, running, alive, pid, work_time, break_time, deadline, remaining, updated = body
+    if version != STATE_VERSION or not alive or not _process_alive(pid):
+        return None
+
+    if now is None:
+        now = time.time()
+    if running:
+        remaining = max(0.0, deadline - now)
+    time_left = int(-(-remaining // 1))  # округление вверх, как у таймера
+    return {
+        "ok": True,
+        "mode": "work" if work_mode else "break",
+        "running": bool(running),
+        "time_left": time_left,
+        "display": _format_time(time_left),
+        "work_time": work_time,
+        "break_time": break_time,
+        "pid": pid,
+    }
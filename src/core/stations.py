@@ -0,0 +1,321 @@
+import asyncio
+import json
+import os
+import ssl
+import threading
+import time
+from collections import namedtuple
+from urllib.parse import urljoin, urlsplit
+
+STATIONS_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "stations.json")
+
+Station = namedtuple("Station", "name url")
+
+# Результат проверки станции: доступна ли, битрейт (кбит/с), задержка ответа (с)
+StationHealth = namedtuple("StationHealth", "reachable bitrate latency checked_at")
+
+USER_AGENT = "Mozilla/5.0"
+MAX_REDIRECTS = 3
+
+
+def load_stations(path=STATIONS_FILE):
+    """Читает список радиостанций из JSON-файла."""
+    with open(path, encoding="utf-8") as f:
+        return [Station(item["name"], item["url"]) for item in json.load(f)]
+
+
+async def read_head(reader):
+    """Читает строку статуса и заголовки HTTP-ответа: (статус, заголовки)."""
+    status_line = (await reader.readline()).decode("latin-1").strip()
+    # Icecast/SHOUTcast могут отвечать "ICY 200 OK"
+    parts = status_line.split(" ", 2)
+    if len(parts) < 2 or not parts[1].isdigit():
+        raise ValueError(f"неверный ответ: {status_line!r}")
+
+    headers = {}
+    while True:
+        line = (await reader.readline()).decode("latin-1")
+        if line in ("\r\n", "\n", ""):
+            break
+        name, _, value = line.partition(":")
+        headers[name.strip().lower()] = value.strip()
+    return int(parts[1]), headers
+
+
+class ConnectionPool:
+    """
+    Пул HTTP-соединений с keep-alive по хостам.
+
+    Соединение возвращается в пул, только если ответ был прочитан целиком
+    (например, редирект с Content-Length); поток радио бесконечен, поэтому
+    такое соединение после проверки закрывается. Соединения привязаны к
+    циклу событий, в котором открыты (loop), и лежат в пуле не дольше
+    idle_timeout секунд.
+    """
+    def __init__(self, max_idle_per_host=4, idle_timeout=60.0, clock=time.monotonic):
+        self.max_idle_per_host = max_idle_per_host
+        self.idle_timeout = idle_timeout
+        self._clock = clock
+        self._idle = {}  # (схема, хост, порт) -> [(reader, writer, когда освободилось)]
+        self._ssl = ssl.create_default_context()
+        self.loop = None
+
+        # Счетчики для оценки пользы пула
+        self.opened = 0
+        self.reused = 0
+
+    async def acquire(self, scheme, host, port, timeout, fresh=False):
+        """
+        Берет свободное соединение из пула или открывает новое (fresh -
+        только новое): (reader, writer, взято ли из пула).
+        """
+        self.loop = asyncio.get_running_loop()
+        key = (scheme, host, port)
+        idle = self._idle.get(key, [])
+        while idle and not fresh:
+            reader, writer, released = idle.pop()
+            if (not writer.is_closing() and not reader.at_eof()
+                    and self._clock() - released < self.idle_timeout):
+                self.reused += 1
+                return reader, writer, True
+            writer.close()
+
+        self.opened += 1
+        reader, writer = await asyncio.wait_for(
+            asyncio.open_connection(
+                host, port,
+                ssl=self._ssl if scheme == "https" else None,
+                server_hostname=host if scheme == "https" else None,
+            ),
+            timeout,
+        )
+        return reader, writer, False
+
+    def release(self, scheme, host, port, reader, writer):
+        """Возвращает соединение в пул для повторного использования."""
+        idle = self._idle.setdefault((scheme, host, port), [])
+        if len(idle) < self.max_idle_per_host and not writer.is_closing():
+            idle.append((reader, writer, self._clock()))
+        else:
+            writer.close()
+
+    def close(self):
+        """Закрывает все свободные соединения."""
+        for idle in self._idle.values():
+            for _, writer, _ in idle:
+                writer.close()
+        self._idle.clear()
+
+
+class StationManager:
+    """
+    Каталог радиостанций с асинхронной проверкой доступности.
+
+    Станции грузятся из файла один раз. probe_all() проверяет все станции
+    параллельно, результат кэшируется на ttl секунд. Пул keep-alive
+    соединений живет вместе с менеджером, а probe_all_blocking() гоняет
+    проверки в одном и том же цикле событий, поэтому соединения (например,
+    после редиректа на общий хост) переживают раунды проверки. ordered() сортирует станции по здоровью: сначала доступные
+    с меньшей задержкой, затем непроверенные, в конце недоступные.
+    """
+    def __init__(self, stations=None, ttl=300.0, timeout=5.0, sample_time=0.5,
+                 concurrency=16, clock=time.monotonic):
+        self.stations = load_stations() if stations is None else list(stations)
+        self.ttl = ttl
+        self.timeout = timeout
+        self.sample_time = sample_time  # Сколько секунд читать поток для оценки битрейта
+        self.concurrency = concurrency
+        self._clock = clock
+        self._urls = {station.name: station.url for station in self.stations}
+        self._health = {}  # имя -> StationHealth
+
+        self.pool = ConnectionPool(clock=clock)
+        self._loop = None  # Цикл событий probe_all_blocking(), общий для всех раундов
+        self._lock = threading.Lock()
+
+    def names(self):
+        """Имена станций в исходном порядке."""
+        return [station.name for station in self.stations]
+
+    def url(self, name):
+        """URL станции по имени или пустая строка."""
+        return self._urls.get(name, "")
+
+    def health(self, name):
+        """Результат последней проверки, если он еще не устарел."""
+        health = self._health.get(name)
+        if health is None or self._clock() - health.checked_at > self.ttl:
+            return None
+        return health
+
+    def is_unreachable(self, name):
+        """True, если свежая проверка показала, что станция недоступна."""
+        health = self.health(name)
+        return health is not None and not health.reachable
+
+    def ordered(self):
+        """Имена станций, отсортированные по здоровью."""
+        def rank(item):
+            index, station = item
+            health = self.health(station.name)
+            if health is None:
+                return (1, 0.0, index)
+            if not health.reachable:
+                return (2, 0.0, index)
+            return (0, health.latency, index)
+
+        return [station.name for _, station in sorted(enumerate(self.stations), key=rank)]
+
+    def probe_all_blocking(self, force=False):
+        """Синхронная обертка над probe_all() для рабочего потока."""
+        if not force and all(self.health(name) is not None for name in self._urls):
+            return {name: self.health(name) for name in self._urls}
+        with self._lock:
+            if self._loop is None:
+                self._loop = asyncio.new_event_loop()
+            return self._loop.run_until_complete(self.probe_all(force))
+
+    def close(self):
+        """Закрывает пул и цикл событий; идущий раунд проверки не ждем."""
+        if not self._lock.acquire(blocking=False):
+            return
+        try:
+            self.pool.close()
+            if self._loop is not None:
+                self._loop.close()
+                self._loop = None
+        finally:
+            self._lock.release()
+
+    async def probe_all(self, force=False):
+        """Проверяет все станции с устаревшим кэшем, параллельно."""
+        if self.pool.loop is not None and self.pool.loop is not asyncio.get_running_loop():
+            # Соединения другого цикла событий здесь не работают
+            self.pool.close()
+        semaphore = asyncio.Semaphore(self.concurrency)
+
+        async def probe_one(station):
+            async with semaphore:
+                return station.name, await self.probe(station, self.pool)
+
+        stale = [s for s in self.stations if force or self.health(s.name) is None]
+        # Неожиданная ошибка одной станции не должна срывать проверку остальных
+        results = await asyncio.gather(*(probe_one(s) for s in stale), return_exceptions=True)
+        for station, result in zip(stale, results):
+            if isinstance(result, Exception):
+                self._health[station.name] = StationHealth(False, 0, 0.0, self._clock())
+            else:
+                self._health[station.name] = result[1]
+        return {name: self.health(name) for name in self._urls}
+
+    async def probe(self, station, pool):
+        """Проверяет одну станцию: статус ответа и битрейт потока."""
+        started = self._clock()
+        try:
+            bitrate, latency = await asyncio.wait_for(
+                self._probe_url(station.url, pool, started), self.timeout + self.sample_time
+            )
+            return StationHealth(True, bitrate, latency, self._clock())
+        except (OSError, EOFError, asyncio.TimeoutError, ValueError, ssl.SSLError):
+            # EOFError - asyncio.IncompleteReadError: сервер закрыл соединение посреди ответа
+            return StationHealth(False, 0, self._clock() - started, self._clock())
+
+    async def _probe_url(self, url, pool, started):
+        """Возвращает (битрейт, задержка до заголовков ответа)."""
+        for _ in range(MAX_REDIRECTS + 1):
+            parts = urlsplit(url)
+            scheme = parts.scheme or "http"
+            port = parts.port or (443 if scheme == "https" else 80)
+            path = parts.path or "/"
+            if parts.query:
+                path += "?" + parts.query
+
+            request = (
+                f"GET {path} HTTP/1.1\r\n"
+                f"Host: {parts.netloc}\r\n"
+                f"User-Agent: {USER_AGENT}\r\n"
+                f"Icy-MetaData: 0\r\n"
+                f"Connection: keep-alive\r\n\r\n"
+            ).encode("latin-1")
+            fresh = False
+            while True:
+                reader, writer, reused = await pool.acquire(scheme, parts.hostname, port, self.timeout, fresh)
+                try:
+                    writer.write(request)
+                    await writer.drain()
+                    status, headers = await asyncio.wait_for(read_head(reader), self.timeout)
+                    break
+                except (OSError, EOFError, ValueError):
+                    writer.close()
+                    if not reused:
+                        raise
+                    # Сервер закрыл соединение, пока оно лежало в пуле, - повторяем на новом
+                    fresh = True
+                except BaseException:
+                    writer.close()
+                    raise
+
+            if status in (301, 302, 303, 307, 308) and "location" in headers:
+                await self._finish(reader, writer, headers, pool, scheme, parts.hostname, port)
+                url = urljoin(url, headers["location"])
+                continue
+
+            if status != 200:
+                await self._finish(reader, writer, headers, pool, scheme, parts.hostname, port)
+                raise ValueError(f"HTTP {status}")
+
+            latency = self._clock() - started
+            try:
+                return await self._bitrate(reader, headers), latency
+            finally:
+                # Бесконечный поток не дочитать - соединение не переиспользуется
+                writer.close()
+
+        raise ValueError("слишком много перенаправлений")
+
+    async def _finish(self, reader, writer, headers, pool, scheme, host, port):
+        """Дочитывает конечное тело ответа и возвращает соединение в пул."""
+        length = headers.get("content-length")
+        if length is None or headers.get("connection", "").lower() == "close":
+            writer.close()
+            return
+        try:
+            if int(length):
+                await asyncio.wait_for(reader.readexactly(int(length)), self.timeout)
+        except BaseException:
+            writer.close()
+            raise
+        pool.release(scheme, host, port, reader, writer)
+
+    async def _bitrate(self, reader, headers):
+        """Битрейт из заголовков icy-br/ice-audio-info или по объему данных."""
+        for value in (headers.get("icy-br", ""), headers.get("ice-audio-info", "")):
+            for item in value.replace(";", ",").split(","):
+                item = item.strip()
+                if item.startswith("bitrate="):
+                    item = item[len("bitrate="):]
+                if item.isdigit():
+                    # Первый байт тоже читаем: поток должен реально идти
+                    await asyncio.wait_for(reader.read(1), self.timeout)
+                    return int(item)
+
+        # Заголовков нет - меряем, сколько данных придет за sample_time.
+        # Первую порцию (буфер сервера) не считаем, иначе оценка завышена
+        if not await asyncio.wait_for(reader.read(65536), self.timeout):
+            raise ValueError("поток не передает данные")
+        received = 0
+        loop = asyncio.get_running_loop()
+        started = loop.time()
+        deadline = started + self.sample_time
+        while True:
+            left = deadline - loop.time()
+            if left <= 0:
+                break
+            try:
+                chunk = await asyncio.wait_for(reader.read(65536), left)
+            except asyncio.TimeoutError:
+                break
+            if not chunk:
+                break
+            received += len(chunk)
+        return int(received * 8 / 1000 / max(loop.time() - started, 1e-3))
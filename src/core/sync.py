@@ -0,0 +1,257 @@
+import asyncio
+import json
+import math
+import time
+
+DEFAULT_HOST = "127.0.0.1"
+DEFAULT_PORT = 8765
+
+MAX_LINE = 4096  # Длиннее строк протокол не бывает
+MAX_BUFFER = 256 * 1024  # Неотправленные данные медленного клиента, после - отключение
+MAX_DURATION = 24 * 60 * 60  # Длительности и остаток в сообщениях, с
+
+
+def _seconds(value):
+    """Длительность из сообщения; бесконечность, NaN и значения вне [0, MAX_DURATION] - ValueError."""
+    seconds = float(value)
+    if not math.isfinite(seconds) or not 0 <= seconds <= MAX_DURATION:
+        raise ValueError(f"недопустимая длительность: {value!r}")
+    return seconds
+
+
+def _clamped(value):
+    """Длительность, прижатая к [0, MAX_DURATION]; бесконечность и NaN - ValueError."""
+    seconds = float(value)
+    if not math.isfinite(seconds):
+        raise ValueError(f"недопустимая длительность: {value!r}")
+    return min(max(seconds, 0.0), MAX_DURATION)
+
+
+def encode(message):
+    """Сообщение протокола: JSON одной строкой."""
+    return json.dumps(message, separators=(",", ":"), ensure_ascii=False).encode("utf-8") + b"\n"
+
+
+def engine_state(engine):
+    """Состояние TimerEngine для отправки в комнату."""
+    return {
+        "type": "state",
+        "mode": "work" if engine.is_work_mode else "break",
+        "running": engine.is_running,
+        "remaining": max(0.0, engine.remaining()),
+        "work_time": engine.WORK_TIME,
+        "break_time": engine.BREAK_TIME,
+    }
+
+
+def apply_state(engine, state):
+    """
+    Применяет состояние комнаты к TimerEngine.
+
+    Остаток считается по часам сервера (deadline - server_time), поэтому
+    расхождение системных часов клиентов не важно, а ошибка не больше
+    задержки доставки. Значения проверяются до изменения таймера:
+    бесконечность или NaN от сервера - ValueError, остальное прижимается
+    к допустимому диапазону.
+    """
+    remaining = state["remaining"]
+    if state["running"]:
+        remaining = float(state["deadline"]) - float(state["server_time"])
+    remaining = _clamped(remaining)
+    work_time = int(_clamped(state["work_time"]))
+    break_time = int(_clamped(state["break_time"]))
+    engine.apply_state(state["mode"] == "work", bool(state["running"]), remaining, work_time, break_time)
+
+
+class Room:
+    """Комната: подключенные клиенты и последнее состояние таймера."""
+    def __init__(self, name):
+        self.name = name
+        self.clients = set()
+        self.state = None
+        self.version = 0
+
+
+class SyncServer:
+    """
+    Сервер общих комнат помодоро на asyncio.
+
+    Протокол - JSON построчно поверх TCP. Клиент отправляет
+    {"type": "join", "room": имя} и получает {"type": "welcome", "state": ...}
+    с текущим состоянием комнаты (или null). Дальше клиент отправляет
+    {"type": "state", mode, running, remaining, work_time, break_time}
+    при каждом своем переходе, а сервер хранит дедлайн по своим часам и
+    рассылает состояние остальным клиентам комнаты.
+
+    Посекундных тиков нет: клиенты считают остаток сами от общего
+    дедлайна, поэтому трафик есть только при старте, паузе и смене режима.
+    Рассылка кодирует сообщение один раз и пишет его в транспорты без
+    ожидания; клиент, у которого скопилось больше MAX_BUFFER неотправленных
+    байт, отключается, чтобы не держать память сервера.
+    """
+    def __init__(self, host=DEFAULT_HOST, port=DEFAULT_PORT, clock=time.time):
+        self.host = host
+        self.port = port
+        self._clock = clock
+        self._server = None
+        self.rooms = {}
+
+        # Счетчики: принятые состояния, отправленные сообщения, отключенные медленные клиенты
+        self.updates = 0
+        self.sent = 0
+        self.dropped = 0
+
+    async def start(self):
+        """Открывает сокет; port=0 выбирает свободный порт."""
+        loop = asyncio.get_running_loop()
+        self._server = await loop.create_server(
+            lambda: _SyncProtocol(self), self.host, self.port, backlog=4096
+        )
+        self.port = self._server.sockets[0].getsockname()[1]
+        return self
+
+    async def serve_forever(self):
+        await self._server.serve_forever()
+
+    def close(self):
+        if self._server is not None:
+            self._server.close()
+            self._server = None
+        for room in self.rooms.values():
+            for client in list(room.clients):
+                client.transport.close()
+
+    def metrics(self):
+        return {
+            "clients": sum(len(room.clients) for room in self.rooms.values()),
+            "rooms": len(self.rooms),
+            "updates": self.updates,
+            "sent": self.sent,
+            "dropped": self.dropped,
+        }
+
+    def join(self, client, name):
+        self.leave(client)
+        room = self.rooms.get(name)
+        if room is None:
+            room = self.rooms[name] = Room(name)
+        room.clients.add(client)
+        client.room = room
+        self._send(client, encode({"type": "welcome", "room": name, "state": self._current(room)}))
+
+    def leave(self, client):
+        room = client.room
+        if room is None:
+            return
+        room.clients.discard(client)
+        client.room = None
+        if not room.clients:
+            del self.rooms[room.name]
+
+    def update(self, client, message):
+        """Сохраняет состояние клиента и рассылает его остальным в комнате."""
+        room = client.room
+        if room is None:
+            return
+        # Одно сообщение с бесконечным остатком сломало бы таймеры всей
+        # комнаты: такие сообщения отбрасываются целиком (ValueError)
+        remaining = _seconds(message["remaining"])
+        work_time = int(_seconds(message["work_time"]))
+        break_time = int(_seconds(message["break_time"]))
+        running = bool(message["running"])
+        now = self._clock()
+        room.version += 1
+        room.state = {
+            "type": "state",
+            "version": room.version,
+            "mode": "work" if message["mode"] == "work" else "break",
+            "running": running,
+            "deadline": now + remaining if running else None,
+            "remaining": remaining,
+            "work_time": work_time,
+            "break_time": break_time,
+        }
+        self.updates += 1
+
+        data = encode(dict(room.state, server_time=now))
+        for other in list(room.clients):
+            if other is not client:
+                self._send(other, data)
+
+    def _current(self, room):
+        """Состояние комнаты на сейчас; истекший дедлайн переводит в следующий режим."""
+        state = room.state
+        if state is None:
+            return None
+        now = self._clock()
+        if state["running"] and state["deadline"] <= now:
+            # Клиенты комнаты уже сами переключили режим по дедлайну
+            work = state["mode"] != "work"
+            state = room.state = dict(
+                state, mode="work" if work else "break", running=False, deadline=None,
+                remaining=float(state["work_time"] if work else state["break_time"]),
+            )
+        return dict(state, server_time=now)
+
+    def _send(self, client, data):
+        transport = client.transport
+        if transport.is_closing():
+            return
+        if transport.get_write_buffer_size() > MAX_BUFFER:
+            self.dropped += 1
+            transport.abort()
+            return
+        transport.write(data)
+        self.sent += 1
+
+
+class _SyncProtocol(asyncio.Protocol):
+    """Соединение одного клиента с SyncServer."""
+    def __init__(self, server):
+        self.server = server
+        self.transport = None
+        self.room = None
+        self._buffer = b""
+
+    def connection_made(self, transport):
+        self.transport = transport
+
+    def connection_lost(self, exc):
+        self.server.leave(self)
+
+    def data_received(self, data):
+        self._buffer += data
+        while b"\n" in self._buffer:
+            line, self._buffer = self._buffer.split(b"\n", 1)
+            self._handle(line)
+        if len(self._buffer) > MAX_LINE:
+            self.transport.abort()
+
+    def _handle(self, line):
+        try:
+            message = json.loads(line)
+            kind = message["type"]
+            if kind == "join":
+                self.server.join(self, str(message["room"]))
+            elif kind == "state":
+                self.server.update(self, message)
+        except (ValueError, KeyError, TypeError):
+            # Некорректное сообщение пропускаем, соединение не рвем
+            pass
+
+
+def serve(host=DEFAULT_HOST, port=DEFAULT_PORT, ready=None):
+    """Запускает сервер комнат до прерывания; ready(server) вызывается после открытия сокета."""
+    async def run():
+        server = await SyncServer(host, port).start()
+        if ready is not None:
+            ready(server)
+        try:
+            await server.serve_forever()
+        finally:
+            server.close()
+
+    try:
+        asyncio.run(run())
+    except KeyboardInterrupt:
+        pass
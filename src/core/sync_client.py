@@ -0,0 +1,145 @@
+import json
+
+from PySide6.QtCore import QObject, QTimer, Signal
+from PySide6.QtNetwork import QAbstractSocket, QTcpSocket
+
+from .sync import MAX_LINE, apply_state, encode, engine_state
+
+
+class RoomSyncClient(QObject):
+    """
+    Подключает TimerEngine к комнате на SyncServer.
+
+    Работает в цикле событий Qt через QTcpSocket, без потоков. Локальные
+    переходы (старт, пауза, сброс, смена режима, длительности) уходят на
+    сервер, состояния других участников применяются к движку через
+    apply_state. Смена режима по дедлайну не отправляется: все участники
+    делают ее сами в один и тот же момент.
+
+    При обрыве клиент переподключается с растущей задержкой и при входе
+    в комнату получает ее актуальное состояние.
+    """
+    RECONNECT_DELAY = 1000  # Первая задержка переподключения, мс
+    MAX_RECONNECT_DELAY = 30000
+
+    applied = Signal()  # Применено состояние комнаты
+    connection_changed = Signal(bool)
+
+    def __init__(self, engine, host, port, room, parent=None):
+        super().__init__(parent)
+        self.engine = engine
+        self.host = host
+        self.port = port
+        self.room = room
+
+        self._buffer = b""
+        self._applying = False
+        self._after_finish = False
+        self._joined = False
+        self._closed = False
+        self._delay = self.RECONNECT_DELAY
+
+        self.socket = QTcpSocket(self)
+        self.socket.connected.connect(self._on_connected)
+        self.socket.disconnected.connect(self._on_disconnected)
+        self.socket.errorOccurred.connect(self._on_error)
+        self.socket.readyRead.connect(self._on_ready_read)
+
+        self.reconnect_timer = QTimer(self)
+        self.reconnect_timer.setSingleShot(True)
+        self.reconnect_timer.timeout.connect(self._connect)
+
+        # Отправка откладывается до возврата в цикл событий: движок излучает
+        # переход до того, как применит новый остаток, а несколько переходов
+        # подряд уходят одним сообщением
+        self.send_timer = QTimer(self)
+        self.send_timer.setSingleShot(True)
+        self.send_timer.setInterval(0)
+        self.send_timer.timeout.connect(self._send_state)
+
+        self.engine.transition.connect(self._on_transition)
+        self._connect()
+
+    @property
+    def connected(self):
+        return self._joined
+
+    def close(self):
+        """Отключается от комнаты и от движка."""
+        self._closed = True
+        self.engine.transition.disconnect(self._on_transition)
+        self.reconnect_timer.stop()
+        self.send_timer.stop()
+        self.socket.abort()
+
+    def _connect(self):
+        self._buffer = b""
+        self.socket.connectToHost(self.host, self.port)
+
+    def _on_connected(self):
+        self._delay = self.RECONNECT_DELAY
+        self.socket.write(encode({"type": "join", "room": self.room}))
+
+    def _on_disconnected(self):
+        if self._joined:
+            self._joined = False
+            self.connection_changed.emit(False)
+        self._schedule_reconnect()
+
+    def _on_error(self, error):
+        if self.socket.state() == QAbstractSocket.UnconnectedState:
+            self._schedule_reconnect()
+
+    def _schedule_reconnect(self):
+        if not self._closed and not self.reconnect_timer.isActive():
+            self.reconnect_timer.start(self._delay)
+            self._delay = min(self._delay * 2, self.MAX_RECONNECT_DELAY)
+
+    def _on_ready_read(self):
+        self._buffer += bytes(self.socket.readAll())
+        while b"\n" in self._buffer:
+            line, self._buffer = self._buffer.split(b"\n", 1)
+            try:
+                self._handle(json.loads(line))
+            except (ValueError, KeyError, TypeError):
+                pass
+        if len(self._buffer) > MAX_LINE:
+            self.socket.abort()
+
+    def _handle(self, message):
+        kind = message["type"]
+        if kind == "welcome":
+            self._joined = True
+            self.connection_changed.emit(True)
+            if message["state"] is None:
+                # Комната новая: ее состояние задает наш таймер
+                self._send_state()
+            else:
+                self._apply(message["state"])
+        elif kind == "state":
+            self._apply(message)
+
+    def _apply(self, state):
+        # Локальный переход, который не успели отправить, перекрыт комнатой
+        self.send_timer.stop()
+        self._applying = True
+        try:
+            apply_state(self.engine, state)
+        finally:
+            self._applying = False
+        self.applied.emit()
+
+    def _on_transition(self, name):
+        if self._applying:
+            return
+        if name == "finish":
+            self._after_finish = True
+            return
+        if name == "switch_mode" and self._after_finish:
+            self._after_finish = False
+            return
+        self.send_timer.start()
+
+    def _send_state(self):
+        if self._joined:
+            self.socket.write(encode(engine_state(self.engine)))
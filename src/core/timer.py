@@ -1,93 +1,179 @@
-from PySide6.QtCore import QTimer, Signal, QObject
+import math
+import time
+
+from PySide6.QtCore import QTimer, Signal, QObject, Qt
+
+from .engine import TimerEngine
+from .profiling import instrument
+from .scheduler import TimerScheduler
 
 class PomodoroTimer(QObject):
     """
     Класс, реализующий логику таймера помодоро.
+
+    Тонкий Qt-адаптер над TimerEngine: вся логика отсчета живет в движке,
+    а здесь один однократный QTimer взводится до следующей границы секунды
+    и события движка переизлучаются как Qt-сигналы.
+
+    Пока окно скрыто (set_display_active(False)), таймер просыпается не
+    каждую секунду, а раз в TRAY_REFRESH_INTERVAL секунд или к дедлайну.
     """
+    TRAY_REFRESH_INTERVAL = 60  # Период обновления подсказки в трее, с
+
     # Сигналы для оповещения об изменениях состояния
     time_updated = Signal(int)  # Обновление оставшегося времени
     mode_changed = Signal(bool)  # Изменение режима (True - работа, False - отдых)
     timer_finished = Signal()  # Завершение таймера
 
-    def __init__(self, work_time=25 * 60, break_time=5 * 60):
+    def __init__(self, work_time=25 * 60, break_time=5 * 60, clock=time.monotonic, scheduler=None):
         super().__init__()
-        self.WORK_TIME = work_time  # Время работы в секундах
-        self.BREAK_TIME = break_time  # Время отдыха в секундах
-
-        self.is_work_mode = True  # Текущий режим
-        self.is_running = False  # Состояние таймера
-        self.time_left = self.WORK_TIME  # Оставшееся время
-
-        # Таймер для обратного отсчета
-        self.timer = QTimer()
-        self.timer.timeout.connect(self._update_timer)
+        self.engine = TimerEngine(work_time, break_time, clock=clock)
+        self.scheduler = scheduler
+
+        # Отображается ли время на экране и счетчики пробуждений
+        self.display_active = True
+        self.wakeups = 0
+        self.wakeups_saved = 0
+        self._last_wake_left = self.engine.time_left
+
+        # Переизлучаем события движка как Qt-сигналы
+        self.engine.time_updated.connect(self.time_updated.emit)
+        self.engine.mode_changed.connect(self.mode_changed.emit)
+        self.engine.timer_finished.connect(self.timer_finished.emit)
+
+        if scheduler is not None:
+            # С общим планировщиком собственный QTimer не нужен
+            self.timer = None
+            scheduler.add(self.engine, per_second=True)
+        else:
+            # Однократный таймер, взводится до следующей границы секунды
+            self.timer = QTimer()
+            self.timer.setSingleShot(True)
+            self.timer.setTimerType(Qt.PreciseTimer)
+            self.timer.timeout.connect(self._update_timer)
+            self.engine.state_changed.connect(self._schedule_next_tick)
+
+    @property
+    def WORK_TIME(self):
+        return self.engine.WORK_TIME
+
+    @property
+    def BREAK_TIME(self):
+        return self.engine.BREAK_TIME
+
+    @property
+    def is_work_mode(self):
+        return self.engine.is_work_mode
+
+    @property
+    def is_running(self):
+        return self.engine.is_running
+
+    @property
+    def time_left(self):
+        """Оставшееся время в целых секундах (с округлением вверх)."""
+        return self.engine.time_left
+
+    def remaining(self):
+        """Точный остаток времени в секундах."""
+        return self.engine.remaining()
 
     def start(self):
         """Запускает таймер."""
-        if not self.is_running:
-            self.timer.start(1000)  # Обновление каждую секунду
-            self.is_running = True
+        self.engine.start()
 
     def pause(self):
         """Приостанавливает таймер."""
-        if self.is_running:
-            self.timer.stop()
-            self.is_running = False
+        self.engine.pause()
 
     def reset(self):
         """Сбрасывает таймер в начальное состояние."""
-        self.timer.stop()
-        self.is_running = False
-
-        if self.is_work_mode:
-            self.time_left = self.WORK_TIME
-        else:
-            self.time_left = self.BREAK_TIME
-
-        self.time_updated.emit(self.time_left)
+        self.engine.reset()
 
     def switch_mode(self):
         """Переключает режим работы/отдых."""
-        self.timer.stop()
-        self.is_running = False
-
-        # Переключаем режим
-        self.is_work_mode = not self.is_work_mode
-
-        # Устанавливаем время для нового режима
-        if self.is_work_mode:
-            self.time_left = self.WORK_TIME
-        else:
-            self.time_left = self.BREAK_TIME
-
-        # Оповещаем об изменении режима
-        self.mode_changed.emit(self.is_work_mode)
-        self.time_updated.emit(self.time_left)
+        self.engine.switch_mode()
 
     def set_work_time(self, minutes):
         """Устанавливает время работы в минутах."""
-        self.WORK_TIME = minutes * 60
-        if self.is_work_mode:
-            self.time_left = self.WORK_TIME
-            self.time_updated.emit(self.time_left)
+        self.engine.set_work_time(minutes)
 
     def set_break_time(self, minutes):
         """Устанавливает время отдыха в минутах."""
-        self.BREAK_TIME = minutes * 60
-        if not self.is_work_mode:
-            self.time_left = self.BREAK_TIME
-            self.time_updated.emit(self.time_left)
+        self.engine.set_break_time(minutes)
+
+    def set_display_active(self, active):
+        """Включает посекундные тики (окно видно) или редкие (окно в трее)."""
+        if active == self.display_active:
+            return
+        if active and self.engine.is_running:
+            # Учитываем секунды, проспанные до показа окна
+            self.wakeups_saved += max(0, self._last_wake_left - self.engine.time_left)
+        self.display_active = active
+
+        if self.scheduler is not None:
+            self.scheduler.set_per_second(self.engine, active)
+        elif self.engine.is_running:
+            self._schedule_next_tick()
+
+        # Окно снова видно: сразу показываем актуальное время
+        if active:
+            self.engine.refresh()
 
     def _update_timer(self):
         """Внутренний метод для обновления таймера."""
-        self.time_left -= 1
-        self.time_updated.emit(self.time_left)
+        self.wakeups += 1
+        if not self.display_active:
+            # Сколько посекундных пробуждений пропущено с прошлого раза
+            self.wakeups_saved += max(0, self._last_wake_left - self.engine.time_left - 1)
+
+        self.engine.tick()
+        if self.engine.is_running and not self.timer.isActive():
+            self._schedule_next_tick()
+
+    def _schedule_next_tick(self):
+        """Взводит таймер на момент смены отображаемой секунды."""
+        delay = self.engine.next_tick_delay()
+        if delay is None:
+            self.timer.stop()
+            return
+
+        self._last_wake_left = self.engine.time_left
+        if not self.display_active and delay > 0:
+            # В трее спим до ближайшей целой минуты остатка или до дедлайна
+            delay = self.engine.remaining() % self.TRAY_REFRESH_INTERVAL
+            if delay <= 0:
+                delay = self.TRAY_REFRESH_INTERVAL
 
-        if self.time_left <= 0:
-            self.timer_finished.emit()
-            self.switch_mode()
+        # Округляем вверх, чтобы не проснуться раньше границы секунды
+        self.timer.start(max(1, math.ceil(delay * 1000)))
 
     def format_time(self, seconds):
         """Форматирует секунды в строку MM:SS."""
-        m, s = divmod(seconds, 60)
-        return f"{m:02d}:{s:02d}"
+        return TimerEngine.format_time(seconds)
+
+
+class QtTimerScheduler(TimerScheduler):
+    """
+    TimerScheduler, который будит цикл событий Qt одним QTimer
+    на все зарегистрированные таймеры.
+    """
+    def __init__(self, clock=time.monotonic):
+        self.qtimer = QTimer()
+        self.qtimer.setSingleShot(True)
+        self.qtimer.setTimerType(Qt.PreciseTimer)
+        super().__init__(self._arm_qtimer, clock=clock)
+        self.qtimer.timeout.connect(self.run_due)
+
+    def _arm_qtimer(self, delay):
+        """Взводит QTimer на delay секунд или останавливает его."""
+        if delay is None:
+            self.qtimer.stop()
+        else:
+            # Округляем вверх, чтобы не проснуться раньше срока
+            self.qtimer.start(math.ceil(delay * 1000))
+
+
+# Без POMODORO_PROFILE ничего не оборачивается
+instrument(PomodoroTimer, ("_update_timer", "_schedule_next_tick"))
+instrument(QtTimerScheduler, ("run_due",))
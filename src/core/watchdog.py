@@ -0,0 +1,135 @@
+import sys
+import threading
+import time
+import traceback
+from collections import deque, namedtuple
+
+from PySide6.QtCore import QObject, Qt, QTimer
+
+
+class Stall(namedtuple("Stall", "started duration display_lag stack")):
+    """
+    Зависание цикла событий: начало (unix-время), длительность (с; пока
+    зависание идет - сколько уже прошло), отставание показанного времени
+    таймера (с) и стек потока интерфейса в момент обнаружения.
+    """
+    __slots__ = ()
+
+
+class EventLoopWatchdog(QObject):
+    """
+    Сторожевой поток для цикла событий Qt.
+
+    В потоке интерфейса QTimer раз в interval мс отмечает время по
+    монотонным часам (heartbeat). Отдельный поток проверяет отметку; если
+    она не обновлялась дольше interval + threshold, он снимает стек
+    потока интерфейса через sys._current_frames - то есть видно, какой
+    код (VLC, уведомления, перерисовка стилей) держит цикл событий - и
+    пишет отчет в журнал. Когда цикл оживает, дописывается итоговая
+    длительность.
+
+    Сторож работает, только пока включен (set_active): в трее окно не
+    перерисовывается, и лишние пробуждения не нужны.
+    """
+    INTERVAL = 100  # Период отметок в потоке интерфейса, мс
+    THRESHOLD = 250  # Задержка отметки сверх периода, после которой это зависание, мс
+
+    def __init__(self, engine=None, log_path=None, interval=INTERVAL, threshold=THRESHOLD,
+                 history=32, parent=None):
+        super().__init__(parent)
+        self.engine = engine
+        self.log_path = log_path
+        self.interval = interval / 1000
+        self.threshold = threshold / 1000
+        self.stalls = deque(maxlen=history)
+
+        # Счетчики: зависания, самое долгое, отметки
+        self.count = 0
+        self.longest = 0.0
+        self.beats = 0
+
+        self._ui_thread = threading.get_ident()
+        self._beat = time.monotonic()
+        self._active = threading.Event()
+        self._stopped = False
+
+        self.heartbeat = QTimer(self)
+        self.heartbeat.setTimerType(Qt.PreciseTimer)
+        self.heartbeat.setInterval(interval)
+        self.heartbeat.timeout.connect(self._on_heartbeat)
+
+        self._thread = threading.Thread(target=self._run, name="event-loop-watchdog", daemon=True)
+        self._thread.start()
+
+    def set_active(self, active):
+        """Включает или приостанавливает наблюдение."""
+        if active == self._active.is_set():
+            return
+        if active:
+            self._beat = time.monotonic()
+            self.heartbeat.start()
+            self._active.set()
+        else:
+            self._active.clear()
+            self.heartbeat.stop()
+
+    def close(self):
+        """Останавливает сторожевой поток."""
+        self._stopped = True
+        self.heartbeat.stop()
+        self._active.set()
+        self._thread.join(1.0)
+
+    def _on_heartbeat(self):
+        self._beat = time.monotonic()
+        self.beats += 1
+
+    def _run(self):
+        check = self.interval / 2
+        while True:
+            self._active.wait()
+            if self._stopped:
+                return
+            beat = self._beat
+            late = time.monotonic() - beat - self.interval
+            if late > self.threshold:
+                self._follow_stall(beat, late)
+            time.sleep(check)
+
+    def _follow_stall(self, beat, late):
+        """Снимает стек зависшего потока и ждет, пока цикл событий оживет."""
+        frame = sys._current_frames().get(self._ui_thread)
+        stack = "".join(traceback.format_stack(frame)) if frame is not None else ""
+        lag = self.engine.display_lag if self.engine is not None else 0
+        started = time.time() - late
+        self._write(Stall(started, late, lag, stack), ongoing=True)
+
+        # Ждем новую отметку (или выключения сторожа)
+        while self._beat == beat and self._active.is_set() and not self._stopped:
+            time.sleep(self.interval / 2)
+        if self._beat == beat:
+            return
+        duration = self._beat - beat - self.interval
+        if self.engine is not None:
+            lag = max(lag, self.engine.display_lag)
+        stall = Stall(started, duration, lag, stack)
+        self.stalls.append(stall)
+        self.count += 1
+        self.longest = max(self.longest, duration)
+        self._write(stall, ongoing=False)
+
+    def _write(self, stall, ongoing):
+        if self.log_path is None:
+            return
+        stamp = time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(stall.started))
+        if ongoing:
+            text = (f"{stamp} цикл событий не отвечает {stall.duration * 1000:.0f} мс, "
+                    f"отставание таймера {stall.display_lag} с; стек потока интерфейса:\n{stall.stack}")
+        else:
+            text = (f"{stamp} зависание закончилось: {stall.duration * 1000:.0f} мс, "
+                    f"отставание таймера {stall.display_lag} с\n")
+        try:
+            with open(self.log_path, "a", encoding="utf-8") as f:
+                f.write(text)
+        except OSError:
+            pass
@@ -1,5 +1,7 @@
 # Стили приложения Pomodoro Timer
 
+import re
+
 BASE_STYLE = """
     QMainWindow {
         background: transparent;
@@ -86,6 +88,26 @@ BASE_STYLE = """
         color: white;
         margin-top: 10px;
     }
+    #statsPanel {
+        background-color: rgba(255, 255, 255, 0.35);
+        border: 1px solid rgba(255, 255, 255, 0.4);
+        margin: 10px 0;
+    }
+    #statsLabel {
+        font-family: "SF Pro Display", "Segoe UI", Arial, sans-serif;
+        font-size: 14px;
+        font-weight: 600;
+        color: white;
+        margin-bottom: 10px;
+    }
+    #statsTitleLabel, #statsValueLabel {
+        font-family: "SF Pro Display", "Segoe UI", Arial, sans-serif;
+        font-size: 13px;
+        color: white;
+    }
+    #statsValueLabel {
+        font-weight: 600;
+    }
     #playerPanel {
         background-color: rgba(255, 255, 255, 0.35);
         border: 1px solid rgba(255, 255, 255, 0.4);
@@ -320,3 +342,25 @@ BREAK_MODE_BUTTONS = """
         background-color: rgba(255, 107, 107, 0.7);
     }
 """
+
+
+def _scope_to_mode(style, mode):
+    """
+    Привязывает правила к режиму: #startButton:hover превращается в
+    #startButton[mode="work"]:hover. Так оба набора правил живут в одной
+    таблице стилей, а режим переключается динамическим свойством.
+    """
+    lines = []
+    for line in style.splitlines():
+        if line.rstrip().endswith("{"):
+            line = re.sub(r"(#\w+)", rf'\1[mode="{mode}"]', line)
+        lines.append(line)
+    return "\n".join(lines)
+
+
+# Полная таблица стилей с правилами обоих режимов, разбирается Qt один раз
+APP_STYLE = (
+    BASE_STYLE
+    + _scope_to_mode(WORK_MODE_BUTTONS, "work")
+    + _scope_to_mode(BREAK_MODE_BUTTONS, "break")
+)
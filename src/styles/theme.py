@@ -0,0 +1,50 @@
+from PySide6.QtWidgets import QWidget
+
+from .style import APP_STYLE
+
+
+class ThemeEngine:
+    """
+    Переключает тему режима работы/отдыха без повторного разбора QSS.
+
+    Таблица стилей с правилами обоих режимов ставится на окно один раз,
+    а смена режима меняет динамическое свойство mode и перерисовывает
+    только виджеты, чьи правила от него зависят.
+    """
+    # Виджеты, у которых есть правила для конкретного режима
+    MODE_WIDGETS = ("startButton", "resetButton", "settingsButton")
+
+    def __init__(self, window):
+        self.window = window
+        self.mode = None
+        self._targets = None
+
+    def install(self, mode):
+        """Ставит общую таблицу стилей и применяет начальный режим."""
+        self._targets = None
+        self.mode = None
+        self.window.setStyleSheet(APP_STYLE)
+        self.apply(mode)
+
+    def apply(self, mode):
+        """Переключает режим ("work" или "break")."""
+        if mode == self.mode:
+            return
+        self.mode = mode
+
+        style = self.window.style()
+        for widget in self._mode_widgets():
+            widget.setProperty("mode", mode)
+            # Перечитываются только правила этого виджета, а не всего окна
+            style.unpolish(widget)
+            style.polish(widget)
+            widget.update()
+
+    def _mode_widgets(self):
+        """Находит зависимые от режима виджеты один раз и запоминает их."""
+        if self._targets is None:
+            self._targets = [
+                widget for widget in self.window.findChildren(QWidget)
+                if widget.objectName() in self.MODE_WIDGETS
+            ]
+        return self._targets
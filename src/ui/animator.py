@@ -0,0 +1,257 @@
+import time
+from collections import deque
+
+from PySide6.QtCore import QObject, QEasingCurve, QRect, QRectF, Qt, QTimer
+from PySide6.QtGui import QPainter
+from PySide6.QtWidgets import QWidget
+
+from ..core.profiling import profiler
+
+
+class _Overlay(QWidget):
+    """
+    Непрозрачный слой поверх окна, который рисует кадр перехода из двух
+    снимков. Виджеты под ним в это время не перерисовываются.
+    """
+    def __init__(self, animator, host):
+        super().__init__(host)
+        self.animator = animator
+        self.setAttribute(Qt.WA_OpaquePaintEvent)
+        self.setAttribute(Qt.WA_TransparentForMouseEvents)
+        self.hide()
+
+    def paintEvent(self, event):
+        start = time.perf_counter_ns()
+        painter = QPainter(self)
+        self.animator.paint_frame(painter)
+        painter.end()
+        self.animator.frame_painted(time.perf_counter_ns() - start)
+
+
+class PanelAnimator(QObject):
+    """
+    Общая анимация выезжающих панелей и смены фона окна.
+
+    Раньше каждая панель анимировала свой maximumHeight, и окно
+    фиксированного размера перестраивало всю раскладку на каждом кадре.
+    Теперь раскладка пересчитывается один раз: снимается картинка окна,
+    изменение применяется (commit), снимается вторая картинка, а кадры
+    рисуются из двух снимков на непрозрачном слое поверх окна. Панель
+    выезжает снизу поверх неподвижного содержимого, новое положение
+    содержимого появляется вместе с концом анимации, когда слой
+    убирается. Смена фона - плавное смешивание снимков.
+
+    Кадры идут по таймеру, положение считается по времени, поэтому
+    пропущенные кадры не растягивают анимацию. Если кадр рисовался
+    дольше FRAME_BUDGET, следующие пропускаются на время превышения,
+    чтобы под нагрузкой анимация не отнимала цикл событий у таймера.
+    По каждому переходу в reports сохраняются интервалы и стоимость кадров.
+    """
+    DURATION = 300  # Длительность выезда панели, мс
+    PANEL_HEIGHT = 200  # Наибольшая высота открытой панели
+    FRAME_INTERVAL = 16  # Период кадров, мс
+    FRAME_BUDGET = 8  # Сколько может стоить один кадр, мс
+
+    def __init__(self, host):
+        super().__init__(host)
+        self.host = host
+        self.easing = QEasingCurve(QEasingCurve.InOutQuad)
+        self.reports = deque(maxlen=32)
+
+        self._overlay = None
+        self._transition = None
+
+        self.frame_timer = QTimer(self)
+        self.frame_timer.setTimerType(Qt.PreciseTimer)
+        self.frame_timer.setInterval(self.FRAME_INTERVAL)
+        self.frame_timer.timeout.connect(self._on_frame)
+
+    @classmethod
+    def of(cls, widget):
+        """Аниматор окна, в котором находится виджет (создается при первом обращении)."""
+        host = widget.window()
+        animator = host.findChild(cls, options=Qt.FindDirectChildrenOnly)
+        if animator is None:
+            animator = cls(host)
+        return animator
+
+    @property
+    def running(self):
+        """Идет ли сейчас переход."""
+        return self._transition is not None
+
+    def set_panel_visible(self, panel, visible, height=PANEL_HEIGHT, duration=DURATION):
+        """Открывает или закрывает панель, высота которой ограничена maximumHeight."""
+        def commit():
+            panel.setMaximumHeight(height if visible else 0)
+            if visible and panel.isHidden():
+                # Только что вставленную панель раскладка показала бы с опозданием
+                panel.show()
+            # Раскладка пересчитывается здесь один раз, а не по отложенному
+            # LayoutRequest, чтобы второй снимок был уже готовым видом
+            layout = panel.parentWidget().layout()
+            if layout is not None:
+                layout.invalidate()
+                layout.activate()
+
+        self._start(commit, duration, visible, panel.objectName() or "panel", panel)
+
+    def crossfade(self, commit, duration, name="crossfade"):
+        """Применяет изменение сразу и плавно переводит картинку окна к новому виду."""
+        self._start(commit, duration, True, name)
+
+    def finish(self):
+        """Немедленно завершает текущий переход (его изменение уже применено)."""
+        transition = self._transition
+        if transition is None:
+            return
+        self._transition = None
+        self.frame_timer.stop()
+        self._overlay.hide()
+        self.reports.append(self._report(transition))
+
+    def _start(self, commit, duration, opening, name, panel=None):
+        self.finish()
+        if not self.host.isVisible():
+            commit()
+            return
+
+        t0 = time.perf_counter()
+        before = self.host.grab()
+        rect = self._panel_rect(panel) if panel is not None and not opening else None
+        t1 = time.perf_counter()
+        commit()
+        t2 = time.perf_counter()
+        after = self.host.grab()
+        if panel is not None and opening:
+            rect = self._panel_rect(panel)
+        t3 = time.perf_counter()
+        if rect is not None and rect.isEmpty():
+            rect = None
+
+        opened, closed = (after, before) if opening else (before, after)
+        self._transition = {
+            "name": name,
+            "opening": opening,
+            "duration": duration / 1000,
+            "started": time.monotonic(),
+            "progress": 0.0,
+            "opened": opened,
+            "closed": closed,
+            "before": before,
+            "rect": rect,
+            "next_frame": 0.0,
+            "last_frame": None,
+            "intervals": [],
+            "costs": [],
+            "dropped": 0,
+            "snapshot_ms": ((t1 - t0) + (t3 - t2)) * 1000,
+            "commit_ms": (t2 - t1) * 1000,
+        }
+
+        overlay = self._overlay
+        if overlay is None:
+            overlay = self._overlay = _Overlay(self, self.host)
+        overlay.setGeometry(self.host.rect())
+        overlay.raise_()
+        overlay.show()
+        self.frame_timer.start()
+
+    def _panel_rect(self, panel):
+        """Прямоугольник панели в координатах окна."""
+        return QRect(panel.mapTo(self.host, panel.rect().topLeft()), panel.size())
+
+    def _on_frame(self):
+        transition = self._transition
+        now = time.monotonic()
+        progress = (now - transition["started"]) / transition["duration"]
+        if progress >= 1.0:
+            self.finish()
+            return
+        if now < transition["next_frame"]:
+            # Предыдущий кадр вышел за бюджет - отдаем время циклу событий
+            return
+        transition["progress"] = progress
+        self._overlay.update()
+
+    def paint_frame(self, painter):
+        """Рисует кадр текущего перехода."""
+        transition = self._transition
+        if transition is None:
+            return
+        value = self.easing.valueForProgress(transition["progress"])
+        # Насколько панель (или новый вид окна) уже видна
+        shown = value if transition["opening"] else 1.0 - value
+        opened = transition["opened"]
+
+        # Снимки с полупрозрачным фоном: Source заменяет пиксели, а не
+        # накладывает их друг на друга
+        painter.setCompositionMode(QPainter.CompositionMode_Source)
+        rect = transition["rect"]
+        if rect is None:
+            painter.drawPixmap(0, 0, transition["closed"])
+            painter.setOpacity(shown)
+            painter.drawPixmap(0, 0, opened)
+            return
+
+        # Неподвижное окно, каким оно было до перехода; панель выглядывает
+        # снизу своей верхней частью высотой visible
+        painter.drawPixmap(0, 0, transition["before"])
+        ratio = opened.devicePixelRatio()
+        visible = round(rect.height() * shown)
+        hidden = rect.height() - visible
+        if not transition["opening"] and hidden > 0 and rect.top() > 0:
+            # Место уехавшей части панели заливается строкой фона над ней
+            row = QRectF(rect.x(), rect.top() - 1, rect.width(), 1)
+            painter.drawPixmap(QRectF(rect.x(), rect.top(), rect.width(), hidden), opened, self._device(row, ratio))
+        if visible > 0:
+            source = QRectF(rect.x(), rect.top(), rect.width(), visible)
+            target = QRectF(rect.x(), rect.top() + hidden, rect.width(), visible)
+            painter.drawPixmap(target, opened, self._device(source, ratio))
+
+    @staticmethod
+    def _device(rect, ratio):
+        """Прямоугольник снимка в пикселях устройства."""
+        return QRectF(rect.x() * ratio, rect.y() * ratio, rect.width() * ratio, rect.height() * ratio)
+
+    def frame_painted(self, cost_ns):
+        """Учитывает нарисованный кадр: интервал, стоимость и бюджет следующего."""
+        transition = self._transition
+        if transition is None:
+            return
+        if profiler is not None:
+            profiler.site("PanelAnimator.frame").add(cost_ns)
+        now = time.monotonic()
+        if transition["last_frame"] is not None:
+            interval = now - transition["last_frame"]
+            transition["intervals"].append(interval)
+            # Пропущенные кадры: из-за бюджета или загруженного цикла событий
+            transition["dropped"] += max(0, round(interval * 1000 / self.FRAME_INTERVAL) - 1)
+        transition["last_frame"] = now
+        transition["costs"].append(cost_ns / 1e9)
+        over = cost_ns / 1e9 - self.FRAME_BUDGET / 1000
+        transition["next_frame"] = now + over if over > 0 else 0.0
+
+    @staticmethod
+    def _report(transition):
+        """Сводка по кадрам перехода, мс."""
+        def stats(values):
+            if not values:
+                return 0.0, 0.0
+            values = sorted(values)
+            return values[len(values) // 2] * 1000, values[-1] * 1000
+
+        interval_p50, interval_max = stats(transition["intervals"])
+        cost_p50, cost_max = stats(transition["costs"])
+        return {
+            "name": transition["name"],
+            "opening": transition["opening"],
+            "frames": len(transition["costs"]),
+            "dropped": transition["dropped"],
+            "interval_p50_ms": interval_p50,
+            "interval_max_ms": interval_max,
+            "frame_p50_ms": cost_p50,
+            "frame_max_ms": cost_max,
+            "snapshot_ms": transition["snapshot_ms"],
+            "commit_ms": transition["commit_ms"],
+        }
@@ -0,0 +1,148 @@
+from collections import OrderedDict
+
+from PySide6.QtCore import QByteArray, QRectF, Qt
+from PySide6.QtGui import QColor, QGuiApplication, QIcon, QImage, QPainter, QPixmap
+from PySide6.QtSvg import QSvgRenderer
+
+from ..core.asset_pack import AssetPack
+
+# Общий менеджер ресурсов, создается при первом обращении
+_assets = None
+
+
+def assets():
+    """Возвращает общий AssetManager приложения."""
+    global _assets
+    if _assets is None:
+        _assets = AssetManager()
+    return _assets
+
+
+class AssetManager:
+    """
+    Иконки и картинки приложения из пакета ресурсов (assets.pack).
+
+    Каждая иконка растеризуется один раз на пару (размер, devicePixelRatio)
+    и кладется в ограниченный LRU-кэш: повторные setIcon при смене
+    состояния берут готовую картинку и не разбирают SVG заново. Разобранные
+    SVG (QSvgRenderer) тоже хранятся, их немного. Счетчики hits/misses
+    показывают, сколько запросов обошлись без растеризации.
+    """
+    def __init__(self, pack=None, max_bytes=8 * 1024 * 1024):
+        self.pack = pack if pack is not None else AssetPack()
+        self.max_bytes = max_bytes
+
+        self._pixmaps = OrderedDict()  # (имя, ширина, высота, dpr) -> QPixmap
+        self._bytes = 0
+        self._renderers = {}  # имя SVG -> QSvgRenderer
+        self._missing = set()  # Имена, которых нет ни в пакете, ни на диске
+
+        # Счетчики кэша
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def icon(self, name, size, widget=None, fallback=None):
+        """
+        Иконка размера size (QSize или число) для экрана виджета widget.
+        Если файла нет: квадрат цвета fallback или пустая QIcon.
+        """
+        pixmap = self.pixmap(name, size, widget)
+        if pixmap.isNull() and fallback is not None:
+            pixmap = self._placeholder(fallback)
+        return QIcon(pixmap) if not pixmap.isNull() else QIcon()
+
+    def pixmap(self, name, size, widget=None):
+        """Картинка размера size в логических пикселях; пустая, если файла нет."""
+        width, height = self._size(size)
+        ratio = widget.devicePixelRatioF() if widget is not None else QGuiApplication.instance().devicePixelRatio()
+        key = (name, width, height, ratio)
+
+        pixmap = self._pixmaps.get(key)
+        if pixmap is not None:
+            self._pixmaps.move_to_end(key)
+            self.hits += 1
+            return pixmap
+
+        if name is None or name in self._missing:
+            return QPixmap()
+        self.misses += 1
+        image = self._render(name, round(width * ratio), round(height * ratio))
+        if image is None:
+            self._missing.add(name)
+            return QPixmap()
+        pixmap = QPixmap.fromImage(image)
+        pixmap.setDevicePixelRatio(ratio)
+        self._store(key, pixmap)
+        return pixmap
+
+    def metrics(self):
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "entries": len(self._pixmaps),
+            "bytes": self._bytes,
+            "packed": self.pack.packed,
+        }
+
+    def clear(self):
+        self._pixmaps.clear()
+        self._bytes = 0
+
+    def _render(self, name, width, height):
+        """Растеризует файл в QImage нужного размера; None, если файла нет."""
+        if name.endswith(".svg"):
+            renderer = self._renderers.get(name)
+            if renderer is None:
+                data = self.pack.get(name)
+                if data is None:
+                    return None
+                renderer = QSvgRenderer(QByteArray(data))
+                if not renderer.isValid():
+                    return None
+                self._renderers[name] = renderer
+            image = QImage(width, height, QImage.Format_ARGB32_Premultiplied)
+            image.fill(Qt.transparent)
+            # Вписываем с сохранением пропорций по центру, как QIcon из файла
+            target = renderer.defaultSize().scaled(width, height, Qt.KeepAspectRatio)
+            painter = QPainter(image)
+            renderer.render(painter, QRectF(
+                (width - target.width()) / 2, (height - target.height()) / 2,
+                target.width(), target.height(),
+            ))
+            painter.end()
+            return image
+
+        data = self.pack.get(name)
+        if data is None:
+            return None
+        image = QImage.fromData(data)
+        if image.isNull():
+            return None
+        return image.scaled(width, height, Qt.KeepAspectRatio, Qt.SmoothTransformation)
+
+    def _placeholder(self, color):
+        """Квадрат-заглушка для отсутствующей иконки (тоже кэшируется)."""
+        key = ("placeholder", QColor(color).name(), 16, 16, 1.0)
+        pixmap = self._pixmaps.get(key)
+        if pixmap is None:
+            pixmap = QPixmap(16, 16)
+            pixmap.fill(color)
+            self._store(key, pixmap)
+        return pixmap
+
+    def _store(self, key, pixmap):
+        cost = pixmap.width() * pixmap.height() * 4
+        self._pixmaps[key] = pixmap
+        self._bytes += cost
+        while self._bytes > self.max_bytes and len(self._pixmaps) > 1:
+            _, old = self._pixmaps.popitem(last=False)
+            self._bytes -= old.width() * old.height() * 4
+            self.evictions += 1
+
+    @staticmethod
+    def _size(size):
+        if isinstance(size, (int, float)):
+            return int(size), int(size)
+        return size.width(), size.height()
@@ -0,0 +1,165 @@
+import time
+
+from PySide6.QtWidgets import QWidget
+from PySide6.QtCore import Qt, QEvent, QRect, QSize
+from PySide6.QtGui import QPainter, QPixmap, QFontMetrics, QPalette
+
+from ..core.profiling import instrument
+
+
+class DigitDisplay(QWidget):
+    """
+    Виджет для отображения времени MM:SS.
+
+    Символы 0-9 и ':' рисуются один раз в кэш картинок шрифтом и цветом
+    из таблицы стилей, у цифр одинаковая ширина ячейки. При смене текста
+    перерисовываются только ячейки изменившихся символов. Счетчики
+    перерисованных пикселей и времени отрисовки доступны через stats().
+    """
+    GLYPHS = "0123456789:"
+
+    def __init__(self, text="", parent=None):
+        super().__init__(parent)
+        self._text = text
+        self._glyphs = {}  # символ -> QPixmap
+        self._glyph_key = None  # шрифт, цвет и масштаб, для которых собран кэш
+        self._digit_width = 0
+        self._colon_width = 0
+        self._glyph_height = 0
+
+        # Счетчики для инструментирования
+        self.paint_count = 0
+        self.painted_pixels = 0
+        self.paint_time = 0.0
+        self.last_paint_pixels = 0
+        self.last_paint_time = 0.0
+
+    def text(self):
+        """Возвращает отображаемый текст."""
+        return self._text
+
+    def setText(self, text):
+        """Меняет текст, помечая к перерисовке только изменившиеся ячейки."""
+        if text == self._text:
+            return
+        old, self._text = self._text, text
+
+        if len(old) != len(text) or any((a == ":") != (b == ":") for a, b in zip(old, text)):
+            # Поменялась раскладка ячеек - перерисовываем целиком
+            self.updateGeometry()
+            self.update()
+            return
+
+        for index, (a, b) in enumerate(zip(old, text)):
+            if a != b:
+                self.update(self._cell_rect(index))
+
+    def stats(self):
+        """Возвращает счетчики отрисовки."""
+        return {
+            "paints": self.paint_count,
+            "pixels": self.painted_pixels,
+            "paint_time": self.paint_time,
+            "last_pixels": self.last_paint_pixels,
+            "last_paint_time": self.last_paint_time,
+        }
+
+    def reset_stats(self):
+        """Обнуляет счетчики отрисовки."""
+        self.paint_count = 0
+        self.painted_pixels = 0
+        self.paint_time = 0.0
+        self.last_paint_pixels = 0
+        self.last_paint_time = 0.0
+
+    def sizeHint(self):
+        self._ensure_glyphs()
+        margins = self.contentsMargins()
+        width = sum(self._cell_width(ch) for ch in self._text)
+        return QSize(
+            width + margins.left() + margins.right(),
+            self._glyph_height + margins.top() + margins.bottom(),
+        )
+
+    def minimumSizeHint(self):
+        return self.sizeHint()
+
+    def changeEvent(self, event):
+        """Сбрасывает кэш глифов при смене шрифта, цвета или стиля."""
+        if event.type() in (QEvent.FontChange, QEvent.PaletteChange, QEvent.StyleChange):
+            self._glyph_key = None
+            self.updateGeometry()
+            self.update()
+        super().changeEvent(event)
+
+    def paintEvent(self, event):
+        """Рисует из кэша только ячейки, попавшие в область перерисовки."""
+        started = time.perf_counter()
+        self._ensure_glyphs()
+
+        painter = QPainter(self)
+        for index, ch in enumerate(self._text):
+            rect = self._cell_rect(index)
+            if not event.region().intersects(rect):
+                continue
+            glyph = self._glyphs.get(ch)
+            if glyph is not None:
+                painter.drawPixmap(rect.topLeft(), glyph)
+            else:
+                painter.drawText(rect, Qt.AlignCenter, ch)
+        painter.end()
+
+        pixels = sum(rect.width() * rect.height() for rect in event.region())
+        elapsed = time.perf_counter() - started
+        self.paint_count += 1
+        self.painted_pixels += pixels
+        self.paint_time += elapsed
+        self.last_paint_pixels = pixels
+        self.last_paint_time = elapsed
+
+    def _cell_width(self, ch):
+        return self._colon_width if ch == ":" else self._digit_width
+
+    def _cell_rect(self, index):
+        """Прямоугольник ячейки символа с номером index (текст по центру)."""
+        self._ensure_glyphs()
+        contents = self.contentsRect()
+        total = sum(self._cell_width(ch) for ch in self._text)
+        x = contents.x() + (contents.width() - total) // 2
+        for ch in self._text[:index]:
+            x += self._cell_width(ch)
+        y = contents.y() + (contents.height() - self._glyph_height) // 2
+        return QRect(x, y, self._cell_width(self._text[index]), self._glyph_height)
+
+    def _ensure_glyphs(self):
+        """Собирает кэш картинок символов для текущих шрифта и цвета."""
+        font = self.font()
+        color = self.palette().color(QPalette.WindowText)
+        ratio = self.devicePixelRatioF()
+        key = (font.key(), color.rgba(), ratio)
+        if key == self._glyph_key:
+            return
+        self._glyph_key = key
+
+        metrics = QFontMetrics(font)
+        # Цифры одной ширины, чтобы смена секунды не сдвигала соседей
+        self._digit_width = max(metrics.horizontalAdvance(d) for d in "0123456789")
+        self._colon_width = metrics.horizontalAdvance(":")
+        self._glyph_height = metrics.height()
+
+        self._glyphs = {}
+        for ch in self.GLYPHS:
+            width = self._cell_width(ch)
+            pixmap = QPixmap(round(width * ratio), round(self._glyph_height * ratio))
+            pixmap.setDevicePixelRatio(ratio)
+            pixmap.fill(Qt.transparent)
+            painter = QPainter(pixmap)
+            painter.setRenderHint(QPainter.TextAntialiasing)
+            painter.setFont(font)
+            painter.setPen(color)
+            painter.drawText(QRect(0, 0, width, self._glyph_height), Qt.AlignCenter, ch)
+            painter.end()
+            self._glyphs[ch] = pixmap
+
+
+instrument(DigitDisplay, ("paintEvent", "setText"))
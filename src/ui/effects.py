@@ -0,0 +1,118 @@
+from PySide6.QtWidgets import (
+    QGraphicsDropShadowEffect, QGraphicsBlurEffect, QGraphicsScene, QGraphicsPixmapItem
+)
+from PySide6.QtCore import Qt, QPoint, QRectF, QVariantAnimation, QEasingCurve
+from PySide6.QtGui import QColor, QImage, QPainter, QPixmap, QPixmapCache
+
+
+class EffectManager:
+    """
+    Управляет эффектом неонового свечения виджетов.
+
+    Режим "effect": на каждый виджет создается один QGraphicsDropShadowEffect,
+    при смене режима анимируется только его цвет. Режим "pixmap": свечение
+    рисуется один раз в картинку, кэшируется в QPixmapCache и выводится
+    окном-хозяином под виджетом (хозяин вызывает paint() из paintEvent),
+    поэтому обновления содержимого не запускают размытие заново.
+    """
+    MODE_EFFECT = "effect"
+    MODE_PIXMAP = "pixmap"
+
+    CORNER_RADIUS = 20  # Совпадает с border-radius у #centralWidget
+    SILHOUETTE_OPACITY = 0.35  # Плотность силуэта: фон #centralWidget полупрозрачный
+
+    def __init__(self, host, mode=MODE_EFFECT, animation_duration=400):
+        self.host = host
+        self.mode = mode
+        self.animation_duration = animation_duration
+        self._effects = {}  # виджет -> QGraphicsDropShadowEffect
+        self._animations = {}  # виджет -> анимация цвета
+        self._glows = {}  # виджет -> (цвет, радиус) для режима pixmap
+
+    def set_glow(self, widget, color, blur_radius=25):
+        """Включает свечение цвета color вокруг виджета."""
+        color = QColor(color)
+        if self.mode == self.MODE_PIXMAP:
+            self._glows[widget] = (color, blur_radius)
+            self.host.update()
+            return
+
+        effect = self._effects.get(widget)
+        if effect is None:
+            # Эффект создается один раз, дальше меняется только цвет
+            effect = QGraphicsDropShadowEffect()
+            effect.setBlurRadius(blur_radius)
+            effect.setOffset(0, 0)
+            effect.setColor(color)
+            widget.setGraphicsEffect(effect)
+            self._effects[widget] = effect
+            return
+
+        effect.setBlurRadius(blur_radius)
+        self._animate_color(widget, effect, color)
+
+    def paint(self, painter):
+        """Рисует кэшированное свечение под виджетами (режим pixmap)."""
+        for widget, (color, blur_radius) in self._glows.items():
+            if not widget.isVisible():
+                continue
+            pixmap = self.glow_pixmap(widget.width(), widget.height(), color, blur_radius)
+            top_left = widget.mapTo(self.host, QPoint(0, 0))
+            painter.drawPixmap(top_left - QPoint(blur_radius, blur_radius), pixmap)
+
+    def glow_pixmap(self, width, height, color, blur_radius):
+        """Возвращает картинку свечения из QPixmapCache, при промахе рисует ее."""
+        key = f"glow:{width}x{height}:{color.name(QColor.HexArgb)}:{blur_radius}"
+        pixmap = QPixmapCache.find(key)
+        if pixmap is None or pixmap.isNull():
+            pixmap = self._render_glow(width, height, color, blur_radius)
+            QPixmapCache.insert(key, pixmap)
+        return pixmap
+
+    def _render_glow(self, width, height, color, blur_radius):
+        """Рисует размытый силуэт скругленного прямоугольника цвета color."""
+        size_w = width + 2 * blur_radius
+        size_h = height + 2 * blur_radius
+
+        shape = QPixmap(size_w, size_h)
+        shape.fill(Qt.transparent)
+        painter = QPainter(shape)
+        painter.setRenderHint(QPainter.Antialiasing)
+        painter.setPen(Qt.NoPen)
+        painter.setOpacity(self.SILHOUETTE_OPACITY)
+        painter.setBrush(color)
+        painter.drawRoundedRect(
+            QRectF(blur_radius, blur_radius, width, height),
+            self.CORNER_RADIUS, self.CORNER_RADIUS
+        )
+        painter.end()
+
+        # Размываем через сцену с QGraphicsBlurEffect - один раз на ключ кэша
+        scene = QGraphicsScene()
+        item = QGraphicsPixmapItem(shape)
+        blur = QGraphicsBlurEffect()
+        blur.setBlurRadius(blur_radius)
+        item.setGraphicsEffect(blur)
+        scene.addItem(item)
+
+        image = QImage(size_w, size_h, QImage.Format_ARGB32_Premultiplied)
+        image.fill(Qt.transparent)
+        painter = QPainter(image)
+        scene.render(painter, QRectF(0, 0, size_w, size_h), QRectF(0, 0, size_w, size_h))
+        painter.end()
+        return QPixmap.fromImage(image)
+
+    def _animate_color(self, widget, effect, color):
+        """Плавно меняет цвет существующего эффекта."""
+        animation = self._animations.get(widget)
+        if animation is None:
+            animation = QVariantAnimation()
+            animation.setDuration(self.animation_duration)
+            animation.setEasingCurve(QEasingCurve.InOutQuad)
+            animation.valueChanged.connect(effect.setColor)
+            self._animations[widget] = animation
+
+        animation.stop()
+        animation.setStartValue(effect.color())
+        animation.setEndValue(color)
+        animation.start()
@@ -1,27 +1,59 @@
+import os
 import sys
 from PySide6.QtWidgets import (
     QApplication, QMainWindow, QWidget, QVBoxLayout, QHBoxLayout,
     QPushButton, QLabel, QSystemTrayIcon, QMenu, QTabBar
 )
-from PySide6.QtCore import Qt, QTimer, QPropertyAnimation, QEasingCurve, QRect
-from PySide6.QtGui import QAction, QFont, QPalette, QColor, QIcon
+from PySide6.QtCore import Qt, QTimer, QRect, QEvent, QPoint, QSocketNotifier
+from PySide6.QtGui import QAction, QFont, QPalette, QColor, QPainter, QGuiApplication
 from PySide6.QtWidgets import QGraphicsDropShadowEffect
-from winotify import Notification
 
 from ..core.timer import PomodoroTimer
-from ..styles.style import BASE_STYLE, WORK_MODE_BUTTONS, BREAK_MODE_BUTTONS
+from ..core.watchdog import EventLoopWatchdog
+from ..core.history import SessionLog, SessionRecorder
+from ..core.journal import JOURNAL_FILE, TimerJournal, restore
+from ..core.notifications import NotificationService, default_backends
+from ..core.paths import data_dir, data_path
+from ..core.profiling import instrument, profiler
+from ..core.settings import SettingsStore
+from ..core.state_block import STATE_FILE, StatePublisher
+from ..styles.theme import ThemeEngine
+from .animator import PanelAnimator
+from .assets import assets
+from .effects import EffectManager
 from .timer_widget import TimerWidget
-from .settings_widget import SettingsWidget
-from .player_widget import PlayerWidget
 
 
 class MainWindow(QMainWindow):
-    def __init__(self):
+    # Порядок панелей под таймером; панели создаются при первом открытии
+    PANEL_ORDER = ("settings", "stats", "player")
+
+    # Задержка записи настроек: все изменения за это время пишутся одним разом, мс
+    SETTINGS_SAVE_DELAY = 1000
+
+    # Размер иконки трея и окна (исходный размер title.png)
+    TRAY_ICON_SIZE = 256
+
+    def __init__(self, control=None):
         super().__init__()
 
-        # Настройки по умолчанию
-        self.WORK_TIME = 25 * 60  # 25 минут
-        self.BREAK_TIME = 5 * 60  # 5 минут
+        # Сокет управления единственного экземпляра подключается до сборки
+        # окна: второй запуск, пришедший во время нее, ждет в очереди и
+        # получает ответ с первым проходом цикла событий
+        self.control = None
+        if control is not None:
+            self.attach_control(control)
+
+        # Сохраненные настройки (по умолчанию 25 и 5 минут)
+        self.settings = SettingsStore(data_path("settings.json"))
+        self.WORK_TIME = self.settings.get("work_time") * 60
+        self.BREAK_TIME = self.settings.get("break_time") * 60
+
+        # Отложенная запись настроек
+        self.settings_save_timer = QTimer(self)
+        self.settings_save_timer.setSingleShot(True)
+        self.settings_save_timer.setInterval(self.SETTINGS_SAVE_DELAY)
+        self.settings_save_timer.timeout.connect(self._save_settings)
 
         # Инициализация таймера
         self.timer = PomodoroTimer(self.WORK_TIME, self.BREAK_TIME)
@@ -31,19 +63,65 @@ class MainWindow(QMainWindow):
         self.timer.mode_changed.connect(self._on_mode_changed)
         self.timer.timer_finished.connect(self._on_timer_finished)
 
+        # Журнал завершенных сессий
+        try:
+            self.history = SessionLog(data_path("history.log"))
+            self.session_recorder = SessionRecorder(self.timer.engine, self.history)
+        except (OSError, ValueError):
+            self.history = None
+
+        # Журнал переходов таймера: после сбоя или перезапуска состояние
+        # восстанавливается из снимка и хвоста журнала (в конце __init__)
+        try:
+            self.journal = TimerJournal(data_path(JOURNAL_FILE), work_time=self.WORK_TIME, break_time=self.BREAK_TIME)
+            recovered = self.journal.recover()
+            self.journal.attach(self.timer.engine)
+        except (OSError, ValueError):
+            self.journal = None
+            recovered = None
+
+        # Блок состояния для `main.py status` и виджетов панелей
+        try:
+            self.state_publisher = StatePublisher(self.timer.engine, data_path(STATE_FILE))
+        except (OSError, ValueError):
+            self.state_publisher = None
+
+        # Сторож цикла событий: зависания потока интерфейса со стеком
+        # пишутся в stalls.log; POMODORO_WATCHDOG=0 выключает его
+        self.watchdog = None
+        if os.environ.get("POMODORO_WATCHDOG", "1") != "0":
+            self.watchdog = EventLoopWatchdog(self.timer.engine, data_path("stalls.log"), parent=self)
+
+        # Общая комната: POMODORO_SYNC=host:port/комната
+        self.room_sync = None
+        if os.environ.get("POMODORO_SYNC"):
+            self._join_room(os.environ["POMODORO_SYNC"])
+
         # Состояние UI
         self.settings_visible = False
         self.player_visible = False
         self.old_pos = None
 
+        # Эффекты свечения; POMODORO_GLOW=pixmap включает дешевый режим
+        self.effects = EffectManager(self, mode=os.environ.get("POMODORO_GLOW", EffectManager.MODE_EFFECT))
+
         # Инициализация UI
         self.init_ui()
         self.init_tray_icon()
+        self._restore_window_position()
+
+        # Уведомления показываются в фоновом потоке, не блокируя интерфейс
+        self.notifications = NotificationService(default_backends(self.tray_icon))
 
-        # Применяем стили
-        self.setStyleSheet(BASE_STYLE + WORK_MODE_BUTTONS)
+        # Применяем стили: оба режима разбираются один раз
+        self.theme = ThemeEngine(self)
+        self.theme.install("work")
         self.set_background_color("#FF6B6B")
 
+        if recovered is not None:
+            restore(self.timer.engine, recovered)
+            self.timer_widget.set_start_button_text("Пауза" if self.timer.is_running else "Старт")
+
         # Обновляем начальное состояние
         self._on_time_updated(self.timer.time_left)
 
@@ -102,14 +180,10 @@ class MainWindow(QMainWindow):
 
         main_layout.addWidget(content_container)
 
-        # Панель настроек
-        self.settings_widget = SettingsWidget()
-        self.settings_widget.value_changed.connect(self._on_settings_value_changed)
-        main_layout.addWidget(self.settings_widget)
-        
-        # Панель плеера
-        self.player_widget = PlayerWidget()
-        main_layout.addWidget(self.player_widget)
+        # Панели настроек, статистики и плеера создаются при первом открытии
+        self.main_layout = main_layout
+        self.content_container = content_container
+        self._panels = {}
 
         # Верхняя панель с кнопками управления окном
         top_panel = QWidget()
@@ -136,23 +210,66 @@ class MainWindow(QMainWindow):
 
         main_layout.addWidget(top_panel)
 
+    @property
+    def settings_widget(self):
+        """Панель настроек."""
+        return self._panel("settings")
+
+    @property
+    def stats_widget(self):
+        """Панель статистики."""
+        return self._panel("stats")
+
+    @property
+    def player_widget(self):
+        """Панель плеера."""
+        return self._panel("player")
+
+    def _panel(self, name):
+        """Возвращает панель, создавая ее при первом обращении."""
+        panel = self._panels.get(name)
+        if panel is not None:
+            return panel
+
+        # Импортируем здесь, чтобы не платить за модули панелей при старте
+        if name == "settings":
+            from .settings_widget import SettingsWidget
+            panel = SettingsWidget()
+            panel.set_value(self._current_mode_minutes())
+            panel.value_changed.connect(self._on_settings_value_changed)
+        elif name == "stats":
+            from .stats_widget import StatsWidget
+            panel = StatsWidget()
+        else:
+            from .player_widget import PlayerWidget
+            panel = PlayerWidget()
+            panel.volume_slider.setValue(self.settings.get("volume"))
+            if panel.station_combo.findText(self.settings.get("station")) >= 0:
+                panel.station_combo.setCurrentText(self.settings.get("station"))
+            panel.volume_slider.valueChanged.connect(lambda value: self._update_setting("volume", value))
+            panel.station_combo.currentTextChanged.connect(lambda name: self._update_setting("station", name))
+
+        # Вставляем панель на ее место относительно уже созданных
+        index = self.main_layout.indexOf(self.content_container) + 1
+        for other in self.PANEL_ORDER[:self.PANEL_ORDER.index(name)]:
+            if other in self._panels:
+                index += 1
+        self.main_layout.insertWidget(index, panel)
+        self._panels[name] = panel
+        return panel
+
     def init_tray_icon(self):
         """Инициализация иконки в системном трее."""
         self.tray_icon = QSystemTrayIcon(self)
 
         # Устанавливаем иконку
-        try:
-            icon = QIcon("title.png")
-            if icon.isNull():
-                raise ValueError("Icon file not found or invalid")
+        icon = assets().icon("title.png", self.TRAY_ICON_SIZE, self)
+        if icon.isNull():
+            self.tray_icon.setIcon(assets().icon(None, self.TRAY_ICON_SIZE, self, Qt.red))
+        else:
             self.tray_icon.setIcon(icon)
             # Также устанавливаем иконку для окна
             self.setWindowIcon(icon)
-        except:
-            from PySide6.QtGui import QPixmap
-            pixmap = QPixmap(16, 16)
-            pixmap.fill(Qt.red)
-            self.tray_icon.setIcon(QIcon(pixmap))
 
         # Создаем контекстное меню
         tray_menu = QMenu()
@@ -161,6 +278,15 @@ class MainWindow(QMainWindow):
         show_action.triggered.connect(self.toggle_window_visibility)
         tray_menu.addAction(show_action)
 
+        stats_action = QAction("Статистика", self)
+        stats_action.triggered.connect(self._toggle_stats)
+        tray_menu.addAction(stats_action)
+
+        if profiler is not None:
+            profile_action = QAction("Сохранить профиль", self)
+            profile_action.triggered.connect(self._dump_profile)
+            tray_menu.addAction(profile_action)
+
         quit_action = QAction("Выход", self)
         quit_action.triggered.connect(self.force_quit)
         tray_menu.addAction(quit_action)
@@ -183,15 +309,15 @@ class MainWindow(QMainWindow):
 
     def add_neon_glow_effect(self, widget, color="#6366F1", blur_radius=25):
         """Добавляет эффект неонового свечения к виджету."""
-        shadow = QGraphicsDropShadowEffect()
-        shadow.setBlurRadius(blur_radius)
-
-        qcolor = QColor()
-        qcolor.setNamedColor(color)
-        shadow.setColor(qcolor)
+        self.effects.set_glow(widget, color, blur_radius)
 
-        shadow.setOffset(0, 0)
-        widget.setGraphicsEffect(shadow)
+    def paintEvent(self, event):
+        """Рисует кэшированное свечение под центральным виджетом."""
+        super().paintEvent(event)
+        if self.effects.mode == EffectManager.MODE_PIXMAP:
+            painter = QPainter(self)
+            self.effects.paint(painter)
+            painter.end()
 
     def set_background_color(self, color):
         """Устанавливает цвет фона окна."""
@@ -200,27 +326,25 @@ class MainWindow(QMainWindow):
         self.setPalette(palette)
 
     def animate_background_color(self, color):
-        """Анимирует изменение цвета фона."""
-        start = self.palette()
-        end = self.palette()
-        end.setColor(QPalette.Window, QColor(color))
-
-        color_animation = QPropertyAnimation(self, b"palette")
-        color_animation.setDuration(800)
-        color_animation.setEasingCurve(QEasingCurve.InOutQuad)
-        color_animation.setStartValue(start)
-        color_animation.setEndValue(end)
-        color_animation.start()
+        """
+        Анимирует изменение цвета фона: палитра меняется один раз, а
+        кадры - переход между снимками окна до и после.
+        """
+        PanelAnimator.of(self).crossfade(lambda: self.set_background_color(color), 800, name="background")
 
     def show_notification(self, title, message):
-        """Показывает системное уведомление."""
-        toast = Notification(
-            app_id="Pomodoro Timer",
-            title=title,
-            msg=message,
-            duration="short"
-        )
-        toast.show()
+        """Ставит системное уведомление в очередь показа."""
+        self.notifications.notify(title, message)
+
+    def _dump_profile(self, notify=True):
+        """Сохраняет гистограммы и трассу профилировщика в каталог данных."""
+        try:
+            paths = profiler.dump(data_dir(), f"profile-{os.getpid()}")
+        except OSError as e:
+            print(f"Не удалось сохранить профиль: {e}", file=sys.stderr)
+            return
+        if notify:
+            self.show_notification("Профиль сохранен", paths[0])
 
     def toggle_window_visibility(self):
         """Переключает видимость окна."""
@@ -246,6 +370,90 @@ class MainWindow(QMainWindow):
         self.raise_()
         self.activateWindow()
 
+    def attach_control(self, server):
+        """Принимает команды второго запуска и скриптов через сокет управления."""
+        self.control = server
+        server.handler = self.handle_command
+        self.control_notifier = QSocketNotifier(server.fileno(), QSocketNotifier.Read, self)
+        self.control_notifier.activated.connect(self._on_control_pending)
+        # Соединения, приславшие команду не целиком: дескриптор -> QSocketNotifier
+        self.control_clients = {}
+        # Пока такие есть, раз в timeout закрываем просроченные
+        self.control_expiry = QTimer(self)
+        self.control_expiry.setInterval(int(server.timeout * 1000))
+        self.control_expiry.timeout.connect(self._expire_control_clients)
+
+    def _on_control_pending(self):
+        self.control.handle_pending()
+        self._watch_control_clients()
+
+    def _on_control_client(self, fd):
+        self.control.handle_client(fd)
+        self._watch_control_clients()
+
+    def _expire_control_clients(self):
+        self.control.expire()
+        self._watch_control_clients()
+
+    def _watch_control_clients(self):
+        """Следит за недочитанными соединениями управления, не блокируя цикл событий."""
+        waiting = set(self.control.waiting())
+        for fd in list(self.control_clients):
+            if fd not in waiting:
+                notifier = self.control_clients.pop(fd)
+                notifier.setEnabled(False)
+                notifier.deleteLater()
+        for fd in waiting - set(self.control_clients):
+            notifier = QSocketNotifier(fd, QSocketNotifier.Read, self)
+            notifier.activated.connect(lambda *args, fd=fd: self._on_control_client(fd))
+            self.control_clients[fd] = notifier
+        if not waiting:
+            self.control_expiry.stop()
+        elif not self.control_expiry.isActive():
+            self.control_expiry.start()
+
+    def handle_command(self, command):
+        """
+        Выполняет команду управления и возвращает состояние таймера в тех
+        же полях, что и read_state(): `main.py status --format` работает
+        одинаково через блок состояния и через сокет.
+        """
+        if command == "start" and not self.timer.is_running:
+            self._toggle_timer()
+        elif command == "pause" and self.timer.is_running:
+            self._toggle_timer()
+        elif command == "reset":
+            self._reset_timer()
+        elif command == "show":
+            self.restore_from_tray()
+
+        return {
+            "ok": True,
+            "mode": "work" if self.timer.is_work_mode else "break",
+            "running": self.timer.is_running,
+            "time_left": self.timer.time_left,
+            "display": self.timer.format_time(self.timer.time_left),
+            "work_time": int(self.timer.WORK_TIME),
+            "break_time": int(self.timer.BREAK_TIME),
+            "pid": os.getpid(),
+        }
+
+    def _join_room(self, address):
+        """Подключает таймер к комнате на сервере синхронизации."""
+        from ..core.sync import DEFAULT_PORT
+        from ..core.sync_client import RoomSyncClient
+
+        address, _, room = address.partition("/")
+        host, _, port = address.partition(":")
+        self.room_sync = RoomSyncClient(
+            self.timer.engine, host or "127.0.0.1", int(port or DEFAULT_PORT), room or "default", self
+        )
+        self.room_sync.applied.connect(self._on_room_synced)
+
+    def _on_room_synced(self):
+        """Состояние пришло из комнаты: обновляем кнопку старта."""
+        self.timer_widget.set_start_button_text("Пауза" if self.timer.is_running else "Старт")
+
     def _toggle_timer(self):
         """Переключает состояние таймера."""
         if self.timer.is_running:
@@ -266,11 +474,7 @@ class MainWindow(QMainWindow):
         """Сбрасывает таймер."""
         self.timer.reset()
         self.timer_widget.set_start_button_text("Старт")
-        try:
-            self.timer_widget.set_start_button_icon("pause.svg")
-        except:
-            # Используем стандартную иконку, если файл не найден
-            self.timer_widget.set_start_button_icon(None)
+        self.timer_widget.set_start_button_icon("pause.svg")
 
         # Устанавливаем правильную вкладку
         if self.timer.is_work_mode:
@@ -283,6 +487,15 @@ class MainWindow(QMainWindow):
         self.settings_widget.toggle_visibility()
         self.settings_visible = not self.settings_visible
         
+    def _toggle_stats(self):
+        """Переключает видимость панели статистики."""
+        if not self.stats_widget.stats_visible:
+            if self.history is not None:
+                self.history.sync()
+                self.stats_widget.refresh(self.history.path)
+            self.restore_from_tray()
+        self.stats_widget.toggle_visibility()
+
     def _toggle_player(self):
         """Переключает видимость панели плеера."""
         self.player_widget.toggle_visibility()
@@ -290,35 +503,64 @@ class MainWindow(QMainWindow):
 
     def _on_settings_value_changed(self, value):
         """Обработчик изменения значения в настройках."""
+        if value == self._current_mode_minutes():
+            return
         if self.timer.is_work_mode:
             self.timer.set_work_time(value)
+            self._update_setting("work_time", value)
         else:
             self.timer.set_break_time(value)
+            self._update_setting("break_time", value)
+
+    def _current_mode_minutes(self):
+        """Длительность текущего режима в минутах."""
+        seconds = self.timer.WORK_TIME if self.timer.is_work_mode else self.timer.BREAK_TIME
+        return seconds // 60
+
+    def _update_setting(self, key, value):
+        """Меняет настройку и откладывает запись на диск."""
+        if self.settings.set(key, value):
+            self.settings_save_timer.start()
+
+    def _save_settings(self):
+        """Записывает накопленные изменения настроек."""
+        self.settings_save_timer.stop()
+        try:
+            self.settings.flush()
+        except OSError:
+            pass
+
+    def _restore_window_position(self):
+        """Возвращает окно на сохраненное место, если оно на одном из экранов."""
+        x, y = self.settings.get("window_x"), self.settings.get("window_y")
+        if x is not None and y is not None and QGuiApplication.screenAt(QPoint(x, y)) is not None:
+            self.move(x, y)
 
     def _on_time_updated(self, seconds):
         """Обработчик обновления времени."""
-        self.timer_widget.update_time(self.timer.format_time(seconds))
+        time_str = self.timer.format_time(seconds)
+        self.timer_widget.update_time(time_str)
+        self.tray_icon.setToolTip(f"Pomodoro Timer — {time_str}")
 
     def _on_mode_changed(self, is_work_mode):
         """Обработчик изменения режима."""
+        if "settings" in self._panels:
+            self._panels["settings"].set_value(self._current_mode_minutes())
+
         if is_work_mode:
             self.tab_bar.setCurrentIndex(0)
-            self.setStyleSheet(BASE_STYLE + WORK_MODE_BUTTONS)
+            self.theme.apply("work")
             self.add_neon_glow_effect(self.centralWidget(), "#FF6B6B", 25)
         else:
             self.tab_bar.setCurrentIndex(1)
-            self.setStyleSheet(BASE_STYLE + BREAK_MODE_BUTTONS)
+            self.theme.apply("break")
             self.add_neon_glow_effect(self.centralWidget(), "#4ECDC4", 25)
 
     def _on_timer_finished(self):
         """Обработчик завершения таймера."""
         self.restore_from_tray()
         self.timer_widget.set_start_button_text("Старт")
-        try:
-            self.timer_widget.set_start_button_icon("pause.svg")
-        except:
-            # Используем стандартную иконку, если файл не найден
-            self.timer_widget.set_start_button_icon(None)
+        self.timer_widget.set_start_button_icon("pause.svg")
 
     def _on_tab_changed(self, index):
         """Обработчик переключения вкладок."""
@@ -327,6 +569,34 @@ class MainWindow(QMainWindow):
         elif index == 1 and self.timer.is_work_mode:
             self.timer.switch_mode()
 
+    def showEvent(self, event):
+        """Окно показано: возвращаем посекундное обновление времени."""
+        super().showEvent(event)
+        self._set_display_active(not self.isMinimized())
+
+    def hideEvent(self, event):
+        """Окно скрыто: таймер просыпается только для подсказки в трее."""
+        super().hideEvent(event)
+        self._set_display_active(False)
+
+    def changeEvent(self, event):
+        """Отслеживает сворачивание окна."""
+        super().changeEvent(event)
+        if event.type() == QEvent.WindowStateChange:
+            self._set_display_active(self.isVisible() and not self.isMinimized())
+
+    def _set_display_active(self, active):
+        """Окно на экране или нет: посекундная отрисовка и сторож цикла событий."""
+        self.timer.set_display_active(active)
+        if self.watchdog is not None:
+            self.watchdog.set_active(active)
+
+    def moveEvent(self, event):
+        """Запоминает положение окна."""
+        super().moveEvent(event)
+        self._update_setting("window_x", self.x())
+        self._update_setting("window_y", self.y())
+
     def closeEvent(self, event):
         """Обработка события закрытия окна."""
         event.ignore()
@@ -334,6 +604,24 @@ class MainWindow(QMainWindow):
 
     def force_quit(self):
         """Принудительное завершение приложения."""
+        if self.history is not None:
+            self.history.close()
+        if "player" in self._panels:
+            self._panels["player"].close_playback()
+        self.notifications.close()
+        self._save_settings()
+        if self.control is not None:
+            self.control.close()
+        if self.state_publisher is not None:
+            self.state_publisher.close()
+        if self.room_sync is not None:
+            self.room_sync.close()
+        if self.journal is not None:
+            self.journal.close()
+        if self.watchdog is not None:
+            self.watchdog.close()
+        if profiler is not None:
+            self._dump_profile(notify=False)
         QApplication.quit()
 
     def mousePressEvent(self, event):
@@ -357,3 +645,7 @@ class MainWindow(QMainWindow):
             delta = event.globalPosition().toPoint() - self.old_pos
             self.move(self.x() + delta.x(), self.y() + delta.y())
             self.old_pos = event.globalPosition().toPoint()
+
+
+# Слоты и отрисовка видны в профиле (POMODORO_PROFILE); без него классы не меняются
+instrument(MainWindow, ("paintEvent", "_toggle_timer", "_reset_timer", "handle_command"), prefix="_on_")
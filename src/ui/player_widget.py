@@ -1,31 +1,55 @@
+import threading
 
 from PySide6.QtWidgets import QWidget, QVBoxLayout, QLabel, QHBoxLayout, QPushButton, QComboBox, QSlider
-from PySide6.QtCore import Qt, QPropertyAnimation, QEasingCurve
-from PySide6.QtGui import QIcon
-try:
-    import vlc
-    VLC_AVAILABLE = True
-except ImportError:
-    VLC_AVAILABLE = False
+from PySide6.QtCore import Qt, Signal
+from ..core.audio_cache import AudioCache
+from ..core.audio_server import LocalAudioServer
+from ..core.paths import data_path
+from ..core.playback import PlaybackWorker, load_vlc, STATE_PLAYING, STATE_ERROR
+from ..core.profiling import instrument
+from ..core.stations import StationManager
+from .animator import PanelAnimator
+from .assets import assets
+
 
 class PlayerWidget(QWidget):
     """
     Виджет для плеера.
     """
+    # Резервный канал, подключенный к следующей станции, и его настройки
+    WARM_STANDBY = True
+    NETWORK_CACHING = 1000  # Сетевой буфер VLC, мс
+    CROSSFADE = 0.4  # Кроссфейд при переключении станций, с
+
+    # Потоки станций идут через локальный сервер с дисковым кэшем
+    OFFLINE_CACHE = True
+
+    # Локальные фоновые шумы, работают без сети
+    NOISE_STATIONS = {
+        "Белый шум": "white",
+        "Розовый шум": "pink",
+        "Коричневый шум": "brown",
+    }
+
+    # Сигнал о завершении фоновой проверки станций
+    stations_probed = Signal()
+
     def __init__(self, parent=None):
         super().__init__(parent)
         self.setObjectName("playerPanel")
         self.setFixedHeight(0)
 
-        # Инициализация VLC
-        if VLC_AVAILABLE:
-            self.instance = vlc.Instance()
-            self.player = self.instance.media_player_new()
-            self.is_playing = False
-        else:
-            self.instance = None
-            self.player = None
-            self.is_playing = False
+        # Каталог станций с кэшем проверки доступности
+        self.stations = StationManager()
+        self._probing = False
+        self.stations_probed.connect(self._on_stations_probed)
+
+        # Рабочий поток воспроизведения создается при первом нажатии play
+        self.playback = None
+        self.is_playing = False
+
+        # Локальный сервер звука (кэш станций и шумы) запускается при первом воспроизведении
+        self.audio_server = None
 
         # Создаем layout
         layout = QVBoxLayout(self)
@@ -46,24 +70,18 @@ class PlayerWidget(QWidget):
         # Выбор радиостанции
         self.station_combo = QComboBox()
         self.station_combo.setObjectName("stationCombo")
-        self.station_combo.addItems([
-            "SomaFM N5MD",
-            "Smooth Jazz",
-            "Record FM",
-            "Europa Plus"
-        ])
+        self.station_combo.addItems(self.stations.names())
+        self.station_combo.addItems(list(self.NOISE_STATIONS))
         self.station_combo.setMinimumWidth(150)
+        self.station_combo.currentTextChanged.connect(self._on_station_changed)
         controls_layout.addWidget(self.station_combo)
         
         # Кнопка воспроизведения/паузы
         self.play_button = QPushButton()
         self.play_button.setObjectName("playButton")
         self.play_button.setFixedSize(50, 50)
-        try:
-            self.play_button.setIcon(QIcon("play.svg"))
-        except:
-            self.play_button.setText("▶")
         self.play_button.setIconSize(self.play_button.size() * 0.6)
+        self._set_play_icon(False)
         self.play_button.clicked.connect(self.toggle_playback)
         controls_layout.addWidget(self.play_button)
         
@@ -71,11 +89,12 @@ class PlayerWidget(QWidget):
         self.stop_button = QPushButton()
         self.stop_button.setObjectName("stopButton")
         self.stop_button.setFixedSize(50, 50)
-        try:
-            self.stop_button.setIcon(QIcon("stop.svg"))
-        except:
-            self.stop_button.setText("■")
         self.stop_button.setIconSize(self.stop_button.size() * 0.6)
+        icon = assets().icon("stop.svg", self.stop_button.iconSize(), self)
+        if icon.isNull():
+            self.stop_button.setText("■")
+        else:
+            self.stop_button.setIcon(icon)
         self.stop_button.clicked.connect(self.stop_playback)
         controls_layout.addWidget(self.stop_button)
         
@@ -100,90 +119,184 @@ class PlayerWidget(QWidget):
         # Флаг видимости плеера
         self.player_visible = False
 
+        self.probe_stations()
+
     def toggle_visibility(self):
         """Переключает видимость панели плеера с анимацией."""
+        self.player_visible = not self.player_visible
+        PanelAnimator.of(self).set_panel_visible(self, self.player_visible)
+
         if self.player_visible:
-            # Скрываем панель плеера
-            self.player_animation = QPropertyAnimation(self, b"maximumHeight")
-            self.player_animation.setDuration(300)
-            self.player_animation.setStartValue(200)
-            self.player_animation.setEndValue(0)
-            self.player_animation.setEasingCurve(QEasingCurve.InOutQuad)
-            self.player_animation.start()
-
-            self.player_visible = False
-        else:
-            # Показываем панель плеера
-            self.player_animation = QPropertyAnimation(self, b"maximumHeight")
-            self.player_animation.setDuration(300)
-            self.player_animation.setStartValue(0)
-            self.player_animation.setEndValue(200)
-            self.player_animation.setEasingCurve(QEasingCurve.InOutQuad)
-            self.player_animation.start()
-
-            self.player_visible = True
-            
+            # Обновляем устаревшие результаты проверки станций
+            self.probe_stations()
+
     def get_station_url(self, station_name):
         """Возвращает URL радиостанции по её названию."""
-        stations = {
-            "SomaFM N5MD": "https://ice6.somafm.com/n5md-128-mp3",
-            "Smooth Jazz": "http://jazz-wr04.ice.infomaniak.ch/jazz-wr04-128.mp3",
-            "Record FM": "https://radiorecord.hostingradio.ru/rr_main96.aacp",
-            "Europa Plus": "http://ep256.hostingradio.ru:8052/europaplus256.mp3"
-        }
-        return stations.get(station_name, "")
-        
+        if station_name in self.NOISE_STATIONS:
+            return self._ensure_audio_server().noise_url(self.NOISE_STATIONS[station_name])
+        url = self.stations.url(station_name)
+        if url and self.OFFLINE_CACHE:
+            return self._ensure_audio_server().station_url(station_name, url)
+        return url
+
+    def is_unavailable(self, station_name):
+        """Станция недоступна по сети и в кэше для нее ничего нет."""
+        if not self.stations.is_unreachable(station_name):
+            return False
+        return self.audio_server is None or not self.audio_server.has_cached(station_name)
+
+    def _ensure_audio_server(self):
+        """Создает локальный сервер звука с дисковым кэшем станций."""
+        if self.audio_server is None:
+            cache = None
+            if self.OFFLINE_CACHE:
+                try:
+                    cache = AudioCache(data_path("audio_cache"))
+                except OSError:
+                    cache = None
+            self.audio_server = LocalAudioServer(cache)
+        return self.audio_server
+
+    def probe_stations(self):
+        """Запускает проверку доступности станций в фоновом потоке."""
+        if self._probing:
+            return
+        self._probing = True
+        threading.Thread(target=self._probe_worker, name="station-probe", daemon=True).start()
+
+    def _probe_worker(self):
+        """Проверяет станции вне потока интерфейса."""
+        try:
+            self.stations.probe_all_blocking()
+        finally:
+            self.stations_probed.emit()
+
+    def _on_stations_probed(self):
+        """Упорядочивает список станций по результатам проверки."""
+        self._probing = False
+        current = self.station_combo.currentText()
+
+        self.station_combo.blockSignals(True)
+        self.station_combo.clear()
+        for name in self.stations.ordered():
+            self.station_combo.addItem(name)
+            if self.stations.is_unreachable(name):
+                self.station_combo.setItemData(self.station_combo.count() - 1, "Станция недоступна", Qt.ToolTipRole)
+        self.station_combo.addItems(list(self.NOISE_STATIONS))
+        self.station_combo.setCurrentText(current)
+        self.station_combo.blockSignals(False)
+
+    def _ensure_playback(self):
+        """Создает рабочий поток воспроизведения при первом обращении."""
+        if self.playback is None:
+            if load_vlc() is None:
+                return False
+            self.playback = PlaybackWorker(
+                warm_standby=self.WARM_STANDBY,
+                network_caching=self.NETWORK_CACHING,
+                crossfade=self.CROSSFADE,
+            )
+            self.playback.state_changed.connect(self._on_playback_state)
+            self.playback.error.connect(self._on_playback_error)
+            self.playback.set_volume(self.volume_slider.value())
+        return True
+
     def toggle_playback(self):
         """Переключает состояние воспроизведения."""
-        if not VLC_AVAILABLE or not self.player:
+        if not self._ensure_playback():
             self.status_label.setText("Библиотека VLC не установлена")
             return
-            
+
         if self.is_playing:
-            # Пауза
-            self.player.pause()
+            self.playback.pause()
             self.is_playing = False
-            try:
-                self.play_button.setIcon(QIcon("play.svg"))
-            except:
-                self.play_button.setText("▶")
+            self._set_play_icon(False)
             self.status_label.setText("Пауза")
         else:
-            # Воспроизведение
             station_name = self.station_combo.currentText()
             url = self.get_station_url(station_name)
-            
+
             if not url:
                 self.status_label.setText("Станция не найдена")
                 return
-                
-            media = self.instance.media_new(url)
-            # Добавляем заголовок User-Agent для решения проблемы с HTTP 403 Forbidden
-            media.add_option("http-user-agent=Mozilla/5.0")
-            self.player.set_media(media)
-            self.player.play()
+
+            if self.is_unavailable(station_name):
+                self.status_label.setText(f"Станция недоступна: {station_name}")
+                return
+
+            # Подключение к потоку идет в рабочем потоке, интерфейс не ждет
+            self.playback.play(url, station_name)
+            self._prepare_next(station_name)
             self.is_playing = True
-            
-            try:
-                self.play_button.setIcon(QIcon("pause.svg"))
-            except:
-                self.play_button.setText("⏸")
-            self.status_label.setText(f"Воспроизведение: {station_name}")
-            
+            self._set_play_icon(True)
+            self.status_label.setText(f"Подключение: {station_name}")
+
     def stop_playback(self):
         """Останавливает воспроизведение."""
-        if not VLC_AVAILABLE or not self.player:
+        if self.playback is None:
             return
-            
-        self.player.stop()
+
+        self.playback.stop()
         self.is_playing = False
-        try:
-            self.play_button.setIcon(QIcon("play.svg"))
-        except:
-            self.play_button.setText("▶")
+        self._set_play_icon(False)
         self.status_label.setText("Остановлено")
-        
+
     def set_volume(self, value):
         """Устанавливает громкость."""
-        if VLC_AVAILABLE and self.player:
-            self.player.audio_set_volume(value)
+        if self.playback is not None:
+            self.playback.set_volume(value)
+
+    def close_playback(self):
+        """Останавливает рабочий поток воспроизведения, локальный сервер звука и проверку станций."""
+        self.stations.close()
+        if self.playback is not None:
+            self.playback.close()
+            self.playback = None
+        if self.audio_server is not None:
+            self.audio_server.stop()
+            if self.audio_server.cache is not None:
+                self.audio_server.cache.close()
+            self.audio_server = None
+
+    def _on_station_changed(self, station_name):
+        """Во время воспроизведения сразу переключает станцию."""
+        if not self.is_playing or self.playback is None:
+            return
+        url = self.get_station_url(station_name)
+        if url and not self.is_unavailable(station_name):
+            self.playback.switch(url, station_name)
+            self._prepare_next(station_name)
+            self.status_label.setText(f"Подключение: {station_name}")
+
+    def _prepare_next(self, station_name):
+        """Подключает резервный канал к следующей доступной станции в списке."""
+        names = [self.station_combo.itemText(i) for i in range(self.station_combo.count())]
+        if station_name not in names:
+            return
+        start = names.index(station_name)
+        for offset in range(1, len(names)):
+            name = names[(start + offset) % len(names)]
+            if not self.is_unavailable(name):
+                self.playback.prepare(self.get_station_url(name), name)
+                return
+
+    def _on_playback_state(self, state, station_name):
+        """Отражает состояние рабочего потока в интерфейсе."""
+        if state == STATE_PLAYING:
+            self.status_label.setText(f"Воспроизведение: {station_name}")
+        elif state == STATE_ERROR:
+            self.is_playing = False
+            self._set_play_icon(False)
+
+    def _on_playback_error(self, message):
+        self.status_label.setText(f"Ошибка воспроизведения: {message}")
+
+    def _set_play_icon(self, playing):
+        icon = assets().icon("pause.svg" if playing else "play.svg", self.play_button.iconSize(), self)
+        if icon.isNull():
+            # Без иконок кнопка показывает символ
+            self.play_button.setText("⏸" if playing else "▶")
+        self.play_button.setIcon(icon)
+
+
+instrument(PlayerWidget, ("toggle_playback", "stop_playback"), prefix="_on_")
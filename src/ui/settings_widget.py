@@ -1,11 +1,17 @@
 from PySide6.QtWidgets import QWidget, QVBoxLayout, QLabel, QSlider
-from PySide6.QtCore import Qt, Signal, QPropertyAnimation, QEasingCurve
+from PySide6.QtCore import Qt, Signal, QTimer
+
+from .animator import PanelAnimator
 
 class SettingsWidget(QWidget):
     """
     Виджет для настроек таймера.
     """
-    # Сигнал для оповещения об изменении значения слайдера
+    # Через сколько мс после последнего шага колесом/клавишами применяется значение
+    APPLY_DELAY = 300
+
+    # Сигнал для оповещения об изменении значения слайдера; при перетаскивании
+    # испускается один раз, когда слайдер отпущен
     value_changed = Signal(int)
 
     def __init__(self, parent=None):
@@ -31,8 +37,15 @@ class SettingsWidget(QWidget):
         self.time_slider.setTickPosition(QSlider.TicksBelow)
         self.time_slider.setTickInterval(5)
         self.time_slider.valueChanged.connect(self._on_value_changed)
+        self.time_slider.sliderReleased.connect(self._apply_value)
         layout.addWidget(self.time_slider)
 
+        # Откладывает применение значения, пока пользователь меняет его
+        self.apply_timer = QTimer(self)
+        self.apply_timer.setSingleShot(True)
+        self.apply_timer.setInterval(self.APPLY_DELAY)
+        self.apply_timer.timeout.connect(self._apply_value)
+
         # Метка для отображения текущего значения
         self.time_value_label = QLabel("25 минут")
         self.time_value_label.setObjectName("timeValueLabel")
@@ -45,32 +58,22 @@ class SettingsWidget(QWidget):
     def _on_value_changed(self, value):
         """Обработчик изменения значения слайдера."""
         self.time_value_label.setText(f"{value} минут")
-        self.value_changed.emit(value)
+        if not self.time_slider.isSliderDown():
+            self.apply_timer.start()
+
+    def _apply_value(self):
+        """Сообщает итоговое значение слайдера."""
+        self.apply_timer.stop()
+        self.value_changed.emit(self.time_slider.value())
 
     def toggle_visibility(self):
         """Переключает видимость панели настроек с анимацией."""
-        if self.settings_visible:
-            # Скрываем панель настроек
-            self.settings_animation = QPropertyAnimation(self, b"maximumHeight")
-            self.settings_animation.setDuration(300)
-            self.settings_animation.setStartValue(200)
-            self.settings_animation.setEndValue(0)
-            self.settings_animation.setEasingCurve(QEasingCurve.InOutQuad)
-            self.settings_animation.start()
-
-            self.settings_visible = False
-        else:
-            # Показываем панель настроек
-            self.settings_animation = QPropertyAnimation(self, b"maximumHeight")
-            self.settings_animation.setDuration(300)
-            self.settings_animation.setStartValue(0)
-            self.settings_animation.setEndValue(200)
-            self.settings_animation.setEasingCurve(QEasingCurve.InOutQuad)
-            self.settings_animation.start()
-
-            self.settings_visible = True
+        self.settings_visible = not self.settings_visible
+        PanelAnimator.of(self).set_panel_visible(self, self.settings_visible)
 
     def set_value(self, value):
-        """Устанавливает значение слайдера."""
+        """Устанавливает значение слайдера, не сообщая о нем как об изменении."""
+        self.time_slider.blockSignals(True)
         self.time_slider.setValue(value)
+        self.time_slider.blockSignals(False)
         self.time_value_label.setText(f"{value} минут")
@@ -0,0 +1,81 @@
+from PySide6.QtWidgets import QWidget, QVBoxLayout, QLabel, QGridLayout
+from PySide6.QtCore import Qt
+
+from ..core import analytics
+from .animator import PanelAnimator
+
+
+def _format_duration(seconds):
+    """Форматирует секунды в строку вида '2 ч 05 мин'."""
+    minutes = int(seconds) // 60
+    hours, minutes = divmod(minutes, 60)
+    if hours:
+        return f"{hours} ч {minutes:02d} мин"
+    return f"{minutes} мин"
+
+
+class StatsWidget(QWidget):
+    """
+    Виджет со статистикой продуктивности по журналу сессий.
+    """
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.setObjectName("statsPanel")
+        self.setFixedHeight(0)
+
+        # Создаем layout
+        layout = QVBoxLayout(self)
+        layout.setContentsMargins(20, 20, 20, 20)
+
+        # Метка для заголовка
+        self.stats_label = QLabel("Статистика")
+        self.stats_label.setObjectName("statsLabel")
+        layout.addWidget(self.stats_label)
+
+        # Таблица показателей
+        grid = QGridLayout()
+        grid.setHorizontalSpacing(20)
+        self.value_labels = {}
+        rows = [
+            ("today", "Сегодня"),
+            ("week", "За неделю"),
+            ("streak", "Серия дней"),
+            ("completion", "Доведено до конца"),
+        ]
+        for row, (key, title) in enumerate(rows):
+            title_label = QLabel(title)
+            title_label.setObjectName("statsTitleLabel")
+            value_label = QLabel("—")
+            value_label.setObjectName("statsValueLabel")
+            value_label.setAlignment(Qt.AlignRight | Qt.AlignVCenter)
+            grid.addWidget(title_label, row, 0)
+            grid.addWidget(value_label, row, 1)
+            self.value_labels[key] = value_label
+        layout.addLayout(grid)
+
+        # Флаг видимости статистики
+        self.stats_visible = False
+
+        # Загрузчик журнала помнит проверенные записи между обновлениями
+        self._loader = None
+
+    def refresh(self, history_path):
+        """Пересчитывает показатели по файлу журнала сессий."""
+        if not analytics.NUMPY_AVAILABLE:
+            self.stats_label.setText("Статистика (установите numpy)")
+            return
+
+        if self._loader is None or self._loader.path != history_path:
+            self._loader = analytics.SessionLoader(history_path)
+        stats = self._loader.summary()
+        self.value_labels["today"].setText(_format_duration(stats["today"]))
+        self.value_labels["week"].setText(_format_duration(stats["week"]))
+        self.value_labels["streak"].setText(
+            f"{stats['current_streak']} (рекорд {stats['longest_streak']})"
+        )
+        self.value_labels["completion"].setText(f"{stats['completion_ratio']:.0%}")
+
+    def toggle_visibility(self):
+        """Переключает видимость панели статистики с анимацией."""
+        self.stats_visible = not self.stats_visible
+        PanelAnimator.of(self).set_panel_visible(self, self.stats_visible)
@@ -1,6 +1,7 @@
 from PySide6.QtWidgets import QWidget, QVBoxLayout, QHBoxLayout, QLabel, QPushButton
 from PySide6.QtCore import Qt, Signal
-from PySide6.QtGui import QIcon
+from .assets import assets
+from .digit_display import DigitDisplay
 
 class TimerWidget(QWidget):
     """
@@ -20,10 +21,10 @@ class TimerWidget(QWidget):
         layout.setContentsMargins(0, 0, 0, 0)
         layout.setSpacing(0)
 
-        # Таймер
-        self.timer_label = QLabel("25:00")
+        # Таймер: при смене секунды перерисовываются только изменившиеся цифры
+        self.timer_label = DigitDisplay("25:00")
         self.timer_label.setObjectName("timerLabel")
-        self.timer_label.setAlignment(Qt.AlignCenter)
+        self.timer_label.setContentsMargins(0, 10, 0, 30)  # Отступы как у margin в стилях
         layout.addWidget(self.timer_label)
 
         # Контейнер для кнопок
@@ -37,15 +38,9 @@ class TimerWidget(QWidget):
         self.reset_button.setObjectName("resetButton")
         self.reset_button.setFixedSize(60, 60)
         self.reset_button.setCursor(Qt.PointingHandCursor)
-        try:
-            self.reset_button.setIcon(QIcon("reset_icon.svg"))
-        except:
-            # Используем стандартную иконку, если файл не найден
-            from PySide6.QtGui import QPixmap
-            pixmap = QPixmap(16, 16)
-            pixmap.fill(Qt.green)
-            self.reset_button.setIcon(QIcon(pixmap))
         self.reset_button.setIconSize(self.reset_button.size() * 0.6)
+        # Если файла нет, ставится цветная заглушка
+        self.reset_button.setIcon(assets().icon("reset_icon.svg", self.reset_button.iconSize(), self, Qt.green))
         self.reset_button.clicked.connect(self.reset_clicked.emit)
         buttons_layout.addWidget(self.reset_button)
 
@@ -62,15 +57,9 @@ class TimerWidget(QWidget):
         self.settings_button.setObjectName("settingsButton")
         self.settings_button.setFixedSize(60, 60)
         self.settings_button.setCursor(Qt.PointingHandCursor)
-        try:
-            self.settings_button.setIcon(QIcon("settings_icon.svg"))
-        except:
-            # Используем стандартную иконку, если файл не найден
-            from PySide6.QtGui import QPixmap
-            pixmap = QPixmap(16, 16)
-            pixmap.fill(Qt.blue)
-            self.settings_button.setIcon(QIcon(pixmap))
         self.settings_button.setIconSize(self.settings_button.size() * 0.6)
+        # Если файла нет, ставится цветная заглушка
+        self.settings_button.setIcon(assets().icon("settings_icon.svg", self.settings_button.iconSize(), self, Qt.blue))
         self.settings_button.clicked.connect(self.settings_clicked.emit)
         buttons_layout.addWidget(self.settings_button)
 
@@ -79,15 +68,9 @@ class TimerWidget(QWidget):
         self.radio_button.setObjectName("radioButton")
         self.radio_button.setFixedSize(60, 60)
         self.radio_button.setCursor(Qt.PointingHandCursor)
-        try:
-            self.radio_button.setIcon(QIcon("radio.png"))
-        except:
-            # Используем стандартную иконку, если файл не найден
-            from PySide6.QtGui import QPixmap
-            pixmap = QPixmap(16, 16)
-            pixmap.fill(Qt.magenta)
-            self.radio_button.setIcon(QIcon(pixmap))
         self.radio_button.setIconSize(self.radio_button.size() * 0.6)
+        # Если файла нет, ставится цветная заглушка
+        self.radio_button.setIcon(assets().icon("radio.png", self.radio_button.iconSize(), self, Qt.magenta))
         self.radio_button.clicked.connect(self.radio_clicked.emit)
         buttons_layout.addWidget(self.radio_button)
 
@@ -102,21 +85,7 @@ class TimerWidget(QWidget):
         self.start_button.setText(text)
 
     def set_start_button_icon(self, icon_path=None):
-        """Устанавливает иконку на кнопке старта."""
-        try:
-            if icon_path:
-                self.start_button.setIcon(QIcon(icon_path))
-            else:
-                # Если путь не указан, используем стандартную иконку
-                from PySide6.QtGui import QPixmap
-                pixmap = QPixmap(16, 16)
-                pixmap.fill(Qt.yellow)
-                self.start_button.setIcon(QIcon(pixmap))
-        except:
-            # Используем стандартную иконку, если файл не найден
-            from PySide6.QtGui import QPixmap
-            pixmap = QPixmap(16, 16)
-            pixmap.fill(Qt.yellow)
-            self.start_button.setIcon(QIcon(pixmap))
-
+        """Устанавливает иконку на кнопке старта (без имени файла - заглушку)."""
         self.start_button.setIconSize(self.start_button.size() * 0.15)
+        icon = assets().icon(icon_path, self.start_button.iconSize(), self, Qt.yellow)
+        self.start_button.setIcon(icon)
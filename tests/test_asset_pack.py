@@ -0,0 +1,50 @@
+import os
+
+from src.core.asset_pack import AssetPack, pack_assets, stale_assets
+
+NAMES = ("play.svg", "radio.png")
+
+
+def make_pack(tmp_path):
+    (tmp_path / "play.svg").write_bytes(b"<svg>play</svg>")
+    (tmp_path / "radio.png").write_bytes(b"png")
+    path = str(tmp_path / "assets.pack")
+    pack_assets(path, str(tmp_path), NAMES)
+    return path
+
+
+def touch_later(path, than):
+    built = os.stat(than).st_mtime_ns
+    os.utime(path, ns=(built + 10**9, built + 10**9))
+
+
+def test_pack_serves_assets(tmp_path):
+    path = make_pack(tmp_path)
+    assert stale_assets(path, str(tmp_path), NAMES) == []
+
+    pack = AssetPack(path, str(tmp_path))
+    assert pack.packed
+    assert sorted(pack.names()) == sorted(NAMES)
+    assert pack.get("radio.png") == b"png"
+
+
+def test_edited_file_wins_over_pack(tmp_path):
+    path = make_pack(tmp_path)
+    (tmp_path / "play.svg").write_bytes(b"<svg>edited</svg>")
+    touch_later(tmp_path / "play.svg", path)
+
+    assert stale_assets(path, str(tmp_path), NAMES) == ["play.svg"]
+    pack = AssetPack(path, str(tmp_path))
+    assert pack.get("play.svg") == b"<svg>edited</svg>"
+    assert pack.get("radio.png") == b"png"
+
+
+def test_missing_pack_reads_loose_files(tmp_path):
+    path = str(tmp_path / "assets.pack")
+    (tmp_path / "play.svg").write_bytes(b"<svg>play</svg>")
+
+    assert stale_assets(path, str(tmp_path), NAMES) == ["play.svg"]
+    pack = AssetPack(path, str(tmp_path))
+    assert not pack.packed
+    assert pack.get("play.svg") == b"<svg>play</svg>"
+    assert pack.get("radio.png") is None
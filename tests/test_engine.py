@@ -0,0 +1,127 @@
+import math
+import random
+
+from src.core.engine import TimerEngine
+
+
+def make_engine(clock, work=25 * 60, rest=5 * 60):
+    engine = TimerEngine(work, rest, clock=clock)
+    log = []
+    engine.transition.connect(log.append)
+    return engine, log
+
+
+def run_until_idle(engine, clock, max_ticks=100000):
+    """Будит движок как драйвер, пока он не остановится."""
+    for _ in range(max_ticks):
+        delay = engine.next_tick_delay()
+        if delay is None:
+            return
+        clock.advance(delay)
+        engine.tick()
+    raise AssertionError("таймер не остановился")
+
+
+def test_start_pause_resume_keeps_remaining(clock):
+    engine, log = make_engine(clock)
+    engine.start()
+    clock.advance(100.25)
+    engine.pause()
+    assert engine.remaining() == 25 * 60 - 100.25
+
+    # Пока таймер стоит, время не идет
+    clock.advance(500)
+    assert engine.time_left == 25 * 60 - 100
+    assert engine.next_tick_delay() is None
+
+    engine.start()
+    clock.advance(0.25)
+    assert engine.remaining() == 25 * 60 - 100.5
+    assert log == ["start", "pause", "start"]
+
+
+def test_repeated_start_and_pause_are_ignored(clock):
+    engine, log = make_engine(clock)
+    engine.pause()
+    engine.start()
+    engine.start()
+    engine.pause()
+    engine.pause()
+    assert log == ["start", "pause"]
+
+
+def test_finish_switches_to_break(clock):
+    engine, log = make_engine(clock, work=60, rest=30)
+    modes, finished = [], []
+    engine.mode_changed.connect(modes.append)
+    engine.timer_finished.connect(lambda: finished.append(clock.now))
+
+    engine.start()
+    run_until_idle(engine, clock)
+
+    assert finished == [1060.0]
+    assert modes == [False]
+    assert not engine.is_running and not engine.is_work_mode
+    assert engine.time_left == 30
+    assert log == ["start", "finish", "switch_mode"]
+
+
+def test_reset_and_switch_mode(clock):
+    engine, log = make_engine(clock, work=60, rest=30)
+    engine.start()
+    clock.advance(10)
+    engine.reset()
+    assert not engine.is_running and engine.time_left == 60
+
+    engine.switch_mode()
+    assert not engine.is_work_mode and engine.time_left == 30
+    engine.switch_mode()
+    assert engine.is_work_mode and engine.time_left == 60
+    assert log == ["start", "reset", "switch_mode", "switch_mode"]
+
+
+def test_set_work_time_moves_running_deadline(clock):
+    engine, log = make_engine(clock)
+    engine.start()
+    clock.advance(30)
+    engine.set_work_time(10)
+    assert engine.deadline == clock.now + 600
+
+    # Длительность отдыха на текущий режим не влияет
+    engine.set_break_time(1)
+    assert engine.deadline == clock.now + 600
+    assert engine.BREAK_TIME == 60
+    assert log == ["start", "set_work_time", "set_break_time"]
+
+
+def test_no_drift_with_late_wakeups_and_stalls(clock):
+    engine, _ = make_engine(clock)
+    engine.start()
+    started = clock.now
+    rng = random.Random(1)
+
+    while engine.is_running:
+        # Драйвер просыпается с джиттером, иногда цикл событий стоит минутами
+        if rng.random() < 0.01:
+            clock.advance(rng.uniform(5.0, 120.0))
+        else:
+            clock.advance(engine.next_tick_delay() + rng.uniform(0.0, 0.05))
+        engine.tick()
+        if engine.is_running:
+            # Показанное время считается от старта, а не копится по тикам
+            assert engine.time_left == math.ceil(25 * 60 - (clock.now - started))
+            assert engine.display_lag == 0
+
+    assert clock.now - started >= 25 * 60
+    assert not engine.is_work_mode
+
+
+def test_apply_state_emits_matching_transitions(clock):
+    engine, log = make_engine(clock)
+    engine.apply_state(True, True, 100.0)
+    engine.apply_state(True, True, 90.0)
+    engine.apply_state(True, False, 80.0)
+    engine.apply_state(False, True, 50.0, work_time=600, break_time=120)
+    assert log == ["start", "sync", "pause", "switch_mode", "start"]
+    assert engine.deadline == clock.now + 50.0
+    assert (engine.WORK_TIME, engine.BREAK_TIME) == (600, 120)
@@ -0,0 +1,124 @@
+import os
+
+import pytest
+
+from src.core.engine import TimerEngine
+from src.core.journal import (
+    HEADER, KIND_CODES, RECORD_SIZE, Event, TimerJournal, TimerState, restore,
+)
+
+
+def open_journal(path, **kwargs):
+    return TimerJournal(str(path), wall_clock=lambda: 5000.0, **kwargs)
+
+
+def test_recover_replays_engine_transitions(tmp_path, clock):
+    path = tmp_path / "timer.journal"
+    journal = open_journal(path)
+    engine = TimerEngine(clock=clock)
+    journal.attach(engine)
+    engine.set_work_time(50)
+    engine.start()
+    clock.advance(60)
+    engine.pause()
+    journal.close()
+
+    state = open_journal(path).recover()
+    assert state.work_time == 50 * 60
+    assert state.is_work_mode and not state.is_running
+    assert state.remaining == 50 * 60 - 60
+
+
+def test_torn_tail_is_dropped(tmp_path):
+    path = tmp_path / "timer.journal"
+    journal = open_journal(path)
+    journal.append(Event(100.0, KIND_CODES["start"], 0, 1500.0))
+    journal.append(Event(200.0, KIND_CODES["pause"], 0, 1400.0))
+    journal.close()
+
+    # Сбой посреди записи третьего события
+    with open(path, "ab") as f:
+        f.write(b"\x01" * (RECORD_SIZE // 2))
+
+    journal = open_journal(path)
+    assert len(journal) == 2
+    assert os.path.getsize(path) == HEADER.size + 2 * RECORD_SIZE
+    assert journal.recover().remaining == 1400.0
+
+    # Новые события пишутся сразу за целыми
+    journal.append(Event(300.0, KIND_CODES["start"], 0, 1400.0))
+    journal.close()
+    assert len(open_journal(path).read()) == 3
+
+
+def test_corrupt_last_record_is_dropped(tmp_path):
+    path = tmp_path / "timer.journal"
+    journal = open_journal(path)
+    journal.append(Event(100.0, KIND_CODES["start"], 0, 1500.0))
+    journal.append(Event(200.0, KIND_CODES["pause"], 0, 1400.0))
+    journal.close()
+
+    # Запись целиком на месте, но контрольная сумма не сходится
+    with open(path, "r+b") as f:
+        f.seek(HEADER.size + RECORD_SIZE + 1)
+        f.write(b"\xff")
+
+    state = open_journal(path).recover()
+    assert state.is_running and state.deadline == 1600.0
+
+
+def test_snapshot_limits_replay(tmp_path):
+    path = tmp_path / "timer.journal"
+    journal = open_journal(path, snapshot_every=10)
+    for i in range(25):
+        journal.append(Event(float(i), KIND_CODES["pause"], 0, float(i)))
+    journal.close()
+
+    journal = open_journal(path, snapshot_every=10)
+    assert journal.replayed == 0
+    assert journal.recover().remaining == 24.0
+
+    # Без снимка журнал повторяется целиком
+    os.remove(journal.snapshot_path)
+    journal = open_journal(path, snapshot_every=10)
+    assert journal.replayed == 25
+    assert journal.recover().remaining == 24.0
+
+
+def test_unknown_format_is_rejected(tmp_path):
+    path = tmp_path / "timer.journal"
+    path.write_bytes(b"XXXX" + bytes(HEADER.size))
+    with pytest.raises(ValueError):
+        open_journal(path)
+
+
+def test_restore_running_timer(clock):
+    engine = TimerEngine(clock=clock)
+    state = TimerState(1500, 300, True, True, 1500.0, 2000.0)
+    restore(engine, state, now=1500.0)
+    assert engine.is_running and engine.is_work_mode
+    assert engine.remaining() == 500.0
+
+
+def test_restore_expired_deadline_starts_next_mode(clock):
+    engine = TimerEngine(clock=clock)
+    # Работа закончилась, пока приложение было закрыто
+    state = TimerState(1500, 300, True, True, 1500.0, 2000.0)
+    restore(engine, state, now=2600.0)
+    assert not engine.is_running
+    assert not engine.is_work_mode
+    assert engine.time_left == 300
+
+    # То же для отдыха: следующим идет рабочий режим
+    engine = TimerEngine(clock=clock)
+    restore(engine, TimerState(1500, 300, False, True, 300.0, 2000.0), now=2000.0)
+    assert not engine.is_running
+    assert engine.is_work_mode
+    assert engine.time_left == 1500
+
+
+def test_restore_paused_timer_ignores_time(clock):
+    engine = TimerEngine(clock=clock)
+    restore(engine, TimerState(1500, 300, True, False, 700.0, None), now=1e12)
+    assert not engine.is_running
+    assert engine.time_left == 700
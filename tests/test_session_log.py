@@ -0,0 +1,72 @@
+import os
+
+from src.core.history.log import (
+    FLAG_COMPLETED, HEADER, MODE_WORK, RECORD_SIZE, Session, SessionLog,
+)
+
+DAY = 24 * 60 * 60
+
+
+def session(start, actual=1500):
+    return Session(start, start + actual, MODE_WORK, 1500, actual, 0, FLAG_COMPLETED)
+
+
+def write_sessions(path, count, start=1.7e9):
+    with SessionLog(str(path)) as log:
+        for i in range(count):
+            log.append(session(start + i * DAY))
+
+
+def test_torn_tail_is_dropped(tmp_path):
+    path = tmp_path / "history.log"
+    write_sessions(path, 3)
+    with open(path, "ab") as f:
+        f.write(b"\x01" * 10)
+
+    with SessionLog(str(path)) as log:
+        assert len(log) == 3
+        assert os.path.getsize(path) == HEADER.size + 3 * RECORD_SIZE
+        log.append(session(1.8e9))
+        assert [s.start for s in log.read()][-1] == 1.8e9
+
+
+def test_corrupt_tail_records_are_dropped(tmp_path):
+    path = tmp_path / "history.log"
+    write_sessions(path, 3)
+    with open(path, "r+b") as f:
+        f.seek(HEADER.size + 2 * RECORD_SIZE)
+        f.write(b"\xff\xff")
+
+    with SessionLog(str(path)) as log:
+        assert len(log) == 2
+
+
+def test_corrupt_middle_record_is_skipped(tmp_path):
+    path = tmp_path / "history.log"
+    write_sessions(path, 3, start=1.7e9)
+    with open(path, "r+b") as f:
+        f.seek(HEADER.size + RECORD_SIZE + 3)
+        f.write(b"\xff")
+
+    with SessionLog(str(path)) as log:
+        assert len(log) == 3
+        assert [s.start for s in log.read()] == [1.7e9, 1.7e9 + 2 * DAY]
+
+
+def test_append_reaches_file_before_sync(tmp_path):
+    path = tmp_path / "history.log"
+    log = SessionLog(str(path), sync_every=1000, sync_interval=1000.0)
+    log.append(session(1.7e9))
+    # Падение процесса не теряет сессию: запись уже в ОС
+    assert os.path.getsize(path) == HEADER.size + RECORD_SIZE
+    log.close()
+
+
+def test_lost_index_is_rebuilt(tmp_path):
+    path = tmp_path / "history.log"
+    write_sessions(path, 10)
+    os.remove(str(path) + ".idx")
+
+    with SessionLog(str(path)) as log:
+        week = list(log.sessions(1.7e9 + 2 * DAY, 1.7e9 + 9 * DAY))
+        assert [s.start for s in week] == [1.7e9 + i * DAY for i in range(2, 9)]